@@ -0,0 +1,63 @@
+import threading
+
+from config.constant import EventConstant, ExportItemConstant, ExportItemTypeConstant, TransactionConstant
+
+ITEM_TYPE_ORDER = {
+    ExportItemTypeConstant.block: 0,
+    ExportItemTypeConstant.transaction: 1,
+    # transfers and events are both logs, ordered together by log index
+    ExportItemTypeConstant.token_transfer: 2,
+    ExportItemTypeConstant.event: 2,
+    ExportItemTypeConstant.token: 3,
+}
+
+
+class BlockOrderedItemExporter:
+    """Collects the items exported concurrently by several jobs and exports them later in block order.
+
+    Within a block, the block comes first, then its transactions by index, then its logs by log index,
+    so wallet updates are applied in the order they happened on chain.
+    """
+
+    def __init__(self):
+        self.items = []
+        self._lock = threading.Lock()
+
+    def open(self):
+        pass
+
+    def export_items(self, items):
+        for item in items:
+            self.export_item(item)
+
+    def export_item(self, item):
+        with self._lock:
+            self.items.append(item)
+
+    def close(self):
+        pass
+
+    def export_to(self, item_exporter):
+        with self._lock:
+            items = sorted(self.items, key=get_block_order_key)
+            self.items = []
+        for item in items:
+            item_exporter.export_item(item)
+        return len(items)
+
+
+def get_block_order_key(item):
+    item_type = item.get(ExportItemConstant.type)
+    if item_type == ExportItemTypeConstant.block:
+        block_number = item.get('number')
+    else:
+        block_number = item.get(TransactionConstant.block_number)
+    if item_type == ExportItemTypeConstant.transaction:
+        index = item.get('transaction_index')
+    else:
+        index = item.get(EventConstant.log_index)
+
+    # items without a block, like tokens, go last
+    block_order = int(block_number) if block_number is not None else float('inf')
+    index_order = int(index) if index is not None else -1
+    return block_order, ITEM_TYPE_ORDER.get(item_type, len(ITEM_TYPE_ORDER)), index_order
@@ -0,0 +1,44 @@
+import threading
+
+from config.constant import ExportItemConstant, ExportItemTypeConstant
+
+
+class BlockRecordingItemExporter:
+    """Passes the items to an item exporter and keeps the (number, hash, parent_hash) of the blocks among them"""
+
+    def __init__(self, item_exporter):
+        self.item_exporter = item_exporter
+        self._blocks = []
+        self._lock = threading.Lock()
+
+    def open(self):
+        self.item_exporter.open()
+
+    def set_partition_dir(self, partition_dir):
+        if hasattr(self.item_exporter, 'set_partition_dir'):
+            self.item_exporter.set_partition_dir(partition_dir)
+
+    def export_items(self, items):
+        for item in items:
+            self.export_item(item)
+
+    def export_item(self, item):
+        if item.get(ExportItemConstant.type) == ExportItemTypeConstant.block:
+            # recorded before the item exporter, which may change the item
+            block = (item.get('number'), item.get('hash'), item.get('parent_hash'))
+            with self._lock:
+                self._blocks.append(block)
+        self.item_exporter.export_item(item)
+
+    def close(self):
+        self.item_exporter.close()
+
+    def finish(self):
+        if hasattr(self.item_exporter, 'finish'):
+            self.item_exporter.finish()
+
+    def pop_blocks(self):
+        """The blocks recorded since the previous call"""
+        with self._lock:
+            blocks, self._blocks = self._blocks, []
+            return blocks
@@ -0,0 +1,178 @@
+import logging
+import threading
+import time
+
+import bson
+from pymongo import InsertOne, ReplaceOne, UpdateOne
+from pymongo.errors import BulkWriteError
+
+from config.constant import LoggerConstant
+from services.metrics_service import MONGO_OPERATIONS, MONGO_SECONDS
+from utils.process_limits import MONGO, process_limit
+
+logger = logging.getLogger(LoggerConstant.MongoBulkWriter)
+
+DUPLICATE_KEY_ERROR = 11000
+
+
+class MongoBulkWriter(object):
+    """Buffers write operations per collection and flushes them as unordered bulk writes.
+
+    Inserts are queued as they come. Upserts are keyed by their filter and coalesced so only the latest
+    document per key is written, which keeps unordered flushes safe for documents updated many times.
+    Buffered operations are flushed by a daemon thread once they waited flush_interval_seconds, even when
+    nothing more is written.
+    """
+
+    def __init__(self, max_operations=1000, max_bytes=8 * 1024 * 1024, flush_interval_seconds=5):
+        self.max_operations = max_operations
+        self.max_bytes = max_bytes
+        self.flush_interval_seconds = flush_interval_seconds
+
+        self._lock = threading.RLock()
+        self._collections = {}
+        self._inserts = {}
+        self._upserts = {}
+        self._pending_operations = 0
+        self._pending_bytes = 0
+        self._last_flush_time = time.time()
+        self._timer = None
+
+    def insert(self, collection, document):
+        with self._lock:
+            self._collections[collection.name] = collection
+            self._inserts.setdefault(collection.name, []).append(document)
+            self._track(document)
+            self._flush_if_needed()
+
+    def replace(self, collection, key, document):
+        self._upsert(collection, key, document, replace=True)
+
+    def update(self, collection, key, document):
+        self._upsert(collection, key, document, replace=False)
+
+    def get_pending(self, collection, key):
+        """Returns the document waiting to be upserted for key, or None if nothing is buffered"""
+        with self._lock:
+            pending = self._upserts.get(collection.name, {}).get(_key_id(key))
+            if pending is None:
+                return None
+            return pending[1]
+
+    def flush(self):
+        """Writes the buffered operations, those that failed stay queued for the next flush and the error is raised"""
+        with self._lock:
+            if self._pending_operations == 0:
+                self._last_flush_time = time.time()
+                return
+
+            start = time.time()
+            operations = self._pending_operations
+            try:
+                for name, collection in self._collections.items():
+                    self._flush_collection(name, collection)
+            except Exception:
+                self._count_pending()
+                raise
+            finally:
+                self._last_flush_time = time.time()
+            self._pending_operations = 0
+            self._pending_bytes = 0
+
+            logger.debug(f"Flushed {operations} operations in {time.time() - start}s")
+
+    def close(self):
+        self.flush()
+
+    def _upsert(self, collection, key, document, replace):
+        with self._lock:
+            self._collections[collection.name] = collection
+            upserts = self._upserts.setdefault(collection.name, {})
+            key_id = _key_id(key)
+            pending = upserts.get(key_id)
+            if pending is None:
+                upserts[key_id] = (key, document, replace)
+                self._track(document)
+            elif replace:
+                upserts[key_id] = (key, document, True)
+            else:
+                # a $set on top of a queued write is folded into the queued document
+                merged = dict(pending[1])
+                merged.update(document)
+                upserts[key_id] = (key, merged, pending[2])
+            self._flush_if_needed()
+
+    def _flush_collection(self, name, collection):
+        inserts = self._inserts.pop(name, [])
+        upserts = self._upserts.pop(name, {})
+        requests = [InsertOne(document) for document in inserts]
+        key_ids = list(upserts)
+        for key_id in key_ids:
+            key, document, replace = upserts[key_id]
+            if replace:
+                requests.append(ReplaceOne(key, document, upsert=True))
+            else:
+                requests.append(UpdateOne(key, {"$set": document}, upsert=True))
+        if not requests:
+            return
+        try:
+            with process_limit(MONGO):
+                write_start = time.time()
+                collection.bulk_write(requests, ordered=False)
+        except BulkWriteError as e:
+            write_errors = e.details.get('writeErrors') or []
+            logger.error(f"Bulk write failed: {write_errors}")
+            # an insert that hits a duplicate key was written by an earlier flush that failed afterwards
+            failed = {error['index'] for error in write_errors
+                      if not (error['index'] < len(inserts) and error.get('code') == DUPLICATE_KEY_ERROR)}
+            self._requeue(name, [inserts[index] for index in sorted(failed) if index < len(inserts)],
+                          {key_ids[index - len(inserts)]: upserts[key_ids[index - len(inserts)]]
+                           for index in sorted(failed) if index >= len(inserts)})
+            raise
+        except Exception:
+            # nothing is known to have been written
+            self._requeue(name, inserts, upserts)
+            raise
+        MONGO_SECONDS.labels('bulk_write', name).observe(time.time() - write_start)
+        MONGO_OPERATIONS.labels(name).inc(len(requests))
+
+    def _requeue(self, name, inserts, upserts):
+        if inserts:
+            self._inserts[name] = inserts
+        if upserts:
+            self._upserts[name] = upserts
+
+    def _count_pending(self):
+        documents = [document for inserts in self._inserts.values() for document in inserts]
+        documents.extend(document for upserts in self._upserts.values() for _, document, _ in upserts.values())
+        self._pending_operations = len(documents)
+        self._pending_bytes = sum(len(bson.BSON.encode(document)) for document in documents)
+
+    def _track(self, document):
+        self._pending_operations += 1
+        self._pending_bytes += len(bson.BSON.encode(document))
+        if self._timer is None and self.flush_interval_seconds > 0:
+            self._timer = threading.Thread(target=self._flush_on_time, name='MongoBulkWriter', daemon=True)
+            self._timer.start()
+
+    def _flush_on_time(self):
+        while True:
+            with self._lock:
+                seconds_to_flush = self._last_flush_time + self.flush_interval_seconds - time.time()
+            if seconds_to_flush > 0:
+                time.sleep(seconds_to_flush)
+                continue
+            try:
+                self.flush()
+            except Exception as e:
+                logger.warning(f"Flushing on time failed, the operations stay queued: {e!r}")
+
+    def _flush_if_needed(self):
+        if self._pending_operations >= self.max_operations \
+                or self._pending_bytes >= self.max_bytes \
+                or time.time() - self._last_flush_time >= self.flush_interval_seconds:
+            self.flush()
+
+
+def _key_id(key):
+    return tuple(sorted(key.items()))
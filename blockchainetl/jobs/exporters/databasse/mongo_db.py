@@ -1,11 +1,16 @@
+import copy
 import logging
 import time
 
-from pymongo import MongoClient
+from pymongo import MongoClient, ReplaceOne, UpdateOne
 
-from config.config import MongoDBConfig
-from config.constant import MongoIndexConstant, TestPerformanceConstant
-from data_storage.memory_storage_test_performance import MemoryStoragePerformance
+from blockchainetl.jobs.exporters.databasse.mongo_bulk_writer import MongoBulkWriter
+from config.config import MongoDBConfig, MongoBulkWriteConfig
+from config.constant import EventConstant, EventsLayoutConstant, MongoIndexConstant, TokenConstant, \
+    TokenTypeConstant, TransactionConstant, WalletConstant
+from services.metrics_service import MONGO_OPERATIONS, MONGO_SECONDS
+from utils.boolean_utils import to_bool
+from utils.process_limits import MONGO, process_limit
 
 logger = logging.getLogger("Database")
 
@@ -14,7 +19,7 @@ class Database(object):
     """Manages connection to  database and makes async queries
     """
 
-    def __init__(self):
+    def __init__(self, bulk_write=None, events_layout=None):
         self._conn = None
         url = f"mongodb://{MongoDBConfig.NAME}:{MongoDBConfig.PASSWORD}@{MongoDBConfig.HOST}:{MongoDBConfig.PORT}"
         self.mongo = MongoClient(url)
@@ -24,9 +29,20 @@ class Database(object):
         self.mongo_wallet = self.mongo_db[MongoDBConfig.WALLET]
         self.mongo_tokens = self.mongo_db[MongoDBConfig.TOKENS]
         self.mongo_blocks = self.mongo_db[MongoDBConfig.BLOCKS]
+        self.mongo_events = self.mongo_db[MongoDBConfig.EVENTS]
         self.mongo_token_collection_dict = {}
+        self.events_layout = events_layout or MongoDBConfig.EVENTS_LAYOUT
+        # set by create_rollback_indexes
+        self.rollback_indexes = False
 
-        self.local_storage = MemoryStoragePerformance.getInstance()
+        if bulk_write is None:
+            bulk_write = to_bool(MongoBulkWriteConfig.BULK_WRITE)
+        self.bulk_writer = None
+        if bulk_write:
+            self.bulk_writer = MongoBulkWriter(max_operations=int(MongoBulkWriteConfig.MAX_OPERATIONS),
+                                               max_bytes=int(MongoBulkWriteConfig.MAX_BYTES),
+                                               flush_interval_seconds=float(
+                                                   MongoBulkWriteConfig.FLUSH_INTERVAL_SECONDS))
 
         self._create_index()
 
@@ -41,84 +57,269 @@ class Database(object):
                                                           name=MongoIndexConstant.transfer_block_number)
         if MongoIndexConstant.wallet_address not in self.mongo_wallet.index_information():
             self.mongo_wallet.create_index([("address", "hashed")], name=MongoIndexConstant.wallet_address)
+        if self.events_layout == EventsLayoutConstant.single:
+            create_events_indexes(self.mongo_events)
         # self.mongo_pool.create_index([("address", "hashed")])
 
+    def flush(self):
+        if self.bulk_writer:
+            self.bulk_writer.flush()
+
     def update_block(self, block):
-        c_time = self.local_storage.get(TestPerformanceConstant.write_mongo_time)
+        if self.bulk_writer:
+            self.bulk_writer.insert(self.mongo_blocks, block)
+            return
         start = time.time()
         self.mongo_blocks.insert_one(block)
-        self.local_storage.set(TestPerformanceConstant.write_mongo_time, c_time + time.time() - start)
+        _observe_write('insert_one', self.mongo_blocks, start)
 
     def update_transaction(self, tx):
-        c_time = self.local_storage.get(TestPerformanceConstant.write_mongo_time)
+        if self.bulk_writer:
+            self.bulk_writer.insert(self.mongo_transactions, tx)
+            return
         start = time.time()
         self.mongo_transactions.insert_one(tx)
-        self.local_storage.set(TestPerformanceConstant.write_mongo_time, c_time + time.time() - start)
+        _observe_write('insert_one', self.mongo_transactions, start)
 
     def update_transaction_transfer(self, tx):
-        c_time = self.local_storage.get(TestPerformanceConstant.write_mongo_time)
+        if self.bulk_writer:
+            self.bulk_writer.insert(self.mongo_transactions_transfer, tx)
+            return
         start = time.time()
         self.mongo_transactions_transfer.insert_one(tx)
-        self.local_storage.set(TestPerformanceConstant.write_mongo_time, c_time + time.time() - start)
+        _observe_write('insert_one', self.mongo_transactions_transfer, start)
 
     def update_wallet(self, wallet):
         key = {'address': wallet['address']}
+        if self.bulk_writer:
+            self.bulk_writer.update(self.mongo_wallet, key, wallet)
+            return
         data = {"$set": wallet}
-        c_time = self.local_storage.get(TestPerformanceConstant.write_mongo_time)
         start = time.time()
         self.mongo_wallet.update_one(key, data, upsert=True)
-        self.local_storage.set(TestPerformanceConstant.write_mongo_time, c_time + time.time() - start)
+        _observe_write('update_one', self.mongo_wallet, start)
 
     def replace_wallet(self, wallet):
+        if self.bulk_writer:
+            self.bulk_writer.replace(self.mongo_wallet, {'address': wallet['address']}, wallet)
+            return
         # stat_time = time.time()
-        c_time = self.local_storage.get(TestPerformanceConstant.write_mongo_time)
         start = time.time()
         key = {'address': wallet['address']}
         data = {"$set": wallet}
 
         self.mongo_wallet.replace_one(key, wallet, upsert=False)
 
-        self.local_storage.set(TestPerformanceConstant.write_mongo_time, c_time + time.time() - start)
+        _observe_write('replace_one', self.mongo_wallet, start)
         # logger.debug(f"Wallet size {sys.getsizeof(wallet)}")
         # logger.debug(f"time to update wallet {time.time() - stat_time}")
 
-    def get_wallet(self, address):
-        c_time = self.local_storage.get(TestPerformanceConstant.read_mongo_time)
+    def replace_wallets(self, wallets):
+        if not wallets:
+            return
+        if self.bulk_writer:
+            for wallet in wallets:
+                self.bulk_writer.replace(self.mongo_wallet, {'address': wallet['address']}, wallet)
+            return
+        requests = [ReplaceOne({'address': wallet['address']}, wallet, upsert=True) for wallet in wallets]
+        with process_limit(MONGO):
+            start = time.time()
+            self.mongo_wallet.bulk_write(requests, ordered=False)
+        _observe_write('bulk_write', self.mongo_wallet, start, len(requests))
+
+    def find_wallet(self, address):
+        if self.bulk_writer:
+            wallet = self.bulk_writer.get_pending(self.mongo_wallet, {"address": address})
+            if wallet is not None:
+                return copy.deepcopy(wallet)
         start = time.time()
+        wallet = self.mongo_wallet.find_one({"address": address})
+        _observe('find_one', self.mongo_wallet, start)
+        return wallet
+
+    def get_wallet(self, address):
         key = {"address": address}
+        if self.bulk_writer:
+            # a buffered wallet is newer than the one in mongo
+            wallet = self.bulk_writer.get_pending(self.mongo_wallet, key)
+            if wallet is not None:
+                return copy.deepcopy(wallet)
+        start = time.time()
         wallet = self.mongo_wallet.find_one(key)
+        _observe('find_one', self.mongo_wallet, start)
         if not wallet:
             wallet = {
                 "address": address,
             }
             self.update_wallet(wallet)
         # logger.debug(f"Time to get wallet {time.time() - start_time}")
-        self.local_storage.set(TestPerformanceConstant.read_mongo_time, c_time + time.time() - start)
         return wallet
 
     def insert_to_token_collection(self, token_address, event):
-        c_time = self.local_storage.get(TestPerformanceConstant.write_mongo_time)
+        if self.events_layout == EventsLayoutConstant.single:
+            collection = self.mongo_events
+            event.setdefault(TokenConstant.contract_address, token_address)
+        else:
+            collection = self.get_token_collection(token_address)
+
+        if self.bulk_writer:
+            self.bulk_writer.insert(collection, event)
+            return
         start = time.time()
+        collection.insert_one(event)
+        _observe_write('insert_one', collection, start)
+
+    def get_token_collection(self, token_address):
         if not self.mongo_token_collection_dict.get(token_address):
             self.mongo_token_collection_dict[token_address] = self.mongo_db[token_address]
-            self.mongo_token_collection_dict[token_address].create_index([("transaction_hash", "hashed")])
-            self.mongo_token_collection_dict[token_address].create_index([("block_number", "hashed")])
+            create_token_collection_indexes(self.mongo_token_collection_dict[token_address])
+            if self.rollback_indexes:
+                create_block_range_index(self.mongo_token_collection_dict[token_address],
+                                         TransactionConstant.block_number)
+        return self.mongo_token_collection_dict[token_address]
 
-        self.mongo_token_collection_dict[token_address].insert_one(event)
-        self.local_storage.set(TestPerformanceConstant.write_mongo_time, c_time + time.time() - start)
+    def get_token_collection_names(self):
+        """Collections of the per_contract layout"""
+        return self.mongo_db.list_collection_names(filter={'name': {'$regex': '^0x'}})
 
     def update_token(self, token):
-        c_time = self.local_storage.get(TestPerformanceConstant.write_mongo_time)
-        start = time.time()
         key = {'address': token['address']}
+        if self.bulk_writer:
+            self.bulk_writer.update(self.mongo_tokens, key, token)
+            return
+        start = time.time()
         data = {"$set": token}
 
         res = self.mongo_tokens.update_one(key, data, upsert=True)
-        self.local_storage.set(TestPerformanceConstant.write_mongo_time, c_time + time.time() - start)
+        _observe_write('update_one', self.mongo_tokens, start)
 
     def get_all_wallet(self):
-        # c_time = self.local_storage.get(TestPerformanceConstant.read_mongo_time)
-        # start = time.time()
         result = self.mongo_wallet.find({}).limit(100000)
-        # self.local_storage.set(TestPerformanceConstant.read_mongo_time, c_time + time.time() - start)
         return result
+
+    def get_all_wallet_addresses(self):
+        for wallet in self.mongo_wallet.find({}, {WalletConstant.address: 1, '_id': 0}):
+            yield wallet.get(WalletConstant.address)
+
+    def create_rollback_indexes(self):
+        """Ranged block number indexes on every collection a rollback deletes from, hashed ones can't serve ranges.
+
+        Built once for the existing collections of contracts, and for the new ones as they are created.
+        """
+        self.rollback_indexes = True
+        for collection, field in [(self.mongo_blocks, 'number'), (self.mongo_transactions, 'block_number'),
+                                  (self.mongo_transactions_transfer, 'block_number')]:
+            create_block_range_index(collection, field)
+        names = self.get_token_collection_names()
+        logger.info(f"Creating the block range indexes of {len(names)} contract collections")
+        for name in names:
+            create_block_range_index(self.mongo_db[name], TransactionConstant.block_number)
+
+    def rollback_blocks(self, start_block, end_block, read_wallet_states=None):
+        """Deletes what was written for the blocks of the range and sets their wallets back to before the range.
+
+        The balances, supplies and borrows the range changed are read again at the block before it with
+        read_wallet_states(balance_keys, lending_keys, block_number), which returns the balances by
+        (address, unit token) and the (supply, borrow) by (address, unit token, contract address), None where
+        unknown. Without it, or where they are unknown, they are removed: a wrong balance is worse than none.
+        Pending bulk writes have to be flushed first.
+        """
+        block_range = {TransactionConstant.block_number: {'$gte': start_block, '$lte': end_block}}
+        token_collections = [self.mongo_db[name] for name in self.get_token_collection_names()]
+        if self.events_layout == EventsLayoutConstant.single:
+            token_collections.append(self.mongo_events)
+
+        balance_keys = set()
+        lending_keys = set()
+        sources = [(self.mongo_transactions_transfer, TokenConstant.native_token)]
+        sources += [(collection, collection.name) for collection in token_collections]
+        for collection, default_unit_token in sources:
+            start = time.time()
+            for document in collection.find(block_range, {TransactionConstant.wallets: 1, TokenConstant.type: 1,
+                                                          TokenConstant.contract_address: 1}):
+                # the events collection holds the events of every contract
+                contract_address = document.get(TokenConstant.contract_address) or default_unit_token
+                # only the lending events have wallets besides the transfers
+                is_lending = collection is not self.mongo_transactions_transfer and \
+                    document.get(TokenConstant.type) != TokenTypeConstant.Transfer
+                for wallet in document.get(TransactionConstant.wallets) or []:
+                    address = wallet.get(WalletConstant.address)
+                    unit_token = wallet.get(WalletConstant.unit_token) or contract_address
+                    if is_lending:
+                        lending_keys.add((address, unit_token, contract_address))
+                    else:
+                        balance_keys.add((address, unit_token))
+            _observe('find', collection, start)
+
+        balances, lendings = {}, {}
+        if read_wallet_states is not None and (balance_keys or lending_keys):
+            balances, lendings = read_wallet_states(balance_keys, lending_keys, start_block - 1)
+
+        updates = {}
+        for address, unit_token in balance_keys:
+            _set_wallet_field(updates, address, f"{WalletConstant.balances}.{unit_token}",
+                              balances.get((address, unit_token)))
+        for address, unit_token, contract_address in lending_keys:
+            supply, borrow = lendings.get((address, unit_token, contract_address)) or (None, None)
+            _set_wallet_field(updates, address, f"{WalletConstant.supply}.{unit_token}", supply)
+            _set_wallet_field(updates, address, f"{WalletConstant.borrow}.{unit_token}", borrow)
+        requests = []
+        for address, update in updates.items():
+            update.setdefault('$set', {})[WalletConstant.at_block_number] = start_block - 1
+            requests.append(UpdateOne({WalletConstant.address: address}, update))
+        if requests:
+            with process_limit(MONGO):
+                start = time.time()
+                self.mongo_wallet.bulk_write(requests, ordered=False)
+            _observe_write('bulk_write', self.mongo_wallet, start, len(requests))
+
+        deleted = 0
+        deletes = [(self.mongo_blocks, {'number': block_range[TransactionConstant.block_number]}),
+                   (self.mongo_transactions, block_range), (self.mongo_transactions_transfer, block_range)]
+        deletes += [(collection, block_range) for collection in token_collections]
+        for collection, query in deletes:
+            start = time.time()
+            deleted += collection.delete_many(query).deleted_count
+            _observe_write('delete_many', collection, start)
+        logger.info(f"Rolled back blocks {start_block}-{end_block}, deleted {deleted} documents "
+                    f"and restored {len(requests)} wallets")
+
+
+def create_token_collection_indexes(collection):
+    collection.create_index([("transaction_hash", "hashed")])
+    collection.create_index([("block_number", "hashed")])
+
+
+def create_events_indexes(collection):
+    """Indexes of the events collection, ranged so block range queries and rollbacks use them"""
+    index_information = collection.index_information()
+    if MongoIndexConstant.event_contract_block not in index_information:
+        collection.create_index([(TokenConstant.contract_address, 1), (TransactionConstant.block_number, 1),
+                                 (EventConstant.log_index, 1)], name=MongoIndexConstant.event_contract_block)
+    if MongoIndexConstant.event_block_number not in index_information:
+        collection.create_index([(TransactionConstant.block_number, 1)], name=MongoIndexConstant.event_block_number)
+    if MongoIndexConstant.event_tx_hash not in index_information:
+        collection.create_index([(TransactionConstant.transaction_hash, "hashed")],
+                                name=MongoIndexConstant.event_tx_hash)
+
+
+def create_block_range_index(collection, field):
+    if MongoIndexConstant.block_range not in collection.index_information():
+        collection.create_index([(field, 1)], name=MongoIndexConstant.block_range)
+
+
+def _set_wallet_field(updates, address, field, value):
+    update = updates.setdefault(address, {})
+    if value is None:
+        update.setdefault('$unset', {})[field] = ''
+    else:
+        update.setdefault('$set', {})[field] = str(value)
+
+
+def _observe(operation, collection, start):
+    MONGO_SECONDS.labels(operation, collection.name).observe(time.time() - start)
+
+
+def _observe_write(operation, collection, start, operations=1):
+    _observe(operation, collection, start)
+    MONGO_OPERATIONS.labels(collection.name).inc(operations)
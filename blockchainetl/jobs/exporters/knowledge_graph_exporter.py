@@ -23,15 +23,18 @@ import logging
 import time
 
 from blockchainetl.jobs.exporters.databasse.mongo_db import Database
+from config.config import WalletCacheConfig
 from config.constant import BlockConstant, TransactionConstant, TokenConstant, TokenTypeConstant, WalletConstant, \
     ExportItemConstant, ExportItemTypeConstant, LoggerConstant
+from data_storage.wallet_state_cache import WalletStateCache
+from utils.boolean_utils import to_bool
 
 logger = logging.getLogger(LoggerConstant.KnowledgeGraphExporter)
 
 
 class KnowledgeGraphExporter:
 
-    def __init__(self):
+    def __init__(self, bulk_write=None, wallet_cache=None):
         self.mapping_handler = {
             ExportItemTypeConstant.transaction: self._transaction_handler,
             ExportItemTypeConstant.block: self._block_handler,
@@ -39,7 +42,13 @@ class KnowledgeGraphExporter:
             ExportItemTypeConstant.event: self._event_handler,
             ExportItemTypeConstant.token: self._token_handler
         }
-        self.data_base = Database()
+        self.data_base = Database(bulk_write=bulk_write)
+
+        if wallet_cache is None:
+            wallet_cache = to_bool(WalletCacheConfig.WALLET_CACHE)
+        self.wallet_cache = None
+        if wallet_cache:
+            self.wallet_cache = WalletStateCache(self.data_base, max_size=int(WalletCacheConfig.WALLET_CACHE_SIZE))
 
     def open(self):
         pass
@@ -54,7 +63,20 @@ class KnowledgeGraphExporter:
             handler(item)
 
     def close(self):
-        pass
+        if self.wallet_cache:
+            self.wallet_cache.flush()
+        self.data_base.flush()
+
+    def create_rollback_indexes(self):
+        self.data_base.create_rollback_indexes()
+
+    def rollback(self, start_block, end_block, read_wallet_states=None):
+        """Removes the documents of the blocks of the range and sets their wallets back to before the range"""
+        self.close()
+        self.data_base.rollback_blocks(start_block, end_block, read_wallet_states)
+        if self.wallet_cache:
+            # the cached wallets may hold balances of the removed blocks
+            self.wallet_cache.clear()
 
     def _block_handler(self, item):
         item[BlockConstant.gas_limit] = str(item.get(BlockConstant.gas_limit))
@@ -102,6 +124,9 @@ class KnowledgeGraphExporter:
             return
         for wallet in item.get(TransactionConstant.wallets):
             address = wallet.get(WalletConstant.address)
+            if self.wallet_cache:
+                self._update_cached_wallet(item, wallet, balance_address)
+                continue
             start_time = time.time()
             wallet_in_db = self.data_base.get_wallet(address)
             # logger.info(f"Time to get wallet in db{time.time() - start_time}")
@@ -141,3 +166,20 @@ class KnowledgeGraphExporter:
             # logger.debug(f"time to replace_wallet wallet in db{time.time() - start_time}")
 
         # logger.debug(f"Time to _update_wallet_and_item {time.time() - start_time_all}")
+
+    def _update_cached_wallet(self, item, wallet, balance_address):
+        unit_token = wallet.get(WalletConstant.unit_token)
+        if not unit_token:
+            unit_token = balance_address
+
+        wallet[WalletConstant.balance] = str(wallet.get(WalletConstant.balance))
+        wallet[WalletConstant.pre_balance] = str(wallet.get(WalletConstant.pre_balance))
+
+        balances, supply, borrow = self.wallet_cache.update(wallet.get(WalletConstant.address), unit_token,
+                                                            wallet.get(WalletConstant.balance),
+                                                            supply=wallet.get(WalletConstant.supply),
+                                                            borrow=wallet.get(WalletConstant.borrow),
+                                                            block_number=item.get(TransactionConstant.block_number))
+        wallet[WalletConstant.balances] = balances
+        wallet[WalletConstant.supply] = supply
+        wallet[WalletConstant.borrow] = borrow
@@ -0,0 +1,253 @@
+import atexit
+import json
+import logging
+import os
+import threading
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from config.config import ParquetConfig
+from config.constant import ExportItemConstant, ExportItemTypeConstant, TransactionConstant, WalletConstant
+
+logger = logging.getLogger('ParquetItemExporter')
+
+# uint256 values are 32 bytes big endian, decimal256 can't hold all of them (76 digits at most)
+UINT256 = pa.binary(32)
+
+WALLET = pa.struct([
+    (WalletConstant.address, pa.string()),
+    (WalletConstant.balance, pa.string()),
+    (WalletConstant.pre_balance, pa.string()),
+    (TransactionConstant.block_number, pa.int64()),
+    (WalletConstant.unit_token, pa.string()),
+    (WalletConstant.supply, pa.string()),
+    (WalletConstant.borrow, pa.string()),
+])
+
+SCHEMAS = {
+    ExportItemTypeConstant.block: pa.schema([
+        ('number', pa.int64()),
+        ('hash', pa.string()),
+        ('parent_hash', pa.string()),
+        ('nonce', pa.string()),
+        ('sha3_uncles', pa.string()),
+        ('logs_bloom', pa.string()),
+        ('transactions_root', pa.string()),
+        ('state_root', pa.string()),
+        ('receipts_root', pa.string()),
+        ('miner', pa.string()),
+        ('difficulty', UINT256),
+        ('total_difficulty', UINT256),
+        ('size', pa.int64()),
+        ('extra_data', pa.string()),
+        ('gas_limit', pa.int64()),
+        ('gas_used', pa.int64()),
+        ('timestamp', pa.int64()),
+        ('transaction_count', pa.int64()),
+    ]),
+    ExportItemTypeConstant.transaction: pa.schema([
+        ('hash', pa.string()),
+        ('nonce', pa.int64()),
+        ('block_hash', pa.string()),
+        ('block_number', pa.int64()),
+        ('block_timestamp', pa.int64()),
+        ('transaction_index', pa.int64()),
+        ('from_address', pa.string()),
+        ('to_address', pa.string()),
+        ('value', UINT256),
+        ('gas', pa.int64()),
+        ('gas_price', UINT256),
+        ('input', pa.string()),
+        (TransactionConstant.wallets, pa.list_(WALLET)),
+    ]),
+    ExportItemTypeConstant.token_transfer: pa.schema([
+        ('contract_address', pa.string()),
+        ('from_address', pa.string()),
+        ('to_address', pa.string()),
+        ('value', UINT256),
+        ('transaction_hash', pa.string()),
+        ('log_index', pa.int64()),
+        ('block_number', pa.int64()),
+        (TransactionConstant.wallets, pa.list_(WALLET)),
+    ]),
+    ExportItemTypeConstant.event: pa.schema([
+        ('event_type', pa.string()),
+        ('contract_address', pa.string()),
+        ('transaction_hash', pa.string()),
+        ('log_index', pa.int64()),
+        ('block_number', pa.int64()),
+        (TransactionConstant.wallets, pa.list_(WALLET)),
+        # the event arguments, they differ for every event
+        ('params', pa.string()),
+    ]),
+    ExportItemTypeConstant.token: pa.schema([
+        ('address', pa.string()),
+        ('symbol', pa.string()),
+        ('name', pa.string()),
+        ('decimals', pa.int64()),
+        ('total_supply', UINT256),
+        ('block_number', pa.int64()),
+    ]),
+}
+
+
+class ParquetItemExporter:
+    """Writes the items of every type into Parquet files with an explicit schema.
+
+    Items are buffered per type and written as row groups of row_group_size rows. Files are written to
+    output_dir/<type><partition_dir>/<type>_<n>.parquet, partition_dir being the one of get_partitions set with
+    set_partition_dir. close() leaves the files open, so the block ranges of a partition share them: a file is
+    complete once the partition changes, once it reaches max_file_size bytes, or after finish().
+    """
+
+    def __init__(self, output_dir, row_group_size=ParquetConfig.ROW_GROUP_SIZE,
+                 compression=ParquetConfig.COMPRESSION, max_file_size=ParquetConfig.MAX_FILE_SIZE):
+        self.output_dir = output_dir
+        self.row_group_size = int(row_group_size)
+        self.compression = compression
+        self.max_file_size = int(max_file_size)
+        self.partition_dir = ''
+
+        self._lock = threading.Lock()
+        self._buffers = {}
+        # item type -> (ParquetWriter, file it writes to)
+        self._writers = {}
+        self._file_counts = {}
+        self._unknown_types = set()
+        # what is still buffered is written when the process exits
+        atexit.register(self.finish)
+
+    def open(self):
+        pass
+
+    def set_partition_dir(self, partition_dir):
+        with self._lock:
+            if partition_dir != self.partition_dir:
+                self._close_writers()
+                self.partition_dir = partition_dir
+
+    def export_items(self, items):
+        for item in items:
+            self.export_item(item)
+
+    def export_item(self, item):
+        item_type = item.get(ExportItemConstant.type)
+        if item_type not in SCHEMAS:
+            if item_type not in self._unknown_types:
+                self._unknown_types.add(item_type)
+                logger.warning(f"No parquet schema for items of type {item_type}, they aren't exported")
+            return
+        with self._lock:
+            buffer = self._buffers.setdefault(item_type, [])
+            buffer.append(item)
+            if len(buffer) >= self.row_group_size:
+                self._flush(item_type)
+
+    def close(self):
+        pass
+
+    def finish(self):
+        """Writes the buffered items and completes the files"""
+        with self._lock:
+            self._close_writers()
+
+    def _close_writers(self):
+        for item_type in list(self._buffers):
+            self._flush(item_type)
+        for item_type in list(self._writers):
+            self._close_writer(item_type)
+
+    def _close_writer(self, item_type):
+        writer, sink = self._writers.pop(item_type)
+        writer.close()
+        sink.close()
+
+    def _flush(self, item_type):
+        items = self._buffers.pop(item_type, None)
+        if not items:
+            return
+        schema = SCHEMAS[item_type]
+        columns = {name: [convert(_get_value(item_type, name, item)) for item in items]
+                   for name, convert in CONVERTERS[item_type]}
+        table = pa.Table.from_pydict(columns, schema=schema)
+
+        if item_type not in self._writers:
+            sink = open(self._get_file_path(item_type), 'wb')
+            self._writers[item_type] = (pq.ParquetWriter(sink, schema, compression=self.compression), sink)
+        writer, sink = self._writers[item_type]
+        writer.write_table(table, row_group_size=self.row_group_size)
+        if sink.tell() >= self.max_file_size:
+            self._close_writer(item_type)
+
+    def _get_file_path(self, item_type):
+        directory = self.output_dir + '/' + item_type + self.partition_dir
+        os.makedirs(directory, exist_ok=True)
+        key = (item_type, self.partition_dir)
+        file_count = self._file_counts.get(key, 0)
+        self._file_counts[key] = file_count + 1
+        return os.path.join(directory, f"{item_type}_{str(file_count).zfill(5)}.parquet")
+
+
+def _get_value(item_type, field_name, item):
+    if item_type == ExportItemTypeConstant.event and field_name == 'params':
+        known_fields = set(SCHEMAS[item_type].names) | {ExportItemConstant.type}
+        params = {key: value for key, value in item.items() if key not in known_fields}
+        return json.dumps(params, default=str)
+    return item.get(field_name)
+
+
+def _to_int(value):
+    if isinstance(value, int):
+        return value
+    try:
+        if isinstance(value, str) and value.startswith('0x'):
+            return int(value, 16)
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_uint256(value):
+    number = _to_int(value)
+    if number is None or number < 0 or number >= 2 ** 256:
+        return None
+    return number.to_bytes(32, 'big')
+
+
+def _to_int64(value):
+    number = _to_int(value)
+    if number is None or not -2 ** 63 <= number < 2 ** 63:
+        return None
+    return number
+
+
+def _to_string(value):
+    # the wallet mapper writes missing balances as 'None'
+    if value == 'None':
+        return None
+    return value if isinstance(value, str) else str(value)
+
+
+def _get_converter(data_type):
+    if data_type == UINT256:
+        return _to_uint256
+    if data_type == pa.int64():
+        return _to_int64
+    if data_type == pa.string():
+        return _to_string
+    if data_type == WALLET:
+        converters = [(field.name, _convert_none(_get_converter(field.type))) for field in WALLET]
+        return lambda wallet: {name: convert(wallet.get(name)) for name, convert in converters}
+    if pa.types.is_list(data_type):
+        convert_element = _get_converter(data_type.value_type)
+        return lambda values: [convert_element(value) for value in values]
+    return lambda value: value
+
+
+def _convert_none(convert):
+    return lambda value: None if value is None else convert(value)
+
+
+CONVERTERS = {item_type: [(field.name, _convert_none(_get_converter(field.type))) for field in schema]
+              for item_type, schema in SCHEMAS.items()}
@@ -0,0 +1,81 @@
+import json
+import logging
+import os
+from collections import deque
+
+from utils.file_utils import smart_open
+
+logger = logging.getLogger('BlockHashRing')
+
+
+class BlockHashRing:
+    """(number, hash, parent_hash) of the last synced blocks, to tell whether new blocks extend the same chain.
+
+    The blocks are written to path along with the last synced block, and are only loaded back when they end at
+    the last synced block, so they always describe what was exported.
+    """
+
+    def __init__(self, path, max_size=256):
+        self.path = path
+        self.max_size = int(max_size)
+        self._blocks = deque(maxlen=self.max_size)
+
+    def load(self, last_synced_block):
+        self._blocks.clear()
+        if not os.path.isfile(self.path):
+            return
+        try:
+            with smart_open(self.path, 'r') as ring_file:
+                blocks = [tuple(block) for block in json.load(ring_file)]
+        except ValueError:
+            logger.warning(f"Ignoring the unreadable block hashes of {self.path}")
+            return
+        if blocks and blocks[-1][0] == last_synced_block:
+            self._blocks.extend(blocks)
+
+    def save(self):
+        # written aside then renamed, a crash never leaves a cut file
+        temp_path = self.path + '.tmp'
+        with smart_open(temp_path, 'w') as ring_file:
+            json.dump(list(self._blocks), ring_file)
+        os.replace(temp_path, self.path)
+
+    def get_blocks(self):
+        return list(self._blocks)
+
+    def find_mismatch(self, blocks):
+        """The first of the blocks, sorted by number, whose parent isn't the block before it, None if they chain"""
+        previous = self._blocks[-1] if self._blocks else None
+        for block in blocks:
+            number, _, parent_hash = block
+            if previous is not None and previous[0] == number - 1 and previous[1] != parent_hash:
+                return number
+            previous = block
+        return None
+
+    def extend(self, blocks):
+        if self._blocks and blocks and blocks[0][0] != self._blocks[-1][0] + 1:
+            # blocks in between weren't recorded, the ring starts over
+            self._blocks.clear()
+        self._blocks.extend(blocks)
+
+    def replace(self, blocks):
+        self._blocks.clear()
+        self._blocks.extend(blocks)
+
+    def get_fork_candidates(self, blocks, mismatch_block):
+        """The kept blocks and the new ones before the mismatch, the chains split after one of them"""
+        candidates = list(self._blocks) + [block for block in blocks if block[0] < mismatch_block]
+        return candidates[-self.max_size:]
+
+
+def find_fork_block(candidates, canonical_hashes, mismatch_block):
+    """The last block of the candidates that is still canonical, None when the reorg is deeper than all of them.
+
+    :param canonical_hashes: block number -> hash of the canonical chain for the numbers of the candidates
+    """
+    for index, (number, block_hash, _) in enumerate(candidates):
+        if canonical_hashes.get(number) != block_hash:
+            return number - 1 if index else None
+    # the candidates are all canonical, the block of the mismatch is the first one orphaned
+    return mismatch_block - 1
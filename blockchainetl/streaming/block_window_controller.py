@@ -0,0 +1,80 @@
+import logging
+
+logger = logging.getLogger('BlockWindowController')
+
+CATCH_UP = 'catch_up'
+TIP_FOLLOWING = 'tip_following'
+
+
+class BlockWindowController:
+    """Sizes the block window of every sync cycle from the measured seconds per block.
+
+    While more than tip_distance blocks are left, the catch-up profile grows the window by growth_factor after a
+    full window synced under target_seconds_per_block. It halves the window after an error, a window slower than
+    spike_factor times the target, or a window over the target and spike_factor times slower than the recent
+    average. It then grows no further than just below the window that was slow, and probes above by 10% per
+    window. The window also stays small enough to sync in max_cycle_seconds, so the last synced block is still
+    written regularly. Closer to the head, the tip-following profile syncs every block
+    available and leaves the window size alone, a few blocks say nothing about throughput.
+    """
+
+    def __init__(self, min_size, max_size, target_seconds_per_block, tip_distance, max_cycle_seconds=300,
+                 growth_factor=2.0, spike_factor=2.0):
+        self.min_size = max(int(min_size), 1)
+        self.max_size = max(int(max_size), self.min_size)
+        self.target_seconds_per_block = float(target_seconds_per_block)
+        self.tip_distance = int(tip_distance)
+        self.max_cycle_seconds = float(max_cycle_seconds)
+        self.growth_factor = float(growth_factor)
+        self.spike_factor = float(spike_factor)
+
+        self.window_size = self.min_size
+        self.profile = None
+        self._cycle_window_size = None
+        # moving average of the seconds per block of the catch-up windows
+        self._average_seconds_per_block = None
+        self._ceiling = self.max_size
+
+    def get_window_size(self, blocks_behind):
+        """The number of blocks to sync in the next cycle"""
+        profile = CATCH_UP if blocks_behind > self.tip_distance else TIP_FOLLOWING
+        if profile != self.profile:
+            logger.info(f"{blocks_behind} blocks behind, switching to the {profile} profile")
+            self.profile = profile
+        if profile == TIP_FOLLOWING:
+            self._cycle_window_size = None
+            return max(blocks_behind, 1)
+        self._cycle_window_size = self.window_size
+        return self.window_size
+
+    def on_success(self, synced_blocks, seconds):
+        if self._cycle_window_size is None or synced_blocks <= 0:
+            return
+        seconds_per_block = seconds / synced_blocks
+        average = self._average_seconds_per_block
+        is_spike = average is not None and seconds_per_block > average * self.spike_factor
+        window_size = self.window_size
+        if seconds_per_block > self.target_seconds_per_block * self.spike_factor \
+                or (is_spike and seconds_per_block > self.target_seconds_per_block):
+            self._ceiling = max(int(window_size * 0.9), self.min_size)
+            window_size = int(window_size / 2)
+        elif seconds_per_block <= self.target_seconds_per_block and synced_blocks >= self._cycle_window_size:
+            if window_size >= self._ceiling:
+                self._ceiling = int(self._ceiling * 1.1) + 1
+            window_size = min(int(window_size * self.growth_factor), self._ceiling)
+        self._average_seconds_per_block = seconds_per_block if average is None \
+            else average + 0.3 * (seconds_per_block - average)
+        if seconds_per_block > 0:
+            window_size = min(window_size, int(self.max_cycle_seconds / seconds_per_block))
+        self._set_window_size(window_size, f"{round(seconds_per_block * 1000, 1)}ms per block")
+
+    def on_error(self):
+        if self._cycle_window_size is None:
+            return
+        self._set_window_size(int(self.window_size / 2), "an error")
+
+    def _set_window_size(self, window_size, reason):
+        window_size = min(max(window_size, self.min_size), self.max_size)
+        if window_size != self.window_size:
+            logger.info(f"Block window {self.window_size} -> {window_size} after {reason}")
+            self.window_size = window_size
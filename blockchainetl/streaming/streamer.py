@@ -26,7 +26,12 @@ import os
 import time
 
 from utils.file_utils import smart_open
+from blockchainetl.streaming.block_hash_ring import BlockHashRing, find_fork_block
 from blockchainetl.streaming.streamer_adapter_stub import StreamerAdapterStub
+from blockchainetl.streaming.tip_waiter import PollingTipWaiter
+
+# what an adapter implements to have its blocks checked for reorgs
+REORG_ADAPTER_METHODS = ('get_exported_blocks', 'get_block_hashes', 'rollback')
 
 
 class Streamer:
@@ -41,7 +46,10 @@ class Streamer:
             period_seconds=10,
             block_batch_size=10,
             retry_errors=True,
-            pid_file=None):
+            pid_file=None,
+            window_controller=None,
+            tip_waiter=None,
+            reorg_depth=0):
         self.blockchain_streamer_adapter = blockchain_streamer_adapter
         self.last_synced_block_file = last_synced_block_file
         self.lag = lag
@@ -51,12 +59,23 @@ class Streamer:
         self.block_batch_size = block_batch_size
         self.retry_errors = retry_errors
         self.pid_file = pid_file
+        # sizes the block windows when set, block_batch_size is the window otherwise
+        self.window_controller = window_controller
+        # waits when nothing is left to sync, a fixed sleep of period_seconds by default
+        self.tip_waiter = tip_waiter or PollingTipWaiter(period_seconds, period_seconds)
 
         if self.start_block is not None or not os.path.isfile(self.last_synced_block_file):
             init_last_synced_block_file((self.start_block or 0) - 1, self.last_synced_block_file)
 
         self.last_synced_block = read_last_synced_block(self.last_synced_block_file)
 
+        # the hashes of the last reorg_depth blocks are kept to roll back the blocks a reorg orphaned
+        self.block_hash_ring = None
+        if reorg_depth and all(hasattr(blockchain_streamer_adapter, name) for name in REORG_ADAPTER_METHODS):
+            self.block_hash_ring = BlockHashRing(get_block_hashes_file(self.last_synced_block_file), reorg_depth)
+            if self.start_block is None:
+                self.block_hash_ring.load(self.last_synced_block)
+
     def stream(self):
         try:
             if self.pid_file is not None:
@@ -74,17 +93,24 @@ class Streamer:
         while True and (self.end_block is None or self.last_synced_block < self.end_block):
             synced_blocks = 0
 
+            start = time.time()
             try:
                 synced_blocks = self._sync_cycle()
             except Exception as e:
                 # https://stackoverflow.com/a/4992124/1580227
                 logging.exception('An exception occurred while syncing block data.')
+                if self.window_controller is not None:
+                    self.window_controller.on_error()
                 if not self.retry_errors:
                     raise e
+            else:
+                if self.window_controller is not None:
+                    self.window_controller.on_success(synced_blocks, time.time() - start)
 
             if synced_blocks <= 0:
-                logging.info('Nothing to sync. Sleeping for {} seconds...'.format(self.period_seconds))
-                time.sleep(self.period_seconds)
+                self.tip_waiter.wait_for_block(self.last_synced_block + self.lag + 1)
+            else:
+                self.tip_waiter.reset()
 
     def _sync_cycle(self):
         current_block = self.blockchain_streamer_adapter.get_current_block_number()
@@ -101,15 +127,47 @@ class Streamer:
 
         if blocks_to_sync != 0:
             self.blockchain_streamer_adapter.export_all(self.last_synced_block + 1, target_block)
+            if self.block_hash_ring is not None:
+                target_block = self._check_reorg(target_block)
+                self.block_hash_ring.save()
             logging.info('Writing last synced block {}'.format(target_block))
             write_last_synced_block(self.last_synced_block_file, target_block)
             self.last_synced_block = target_block
 
         return blocks_to_sync
 
+    def _check_reorg(self, target_block):
+        """Rolls back the exported blocks that don't extend the chain of the synced ones.
+
+        :return: the last block that is still synced, the next cycle exports the canonical blocks after it
+        """
+        adapter = self.blockchain_streamer_adapter
+        blocks = sorted(adapter.get_exported_blocks())
+        mismatch_block = self.block_hash_ring.find_mismatch(blocks)
+        if mismatch_block is None:
+            self.block_hash_ring.extend(blocks)
+            return target_block
+
+        candidates = self.block_hash_ring.get_fork_candidates(blocks, mismatch_block)
+        canonical_hashes = adapter.get_block_hashes([number for number, _, _ in candidates])
+        fork_block = find_fork_block(candidates, canonical_hashes, mismatch_block)
+        if fork_block is None:
+            raise ValueError('Reorg at block {} is deeper than the {} blocks kept, the blocks after {} have to be '
+                             'exported again'.format(mismatch_block, len(candidates), candidates[0][0] - 1))
+
+        logging.warning('Reorg detected at block {}, rolling back blocks {}-{}'.format(
+            mismatch_block, fork_block + 1, target_block))
+        adapter.rollback(fork_block + 1, target_block)
+        self.block_hash_ring.replace([block for block in candidates if block[0] <= fork_block])
+        return fork_block
+
     def _calculate_target_block(self, current_block, last_synced_block):
         target_block = current_block - self.lag
-        target_block = min(target_block, last_synced_block + self.block_batch_size)
+        if self.window_controller is not None:
+            window_size = self.window_controller.get_window_size(target_block - last_synced_block)
+        else:
+            window_size = self.block_batch_size
+        target_block = min(target_block, last_synced_block + window_size)
         target_block = min(target_block, self.end_block) if self.end_block is not None else target_block
         return target_block
 
@@ -121,6 +179,10 @@ def delete_file(file):
         pass
 
 
+def get_block_hashes_file(last_synced_block_file):
+    return os.path.splitext(last_synced_block_file)[0] + '_hashes.json'
+
+
 def write_last_synced_block(file, last_synced_block):
     write_to_file(file, str(last_synced_block) + '\n')
 
@@ -0,0 +1,19 @@
+import logging
+import time
+
+
+class PollingTipWaiter:
+    """Waits before polling the head again, from min_seconds doubling up to max_seconds until a block is synced"""
+
+    def __init__(self, min_seconds, max_seconds):
+        self.min_seconds = float(min_seconds)
+        self.max_seconds = max(float(max_seconds), self.min_seconds)
+        self._seconds = self.min_seconds
+
+    def wait_for_block(self, block_number):
+        logging.info('Nothing to sync. Sleeping for {} seconds...'.format(self._seconds))
+        time.sleep(self._seconds)
+        self._seconds = min(self._seconds * 2, self.max_seconds)
+
+    def reset(self):
+        self._seconds = self.min_seconds
@@ -21,6 +21,22 @@ class MongoDBConfig:
     POOL = "pool"
     BLOCKS = "blocks"
     TOKENS = "tokens"
+    EVENTS = "events"
+    # per_contract writes the events and token transfers of a contract to a collection named after it,
+    # single writes all of them to EVENTS, see docker_run/migrate_event_collections.py to move from one to the other
+    EVENTS_LAYOUT = os.environ.get("MONGO_EVENTS_LAYOUT") or "per_contract"
+
+
+class MongoBulkWriteConfig:
+    BULK_WRITE = os.environ.get("MONGO_BULK_WRITE") or False
+    MAX_OPERATIONS = os.environ.get("MONGO_BULK_MAX_OPERATIONS") or 1000
+    MAX_BYTES = os.environ.get("MONGO_BULK_MAX_BYTES") or 8 * 1024 * 1024
+    FLUSH_INTERVAL_SECONDS = os.environ.get("MONGO_BULK_FLUSH_INTERVAL_SECONDS") or 5
+
+
+class WalletCacheConfig:
+    WALLET_CACHE = os.environ.get("WALLET_CACHE") or False
+    WALLET_CACHE_SIZE = os.environ.get("WALLET_CACHE_SIZE") or 100000
 
 
 class Neo4jConfig:
@@ -46,11 +62,142 @@ class BuildKnowledgeGraphConfig:
     TOKENS_FILTER_FILE = os.environ.get(
         "KNOWLEDGE_GRAPH_TOKENS_FILTER_FILE") or "artifacts/smart_contract_filter/token_filter"
     EVENT_ABI_DIR = os.environ.get("KNOWLEDGE_GRAPH_EVENT_ABI_DIR") or "artifacts/event-abi"
+    # knowledge_graph, console or parquet://<output dir>
+    OUTPUT = os.environ.get("KNOWLEDGE_GRAPH_OUTPUT") or "knowledge_graph"
+
+
+class StreamerConfig:
+    # block windows grow from KNOWLEDGE_GRAPH_BLOCK_BATCH_SIZE up to MAX_WINDOW while blocks take less than
+    # TARGET_SECONDS_PER_BLOCK, and shrink on errors or slow blocks
+    ADAPTIVE_WINDOW = os.environ.get("STREAMER_ADAPTIVE_WINDOW") or True
+    MAX_WINDOW = os.environ.get("STREAMER_MAX_WINDOW") or 10000
+    TARGET_SECONDS_PER_BLOCK = os.environ.get("STREAMER_TARGET_SECONDS_PER_BLOCK") or 0.5
+    # the last synced block is written at least this often while catching up
+    MAX_CYCLE_SECONDS = os.environ.get("STREAMER_MAX_CYCLE_SECONDS") or 300
+    # closer to the head every new block is synced as it comes
+    TIP_DISTANCE = os.environ.get("STREAMER_TIP_DISTANCE") or 64
+    # polls at the head wait from this up to KNOWLEDGE_GRAPH_PERIOD_SECONDS, unless newHeads comes over IPC
+    MIN_POLL_SECONDS = os.environ.get("STREAMER_MIN_POLL_SECONDS") or 0.5
+    # hashes of the last synced blocks kept to detect reorgs and roll back the orphaned blocks, 0 disables it, off
+    # by default: the first start with it builds block range indexes on every collection a rollback deletes from
+    REORG_DEPTH = os.environ.get("STREAMER_REORG_DEPTH") or 0
+
+
+class MulticallConfig:
+    # Multicall3 is deployed at the same address on BSC, Ethereum and most EVM chains
+    MULTICALL_ADDRESS = os.environ.get("MULTICALL_ADDRESS") or "0xca11bde05977b3631167028862be2a173976ca11"
+    MULTICALL_BATCH_SIZE = os.environ.get("MULTICALL_BATCH_SIZE") or 200
+
+
+class GetBalanceConfig:
+    # eth_getBalance requests sent in one JSON-RPC batch
+    BATCH_SIZE = os.environ.get("GET_BALANCE_BATCH_SIZE") or 200
+
+
+class GetLogsConfig:
+    # eth_getLogs sub-ranges sent in one JSON-RPC batch, split in half when a provider returns too many results
+    SUB_RANGE_SIZE = os.environ.get("GET_LOGS_SUB_RANGE_SIZE") or 10
+    MAX_BATCH_REQUESTS = os.environ.get("GET_LOGS_MAX_BATCH_REQUESTS") or 20
+
+
+class PipelineConfig:
+    # run the jobs of a block range concurrently and write a range while the next one is fetched
+    PIPELINED = os.environ.get("KNOWLEDGE_GRAPH_PIPELINED") or False
+    PIPELINE_QUEUE_SIZE = os.environ.get("KNOWLEDGE_GRAPH_PIPELINE_QUEUE_SIZE") or 2
+
+
+class AsyncProviderConfig:
+    # http(s) providers share one asyncio connection pool instead of one provider per thread
+    ASYNC_PROVIDER = os.environ.get("ASYNC_PROVIDER") or False
+    MAX_IN_FLIGHT = os.environ.get("ASYNC_PROVIDER_MAX_IN_FLIGHT") or 100
+    POOL_SIZE = os.environ.get("ASYNC_PROVIDER_POOL_SIZE") or 100
+
+
+class ProviderPoolConfig:
+    # used when a provider uri is a comma separated list of endpoints
+    HEDGE_AFTER_SECONDS = os.environ.get("PROVIDER_POOL_HEDGE_AFTER_SECONDS") or 2
+    MAX_ERROR_RATE = os.environ.get("PROVIDER_POOL_MAX_ERROR_RATE") or 0.5
+    MAX_LAG_BLOCKS = os.environ.get("PROVIDER_POOL_MAX_LAG_BLOCKS") or 10
+    EJECT_SECONDS = os.environ.get("PROVIDER_POOL_EJECT_SECONDS") or 60
+    HEALTH_CHECK_SECONDS = os.environ.get("PROVIDER_POOL_HEALTH_CHECK_SECONDS") or 15
+    MAX_WORKERS = os.environ.get("PROVIDER_POOL_MAX_WORKERS") or 32
+
+
+class IPCConfig:
+    # bytes received per read from an IPC socket, the receive buffer starts at this size and doubles as needed
+    RECEIVE_SIZE = os.environ.get("IPC_RECEIVE_SIZE") or 1048576
+
+
+class RpcCacheConfig:
+    # results of final blocks are kept in this SQLite file and batch providers answer from it, off when not set
+    RPC_CACHE_PATH = os.environ.get("RPC_CACHE_PATH") or None
+    MAX_SIZE = os.environ.get("RPC_CACHE_MAX_SIZE") or 10 * 1024 * 1024 * 1024
+    # blocks closer to the head may still be reorganized
+    CONFIRMATIONS = os.environ.get("RPC_CACHE_CONFIRMATIONS") or 50
+    HEAD_REFRESH_SECONDS = os.environ.get("RPC_CACHE_HEAD_REFRESH_SECONDS") or 10
+
+
+class RpcRecordConfig:
+    # the requests of the providers and their answers are appended to this gzipped JSON lines fixture, off when
+    # not set, ethereumetl/providers/replay.py serves it back
+    RPC_RECORD_PATH = os.environ.get("RPC_RECORD_PATH") or None
+
+
+class BalanceLedgerConfig:
+    # token balances are derived from the transfers instead of being read from the node at every transfer, off by
+    # default: balances that change without a Transfer, like those of interest bearing and debt tokens or rebasing
+    # tokens, stay wrong until they are reconciled
+    BALANCE_LEDGER = os.environ.get("BALANCE_LEDGER") or False
+    MAX_ENTRIES = os.environ.get("BALANCE_LEDGER_MAX_ENTRIES") or 1000000
+    # derived balances are read from the node again after this many blocks
+    RECONCILE_BLOCKS = os.environ.get("BALANCE_LEDGER_RECONCILE_BLOCKS") or 28800
+    # share of the derived balances also read from the node to check the ledger, 0 to never check
+    CHECK_SAMPLE_RATE = os.environ.get("BALANCE_LEDGER_CHECK_SAMPLE_RATE") or 0
+
+
+class TokenMetadataConfig:
+    # symbols, names and decimals of the tokens, asked once and kept across restarts, relative to the project root
+    FILE = os.environ.get("TOKEN_METADATA_FILE") or "data/token_metadata.json"
+    # total supplies are refreshed, in one batch of multicalls, at most this often
+    REFRESH_SECONDS = os.environ.get("TOKEN_METADATA_REFRESH_SECONDS") or 86400
+    # refreshed in a thread of its own instead of in the jobs of a block range
+    BACKGROUND_REFRESH = os.environ.get("TOKEN_METADATA_BACKGROUND_REFRESH") or True
+
+
+class ParquetConfig:
+    # rows per row group of the parquet files, also the number of rows of a type buffered before writing
+    ROW_GROUP_SIZE = os.environ.get("PARQUET_ROW_GROUP_SIZE") or 100000
+    COMPRESSION = os.environ.get("PARQUET_COMPRESSION") or "snappy"
+    # a file is completed and the next one started once it holds this many bytes, files also end with the partition
+    MAX_FILE_SIZE = os.environ.get("PARQUET_MAX_FILE_SIZE") or 512 * 1024 * 1024
+
+
+class BackfillConfig:
+    START_BLOCK = os.environ.get("BACKFILL_START_BLOCK") or 0
+    END_BLOCK = os.environ.get("BACKFILL_END_BLOCK") or None
+    PARTITION_SIZE = os.environ.get("BACKFILL_PARTITION_SIZE") or 1000
+    PROCESSES = os.environ.get("BACKFILL_PROCESSES") or os.cpu_count()
+    # completed partitions, a restarted backfill only exports the others
+    MANIFEST_FILE = os.environ.get("BACKFILL_MANIFEST_FILE") or "data/backfill_manifest.jsonl"
+    # requests sent to the node and mongo bulk writes at a time, over all the processes
+    MAX_RPC_REQUESTS = os.environ.get("BACKFILL_MAX_RPC_REQUESTS") or 32
+    MAX_MONGO_WRITES = os.environ.get("BACKFILL_MAX_MONGO_WRITES") or 4
 
 
 class FilterConfig:
     FILTER_FOR_LENDING = os.environ.get("FILTER_FOR_LENDING") or False
+    # snapshot of the wallet filter, built on the first start, delete it to build it again
+    WALLET_FILTER_FILE = os.environ.get("WALLET_FILTER_FILE") or "data/wallet_filter.bin"
+    # size of a Bloom filter in front of the snapshot, off by default: the prefix index already finds the few
+    # addresses to compare faster than the filter is hashed
+    WALLET_FILTER_BLOOM_BITS_PER_ADDRESS = os.environ.get("WALLET_FILTER_BLOOM_BITS_PER_ADDRESS") or 0
+
+
+class MetricsConfig:
+    # metrics are served in the Prometheus text format on http://<host>:<port>/metrics, off when not set
+    PORT = os.environ.get("METRICS_PORT") or None
 
 
 class TestPerformanceConfig:
+    # metrics are only recorded when true
     CALCULATE_PERFORMANCE = os.environ.get("CALCULATE_PERFORMANCE") or True
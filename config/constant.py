@@ -65,6 +65,11 @@ class LoggerConstant:
     ExportBlocksJob = "ExportBlocksJob"
     EthService = "EthService"
     EthLendingService = "EthLendingService"
+    MongoBulkWriter = "MongoBulkWriter"
+    EthMulticallService = "EthMulticallService"
+    EthLogsService = "EthLogsService"
+    BalanceLedger = "BalanceLedger"
+    TokenMetadataRegistry = "TokenMetadataRegistry"
 
 
 class EthKnowledgeGraphStreamerAdapterConstant:
@@ -110,6 +115,15 @@ class MongoIndexConstant:
     transfer_tx_id = "transfer_tx_id"
     transfer_block_number = "transfer_block_number"
     wallet_address = "wallet_address"
+    event_contract_block = "event_contract_block"
+    event_block_number = "event_block_number"
+    event_tx_hash = "event_tx_hash"
+    block_range = "block_range"
+
+
+class EventsLayoutConstant:
+    per_contract = "per_contract"
+    single = "single"
 
 
 class LendingTypeConstant:
@@ -128,20 +142,5 @@ class VTokenConstant:
     EXCHANGE_RATE_DECIMALS = 18
 
 
-class TestPerformanceConstant:
-    get_lending_info_vtoken_time = "get_lending_info_vtoken_time"
-    get_lending_info_trava_time = "get_lending_info_trava_time"
-    get_block_by_number_json = "get_block_by_number_json"
-    get_balance_time = "get_balance_time"
-    get_balance_smart_contract_time = "get_balance_smart_contract_time"
-    get_event_filter_time = "get_event_filter_time"
-    get_transfer_filter_time = "get_transfer_filter_time"
-    read_mongo_time = "read_mongo_time"
-    write_mongo_time = "write_mongo_time"
-    transaction_number = "transaction_number"
-    transaction_handler_time = "transaction_handler_time"
-    total_time = "total_time"
-
-
 class MemoryStorageKeyConstant:
     checkpoint = "checkpoint"
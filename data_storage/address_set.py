@@ -0,0 +1,236 @@
+import contextlib
+import fcntl
+import hashlib
+import logging
+import math
+import mmap
+import os
+import struct
+import threading
+
+logger = logging.getLogger('MappedAddressSet')
+
+ADDRESS_SIZE = 20
+MAGIC = b'ADDRSET1'
+# magic, number of addresses, bytes of the Bloom filter, hashes per address, padded to 32 bytes
+HEADER = struct.Struct('<8sQQI4x')
+# index of the first address starting with each 2-byte prefix, and the number of addresses at the end
+PREFIX_INDEX = struct.Struct('<65537I')
+PREFIX_BOUNDS = struct.Struct('<II')
+
+
+class MappedAddressSet:
+    """A set of addresses kept in a snapshot file that is memory mapped instead of loaded.
+
+    The snapshot is a header, a Bloom filter, an index by 2-byte prefix and the sorted 20-byte addresses, looked
+    up by binary search among those of their prefix when the Bloom filter doesn't rule them out. Addresses added
+    later are appended to a journal next to the snapshot and kept in memory, they are merged into a new snapshot
+    once there are max_journal of them.
+
+    Processes can share the files: the snapshot and the journal are only written under a lock on a file next to
+    them. A process sees the addresses the others added when it loads the files again.
+    """
+
+    def __init__(self, path, bits_per_address=0, max_journal=100000):
+        self.path = path
+        self.journal_path = path + '.journal'
+        self.lock_path = path + '.lock'
+        self.bits_per_address = int(bits_per_address)
+        self.max_journal = int(max_journal)
+
+        self._lock = threading.RLock()
+        self._mmap = None
+        self._count = 0
+        self._bloom_bits = 0
+        self._hashes = 0
+        self._index_offset = 0
+        self._addresses_offset = 0
+        self._added = set()
+
+    def has_snapshot(self):
+        return os.path.isfile(self.path)
+
+    def load(self):
+        with self._lock, self._file_lock():
+            self._load()
+
+    def build(self, addresses):
+        """Writes a snapshot of the addresses, replacing the snapshot and the journal, and maps it"""
+        with self._lock, self._file_lock():
+            self._write({to_address_bytes(address) for address in addresses} - {None})
+
+    def build_if_missing(self, get_addresses):
+        """Builds the snapshot of get_addresses() unless another process already did, maps it otherwise"""
+        with self._lock, self._file_lock():
+            if self.has_snapshot():
+                self._load()
+                return False
+            self._write({to_address_bytes(address) for address in get_addresses()} - {None})
+            return True
+
+    def compact(self):
+        """Merges the journal into a new snapshot"""
+        with self._lock, self._file_lock():
+            self._compact()
+
+    def contains(self, address):
+        address_bytes = to_address_bytes(address)
+        if address_bytes is None:
+            return False
+        # the snapshot is mapped again by compact
+        with self._lock:
+            return self._contains(address_bytes)
+
+    def add(self, address):
+        """Adds the address, returns whether it was missing"""
+        address_bytes = to_address_bytes(address)
+        if address_bytes is None:
+            return False
+        with self._lock:
+            if self._contains(address_bytes):
+                return False
+            self._add_to_memory(address_bytes)
+            with self._file_lock():
+                with open(self.journal_path, 'ab') as journal_file:
+                    journal_file.write(address_bytes)
+                if len(self._added) >= self.max_journal:
+                    self._compact()
+        return True
+
+    def close(self):
+        with self._lock:
+            if self._mmap is not None:
+                self._mmap.close()
+            self._mmap = None
+            self._count = 0
+            self._bloom_bits = 0
+            self._added = set()
+
+    def __len__(self):
+        return self._count + len(self._added)
+
+    def _load(self):
+        self.close()
+        if self.has_snapshot() and os.path.getsize(self.path) >= HEADER.size:
+            with open(self.path, 'rb') as snapshot_file:
+                # copy on write, so the bits of added addresses can be set in the Bloom filter
+                self._mmap = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_COPY)
+            magic, self._count, bloom_size, self._hashes = HEADER.unpack_from(self._mmap)
+            if magic != MAGIC:
+                raise ValueError(f"{self.path} is not an address set snapshot")
+            self._bloom_bits = bloom_size * 8
+            self._index_offset = HEADER.size + bloom_size
+            self._addresses_offset = self._index_offset + PREFIX_INDEX.size
+        if os.path.isfile(self.journal_path):
+            with open(self.journal_path, 'rb') as journal_file:
+                journal = journal_file.read()
+            # a record cut by a crash is dropped
+            for start in range(0, len(journal) - ADDRESS_SIZE + 1, ADDRESS_SIZE):
+                self._add_to_memory(journal[start:start + ADDRESS_SIZE])
+        logger.info(f"Mapped {self._count} addresses of {self.path}, {len(self._added)} more in the journal")
+
+    def _write(self, addresses):
+        write_snapshot(self.path, addresses, self.bits_per_address)
+        if os.path.isfile(self.journal_path):
+            os.remove(self.journal_path)
+        self._load()
+
+    def _compact(self):
+        # the files may have been compacted or appended to by another process since they were loaded
+        added = self._added
+        self._load()
+        self._write(set(self._iterate_snapshot()) | self._added | added)
+
+    @contextlib.contextmanager
+    def _file_lock(self):
+        directory = os.path.dirname(self.lock_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.lock_path, 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _contains(self, address_bytes):
+        if address_bytes in self._added:
+            return True
+        if not self._count:
+            return False
+        mapped = self._mmap
+        if self._bloom_bits:
+            for position in get_bloom_positions(address_bytes, self._hashes, self._bloom_bits):
+                if not mapped[HEADER.size + (position >> 3)] & (1 << (position & 7)):
+                    return False
+        prefix = address_bytes[0] << 8 | address_bytes[1]
+        low, high = PREFIX_BOUNDS.unpack_from(mapped, self._index_offset + prefix * 4)
+        offset = self._addresses_offset
+        while low < high:
+            middle = (low + high) // 2
+            start = offset + middle * ADDRESS_SIZE
+            candidate = mapped[start:start + ADDRESS_SIZE]
+            if candidate == address_bytes:
+                return True
+            if candidate < address_bytes:
+                low = middle + 1
+            else:
+                high = middle
+        return False
+
+    def _add_to_memory(self, address_bytes):
+        self._added.add(address_bytes)
+        if self._bloom_bits:
+            for position in get_bloom_positions(address_bytes, self._hashes, self._bloom_bits):
+                self._mmap[HEADER.size + (position >> 3)] |= 1 << (position & 7)
+
+    def _iterate_snapshot(self):
+        for start in range(self._addresses_offset, self._addresses_offset + self._count * ADDRESS_SIZE,
+                           ADDRESS_SIZE):
+            yield self._mmap[start:start + ADDRESS_SIZE]
+
+
+def write_snapshot(path, addresses, bits_per_address):
+    addresses = sorted(addresses)
+    bloom_size = (len(addresses) * bits_per_address + 7) // 8 if bits_per_address > 0 else 0
+    hashes = max(1, round(bits_per_address * math.log(2))) if bloom_size else 0
+    bloom = bytearray(bloom_size)
+    for address_bytes in addresses if bloom_size else []:
+        for position in get_bloom_positions(address_bytes, hashes, bloom_size * 8):
+            bloom[position >> 3] |= 1 << (position & 7)
+
+    prefix_index = [0] * 65537
+    for address_bytes in addresses:
+        prefix_index[(address_bytes[0] << 8 | address_bytes[1]) + 1] += 1
+    for prefix in range(65536):
+        prefix_index[prefix + 1] += prefix_index[prefix]
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    # written aside then renamed, a crash never leaves a cut file, the name is the writer's own
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temp_path, 'wb') as snapshot_file:
+        snapshot_file.write(HEADER.pack(MAGIC, len(addresses), bloom_size, hashes))
+        snapshot_file.write(bloom)
+        snapshot_file.write(PREFIX_INDEX.pack(*prefix_index))
+        snapshot_file.write(b''.join(addresses))
+    os.replace(temp_path, path)
+
+
+def get_bloom_positions(address_bytes, hashes, bits):
+    # vanity and precompile addresses aren't uniform, they are hashed first
+    digest = int.from_bytes(hashlib.blake2b(address_bytes, digest_size=16).digest(), 'little')
+    first = digest >> 64
+    second = digest | 1
+    return [(first + index * second) % bits for index in range(hashes)]
+
+
+def to_address_bytes(address):
+    """The 20 bytes of a hex address, None when it isn't one"""
+    if not isinstance(address, str) or len(address) != 42 or not address.startswith('0x'):
+        return None
+    try:
+        return bytes.fromhex(address[2:])
+    except ValueError:
+        return None
@@ -0,0 +1,217 @@
+import logging
+import random
+import threading
+from collections import OrderedDict
+
+from config.config import BalanceLedgerConfig
+from config.constant import LoggerConstant, WalletConstant
+
+logger = logging.getLogger(LoggerConstant.BalanceLedger)
+
+
+class BalanceLedger:
+    """Token balances by (address, token_address), each with the block at the end of which it is known.
+
+    A balance known at block A is still the balance before block B when every block in between was processed,
+    as long as the token balances only change with transfers, which isn't true of interest bearing, debt or
+    rebasing tokens. Balances of a batch of transfers are then derived by
+    applying the transfers in block and log order, the node is only asked for addresses it doesn't know yet
+    and for balances read from the node more than reconcile_blocks ago. With check_sample_rate, that share
+    of the derived balances is also read from the node and compared.
+    """
+    __instance = None
+
+    @staticmethod
+    def getInstance():
+        """ Static access method. """
+        if BalanceLedger.__instance == None:
+            BalanceLedger()
+        return BalanceLedger.__instance
+
+    def __init__(self, max_entries=BalanceLedgerConfig.MAX_ENTRIES,
+                 reconcile_blocks=BalanceLedgerConfig.RECONCILE_BLOCKS,
+                 check_sample_rate=BalanceLedgerConfig.CHECK_SAMPLE_RATE):
+        """ Virtually private constructor. """
+        if BalanceLedger.__instance != None:
+            raise Exception("This class is a singleton!")
+        else:
+            BalanceLedger.__instance = self
+        self.max_entries = int(max_entries)
+        self.reconcile_blocks = int(reconcile_blocks)
+        self.check_sample_rate = float(check_sample_rate)
+
+        self._lock = threading.Lock()
+        # (address, token_address) -> [balance, known at block, read from the node at block], the balance is None
+        # when a transfer of the address wasn't applied at that block
+        self._entries = OrderedDict()
+        # merged [start_block, end_block] ranges whose transfers were all applied
+        self._completed_ranges = []
+
+        self.derived = 0
+        self.fetched = 0
+        self.checked = 0
+        self.mismatches = 0
+
+    def get_pre_balances(self, transfers, start_block, end_block, get_balances):
+        """Balances of both sides before every transfer of a block range.
+
+        :param transfers: every (token_address, from_address, to_address, value, block_number, needed) of the
+            block range in block and log order, balances are only guaranteed for the needed ones
+        :param get_balances: resolves (token_address, address, block) lookups to balances from the node
+        :rtype: list of (pre_from_balance, pre_to_balance), None where the balance isn't known
+        """
+        first_blocks = {}
+        needed_keys = set()
+        for token_address, from_address, to_address, _, block_number, needed in transfers:
+            for address in (from_address, to_address):
+                if address == WalletConstant.address_nowhere:
+                    continue
+                key = (address, token_address)
+                first_blocks.setdefault(key, block_number)
+                if needed:
+                    needed_keys.add(key)
+
+        known = {}
+        stale = {}
+        sampled = {}
+        with self._lock:
+            for key in first_blocks:
+                entry = self._entries.get(key)
+                if entry is None or entry[0] is None or not self._is_valid_before(entry, start_block):
+                    continue
+                if start_block - 1 - entry[2] > self.reconcile_blocks:
+                    stale[key] = entry[0]
+                    continue
+                known[key] = entry[0]
+                if key in needed_keys and self.check_sample_rate and random.random() < self.check_sample_rate:
+                    sampled[key] = entry[0]
+
+        fetched_keys = [key for key in needed_keys if key not in known]
+        lookups = [(key[1], key[0], first_blocks[key] - 1) for key in fetched_keys + list(sampled)]
+        fetched = get_balances(lookups) if lookups else {}
+
+        balances = dict(known)
+        observed_blocks = {}
+        for key in fetched_keys:
+            balance = fetched.get((key[1], key[0], first_blocks[key] - 1))
+            balances[key] = balance
+            if balance is not None:
+                observed_blocks[key] = first_blocks[key] - 1
+            if key in stale:
+                self._compare(key, stale[key], balance)
+        for key, balance in sampled.items():
+            self._compare(key, balance, fetched.get((key[1], key[0], first_blocks[key] - 1)))
+
+        pre_balances = []
+        for token_address, from_address, to_address, value, _, _ in transfers:
+            from_key = (from_address, token_address)
+            pre_from_balance = balances.get(from_key)
+            if pre_from_balance is not None:
+                balances[from_key] = pre_from_balance - value
+            to_key = (to_address, token_address)
+            pre_to_balance = balances.get(to_key)
+            if pre_to_balance is not None:
+                balances[to_key] = pre_to_balance + value
+            pre_balances.append((pre_from_balance, pre_to_balance))
+
+        with self._lock:
+            self.derived += len([key for key in needed_keys if key in known])
+            self.fetched += len(fetched_keys)
+            for key in first_blocks:
+                entry = self._entries.get(key)
+                if entry is not None and entry[1] > end_block:
+                    # a later block range was already applied
+                    continue
+                balance = balances.get(key)
+                if balance is None or balance < 0:
+                    # a transfer of the range wasn't applied, kept so an earlier range can't set a balance either
+                    self._entries[key] = [None, end_block, None]
+                elif key in observed_blocks:
+                    self._entries[key] = [balance, end_block, observed_blocks[key]]
+                else:
+                    self._entries[key] = [balance, end_block, entry[2] if entry is not None else end_block]
+                self._entries.move_to_end(key)
+            self._add_completed_range(start_block, end_block)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        return pre_balances
+
+    def get_balance(self, address, token_address, block_number):
+        """The balance at the end of the block if the ledger knows it, None otherwise"""
+        with self._lock:
+            entry = self._entries.get((address, token_address))
+            if entry is None or entry[0] is None or not self._is_valid_before(entry, block_number + 1):
+                return None
+            return entry[0]
+
+    def observe(self, address, token_address, block_number, balance):
+        """Records a balance read from the node at the end of the block"""
+        if balance is None:
+            return
+        key = (address, token_address)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] >= block_number:
+                return
+            self._entries[key] = [balance, block_number, block_number]
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def rollback(self, block_number):
+        """Forgets what was learnt from the blocks after block_number, a reorg orphaned them"""
+        with self._lock:
+            for key in [key for key, entry in self._entries.items() if entry[1] > block_number]:
+                del self._entries[key]
+            self._completed_ranges = [[start_block, min(end_block, block_number)]
+                                      for start_block, end_block in self._completed_ranges
+                                      if start_block <= block_number]
+
+    def get_stats(self):
+        with self._lock:
+            resolved = self.derived + self.fetched
+            return {
+                'entries': len(self._entries),
+                'derived': self.derived,
+                'fetched': self.fetched,
+                'derived_rate': round(self.derived / resolved, 3) if resolved else None,
+                'checked': self.checked,
+                'mismatches': self.mismatches,
+            }
+
+    def log_stats(self):
+        logger.info(f"Balance ledger {self.get_stats()}")
+
+    def _compare(self, key, ledger_balance, node_balance):
+        if node_balance is None:
+            return
+        with self._lock:
+            self.checked += 1
+            if ledger_balance == node_balance:
+                return
+            self.mismatches += 1
+        logger.warning(f"Balance of {key[0]} for token {key[1]} is {ledger_balance} in the ledger "
+                       f"and {node_balance} on the node")
+
+    def _is_valid_before(self, entry, block_number):
+        # every block between the one the balance is known at and block_number was applied
+        known_block = entry[1]
+        if known_block >= block_number:
+            return False
+        if known_block + 1 > block_number - 1:
+            return True
+        for start_block, end_block in self._completed_ranges:
+            if start_block <= known_block + 1 <= end_block:
+                return end_block >= block_number - 1
+        return False
+
+    def _add_completed_range(self, start_block, end_block):
+        ranges = sorted(self._completed_ranges + [[start_block, end_block]])
+        merged = [ranges[0]]
+        for start, end in ranges[1:]:
+            if start <= merged[-1][1] + 1:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        self._completed_ranges = merged
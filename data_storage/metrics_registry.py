@@ -0,0 +1,253 @@
+import threading
+from bisect import bisect_left
+
+from config.config import TestPerformanceConfig
+from utils.boolean_utils import to_bool
+
+# seconds, from a cached RPC answer to a slow eth_getLogs or bulk write
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+
+class MetricsRegistry:
+    """Counters, gauges and histograms of the process, exported in the Prometheus text format.
+
+    Metrics are registered once by name, registering a name again returns the same metric. Nothing is recorded
+    when the registry is disabled, recording then costs a single attribute check.
+    """
+    __instance = None
+
+    @staticmethod
+    def getInstance():
+        """ Static access method. """
+        if MetricsRegistry.__instance == None:
+            MetricsRegistry()
+        return MetricsRegistry.__instance
+
+    def __init__(self):
+        """ Virtually private constructor. """
+        if MetricsRegistry.__instance != None:
+            raise Exception("This class is a singleton!")
+        else:
+            MetricsRegistry.__instance = self
+        self.enabled = to_bool(TestPerformanceConfig.CALCULATE_PERFORMANCE)
+        self._lock = threading.Lock()
+        self._metrics = {}
+
+    def counter(self, name, documentation, label_names=()):
+        return self._register(Counter, name, documentation, label_names)
+
+    def gauge(self, name, documentation, label_names=()):
+        return self._register(Gauge, name, documentation, label_names)
+
+    def histogram(self, name, documentation, label_names=(), buckets=DEFAULT_BUCKETS):
+        return self._register(Histogram, name, documentation, label_names, buckets=buckets)
+
+    def set_enabled(self, enabled=True):
+        self.enabled = enabled
+
+    def get_metrics(self):
+        with self._lock:
+            return list(self._metrics.values())
+
+    def to_prometheus_text(self):
+        lines = []
+        for metric in self.get_metrics():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.extend(metric.to_prometheus_lines())
+        return '\n'.join(lines) + '\n'
+
+    def _register(self, metric_class, name, documentation, label_names, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = metric_class(self, name, documentation, tuple(label_names), **kwargs)
+                self._metrics[name] = metric
+            elif not isinstance(metric, metric_class) or metric.label_names != tuple(label_names):
+                raise ValueError(f"Metric {name} is already registered as a {metric.type} of {metric.label_names}")
+            return metric
+
+
+class _Metric:
+    type = None
+
+    def __init__(self, registry, name, documentation, label_names):
+        self.registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self._lock = threading.Lock()
+        self._children = {}
+
+    def labels(self, *label_values):
+        """The child of the label values, keep it to record without looking it up again"""
+        label_values = tuple(str(value) for value in label_values)
+        if len(label_values) != len(self.label_names):
+            raise ValueError(f"Metric {self.name} has labels {self.label_names}, got {label_values}")
+        with self._lock:
+            child = self._children.get(label_values)
+            if child is None:
+                child = self._create_child()
+                self._children[label_values] = child
+            return child
+
+    def get_children(self):
+        with self._lock:
+            return list(self._children.items())
+
+    def to_prometheus_lines(self):
+        lines = []
+        for label_values, child in self.get_children():
+            lines.extend(child.to_prometheus_lines(self.name, self._format_labels(label_values)))
+        return lines
+
+    def _format_labels(self, label_values, extra=()):
+        pairs = list(zip(self.label_names, label_values)) + list(extra)
+        if not pairs:
+            return ''
+        return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+    def _create_child(self):
+        raise NotImplementedError()
+
+
+class Counter(_Metric):
+    type = 'counter'
+
+    def inc(self, value=1):
+        """Counter without labels"""
+        self.labels().inc(value)
+
+    def _create_child(self):
+        return _CounterChild(self.registry)
+
+
+class Gauge(_Metric):
+    type = 'gauge'
+
+    def set(self, value):
+        """Gauge without labels"""
+        self.labels().set(value)
+
+    def _create_child(self):
+        return _GaugeChild(self.registry)
+
+
+class Histogram(_Metric):
+    type = 'histogram'
+
+    def __init__(self, registry, name, documentation, label_names, buckets=DEFAULT_BUCKETS):
+        super().__init__(registry, name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value):
+        """Histogram without labels"""
+        self.labels().observe(value)
+
+    def to_prometheus_lines(self):
+        lines = []
+        for label_values, child in self.get_children():
+            bucket_counts, total, count = child.get()
+            cumulative = 0
+            for upper_bound, bucket_count in zip(self.buckets + (float('inf'),), bucket_counts):
+                cumulative += bucket_count
+                labels = self._format_labels(label_values, [('le', _format_value(upper_bound))])
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = self._format_labels(label_values)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+    def _create_child(self):
+        return _HistogramChild(self.registry, self.buckets)
+
+
+class _CounterChild:
+    def __init__(self, registry):
+        self._registry = registry
+        self._lock = threading.Lock()
+        self._value = 0
+
+    def inc(self, value=1):
+        if not self._registry.enabled:
+            return
+        with self._lock:
+            self._value += value
+
+    def get(self):
+        return self._value
+
+    def to_prometheus_lines(self, name, labels):
+        return [f"{name}{labels} {_format_value(self._value)}"]
+
+
+class _GaugeChild:
+    def __init__(self, registry):
+        self._registry = registry
+        self._value = 0
+
+    def set(self, value):
+        if not self._registry.enabled:
+            return
+        self._value = value
+
+    def get(self):
+        return self._value
+
+    def to_prometheus_lines(self, name, labels):
+        return [f"{name}{labels} {_format_value(self._value)}"]
+
+
+class _HistogramChild:
+    def __init__(self, registry, buckets):
+        self._registry = registry
+        self._buckets = buckets
+        self._lock = threading.Lock()
+        # the last count is the +Inf bucket
+        self._bucket_counts = [0] * (len(buckets) + 1)
+        self._sum = 0.0
+        self._count = 0
+
+    def observe(self, value):
+        if not self._registry.enabled:
+            return
+        index = bisect_left(self._buckets, value)
+        with self._lock:
+            self._bucket_counts[index] += 1
+            self._sum += value
+            self._count += 1
+
+    def get(self):
+        """(bucket counts, not cumulative, sum, count)"""
+        with self._lock:
+            return list(self._bucket_counts), self._sum, self._count
+
+
+def get_quantile(buckets, bucket_counts, quantile):
+    """Estimates a quantile from bucket counts like histogram_quantile, interpolating inside the bucket"""
+    count = sum(bucket_counts)
+    if not count:
+        return None
+    rank = quantile * count
+    cumulative = 0
+    for index, bucket_count in enumerate(bucket_counts):
+        if cumulative + bucket_count >= rank and bucket_count:
+            if index == len(buckets):
+                # above the highest bucket, its bound is the best known
+                return buckets[-1]
+            lower_bound = buckets[index - 1] if index else 0
+            return lower_bound + (buckets[index] - lower_bound) * (rank - cumulative) / bucket_count
+        cumulative += bucket_count
+    return buckets[-1]
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _escape(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
@@ -0,0 +1,108 @@
+import json
+import logging
+import os
+import threading
+import time
+
+from config.config import TokenMetadataConfig
+from config.constant import LoggerConstant
+from ethereumetl.domain.token import EthToken
+from utils.resource_utils import get_root_path
+
+logger = logging.getLogger(LoggerConstant.TokenMetadataRegistry)
+
+
+class TokenMetadataRegistry:
+    """Symbols, names and decimals of the tokens, with their last total supply, kept in a JSON file.
+
+    The metadata of a token never changes once deployed, so it's only asked for tokens the registry doesn't know.
+    Only the total supplies are refreshed, every refresh_seconds, the time of the last refresh is kept with them
+    so a restart doesn't refresh them again.
+    """
+    __instance = None
+
+    @staticmethod
+    def getInstance():
+        """ Static access method. """
+        if TokenMetadataRegistry.__instance == None:
+            TokenMetadataRegistry()
+        return TokenMetadataRegistry.__instance
+
+    def __init__(self, path=TokenMetadataConfig.FILE, refresh_seconds=TokenMetadataConfig.REFRESH_SECONDS):
+        """ Virtually private constructor. """
+        if TokenMetadataRegistry.__instance != None:
+            raise Exception("This class is a singleton!")
+        else:
+            TokenMetadataRegistry.__instance = self
+        self.path = get_root_path(path)
+        self.refresh_seconds = int(refresh_seconds)
+
+        self._lock = threading.Lock()
+        # token address -> {symbol, name, decimals, total_supply}
+        self._tokens = {}
+        self.refreshed_at = 0
+        self._load()
+
+    def get_token(self, token_address):
+        """The token with what is known of it, None when the registry doesn't know the token"""
+        with self._lock:
+            entry = self._tokens.get(token_address.lower())
+            if entry is None:
+                return None
+            token = EthToken()
+            token.address = token_address.lower()
+            token.symbol = entry['symbol']
+            token.name = entry['name']
+            token.decimals = entry['decimals']
+            token.total_supply = entry['total_supply']
+            return token
+
+    def get_missing(self, token_addresses):
+        with self._lock:
+            return [token_address for token_address in token_addresses if token_address.lower() not in self._tokens]
+
+    def get_seconds_to_refresh(self):
+        """Seconds until the total supplies are due for a refresh, 0 when they are already"""
+        return max(0, self.refreshed_at + self.refresh_seconds - time.time())
+
+    def set_metadata(self, token_address, symbol, name, decimals):
+        if symbol is None and name is None and decimals is None:
+            # not a token, or the node failed, asked again next time
+            return
+        with self._lock:
+            entry = self._tokens.setdefault(token_address.lower(), {'total_supply': None})
+            entry.update(symbol=symbol, name=name, decimals=decimals)
+
+    def set_total_supplies(self, total_supplies):
+        with self._lock:
+            for token_address, total_supply in total_supplies.items():
+                entry = self._tokens.get(token_address.lower())
+                if entry is not None and total_supply is not None:
+                    entry['total_supply'] = total_supply
+            self.refreshed_at = time.time()
+
+    def save(self):
+        with self._lock:
+            registry = {'refreshed_at': self.refreshed_at,
+                        'tokens': {token_address: dict(entry) for token_address, entry in self._tokens.items()}}
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # written aside then renamed, a crash never leaves a cut file, the name is the writer's own
+        temp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'w') as registry_file:
+            json.dump(registry, registry_file)
+        os.replace(temp_path, self.path)
+
+    def _load(self):
+        if not self.path or not os.path.isfile(self.path):
+            return
+        try:
+            with open(self.path) as registry_file:
+                registry = json.load(registry_file)
+        except ValueError:
+            logger.warning(f"Ignoring the unreadable token metadata of {self.path}")
+            return
+        self._tokens = registry['tokens']
+        self.refreshed_at = registry['refreshed_at']
+        logger.info(f"Loaded the metadata of {len(self._tokens)} tokens from {self.path}")
@@ -1,4 +1,10 @@
+from config.config import FilterConfig
+from data_storage.address_set import MappedAddressSet
+from utils.resource_utils import get_root_path
+
+
 class WalletFilterMemoryStorage:
+    """Addresses of the wallets the lending filter lets through, in a memory mapped snapshot"""
     __instance = None
 
     @staticmethod
@@ -8,22 +14,33 @@ class WalletFilterMemoryStorage:
             WalletFilterMemoryStorage()
         return WalletFilterMemoryStorage.__instance
 
-    def __init__(self):
+    def __init__(self, path=FilterConfig.WALLET_FILTER_FILE,
+                 bits_per_address=FilterConfig.WALLET_FILTER_BLOOM_BITS_PER_ADDRESS):
         """ Virtually private constructor. """
         if WalletFilterMemoryStorage.__instance != None:
             raise Exception("This class is a singleton!")
         else:
             WalletFilterMemoryStorage.__instance = self
-        self.storage = {}
+        self.storage = MappedAddressSet(get_root_path(path), bits_per_address)
+        self.storage.load()
+
+    def has_snapshot(self):
+        return self.storage.has_snapshot()
+
+    def build(self, addresses):
+        self.storage.build(addresses)
+
+    def build_if_missing(self, get_addresses):
+        return self.storage.build_if_missing(get_addresses)
 
-    def set(self, key, value):
-        self.storage[key] = value
+    def add(self, address):
+        self.storage.add(address)
 
-    def get(self, key):
-        return self.storage.get(key)
+    def contains(self, address):
+        return self.storage.contains(address)
 
-    def get_keys(self):
-        return self.storage.keys()
+    def __len__(self):
+        return len(self.storage)
 
 
 class WalletInMemory:
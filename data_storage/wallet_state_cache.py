@@ -0,0 +1,89 @@
+import logging
+import threading
+from collections import OrderedDict
+
+from config.constant import WalletConstant
+
+logger = logging.getLogger("WalletStateCache")
+
+
+class WalletStateCache:
+    """Write-behind cache of wallet documents with LRU eviction.
+
+    Balance, supply and borrow updates are merged into the cached document and only wallets whose
+    maps or block number actually changed are written back, once per flush. A wallet missing from the cache
+    is loaded from the database, so a restarted process continues from what was last flushed.
+    """
+
+    def __init__(self, database, max_size=100000):
+        self.database = database
+        self.max_size = max_size
+        self._wallets = OrderedDict()
+        self._dirty = set()
+        self._lock = threading.RLock()
+
+    def update(self, address, unit_token, balance, supply=None, borrow=None, block_number=None):
+        """Merges a wallet update and returns copies of its balance, supply and borrow maps"""
+        with self._lock:
+            wallet = self._get(address)
+            balances = wallet.setdefault(WalletConstant.balances, {})
+            supplies = wallet.setdefault(WalletConstant.supply, {})
+            borrows = wallet.setdefault(WalletConstant.borrow, {})
+
+            changed = _set_if_changed(balances, unit_token, balance)
+            if supply:
+                changed = _set_if_changed(supplies, unit_token, supply) or changed
+            if borrow:
+                changed = _set_if_changed(borrows, unit_token, borrow) or changed
+            if block_number is not None:
+                changed = _set_if_changed(wallet, WalletConstant.at_block_number, block_number) or changed
+
+            if changed:
+                self._dirty.add(address)
+            return dict(balances), dict(supplies), dict(borrows)
+
+    def flush(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            wallets = [self._wallets[address] for address in self._dirty if address in self._wallets]
+            self.database.replace_wallets(wallets)
+            logger.debug(f"Flushed {len(wallets)} wallets")
+            self._dirty = set()
+
+    def clear(self):
+        """Drops the cached wallets, without writing them, so they are loaded again from the database"""
+        with self._lock:
+            self._wallets = OrderedDict()
+            self._dirty = set()
+
+    def _get(self, address):
+        wallet = self._wallets.get(address)
+        if wallet is not None:
+            self._wallets.move_to_end(address)
+            return wallet
+
+        wallet = self.database.find_wallet(address)
+        if not wallet:
+            wallet = {WalletConstant.address: address}
+            self._dirty.add(address)
+        self._wallets[address] = wallet
+        self._evict()
+        return wallet
+
+    def _evict(self):
+        evicted = []
+        while len(self._wallets) > self.max_size:
+            address, wallet = self._wallets.popitem(last=False)
+            if address in self._dirty:
+                self._dirty.discard(address)
+                evicted.append(wallet)
+        if evicted:
+            self.database.replace_wallets(evicted)
+
+
+def _set_if_changed(mapping, key, value):
+    if mapping.get(key) == value:
+        return False
+    mapping[key] = value
+    return True
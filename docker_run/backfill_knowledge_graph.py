@@ -0,0 +1,52 @@
+import os
+import sys
+
+TOP_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, os.path.join(TOP_DIR, './'))
+
+from services.log_services import config_log
+import logging
+
+from config.config import BuildKnowledgeGraphConfig, BackfillConfig, FilterConfig
+from ethereumetl.executors.partition_process_executor import PartitionManifest, PartitionProcessExecutor
+from ethereumetl.service.eth_service import get_latest_block
+from ethereumetl.streaming.eth_knowledge_graph_streamer_adapter import load_wallet_filter
+from ethereumetl.streaming.knowledge_graph_backfill import init_backfill_process, export_backfill_partition
+from services.partition_service import get_partitions
+from utils.boolean_utils import to_bool
+from utils.process_limits import RPC, MONGO
+
+if __name__ == '__main__':
+    ### get environment variables
+
+    provider_uri = str(BuildKnowledgeGraphConfig.PROVIDER_URI)
+    batch_size = int(BuildKnowledgeGraphConfig.BATCH_SIZE)
+    max_workers = int(BuildKnowledgeGraphConfig.MAX_WORKERS)
+    tokens_filter_file = str(BuildKnowledgeGraphConfig.TOKENS_FILTER_FILE)
+    event_abi_dir = str(BuildKnowledgeGraphConfig.EVENT_ABI_DIR)
+    output = str(BuildKnowledgeGraphConfig.OUTPUT)
+    start = str(BackfillConfig.START_BLOCK)
+    end = BackfillConfig.END_BLOCK
+    partition_size = int(BackfillConfig.PARTITION_SIZE)
+    processes = int(BackfillConfig.PROCESSES)
+
+    cur_path = os.path.dirname(os.path.realpath(__file__)) + "/../"
+
+    config_log(level=logging.INFO)
+    if not end:
+        end = get_latest_block(provider_uri)
+    logging.info(f'Backfilling {start}-{end} with {processes} processes using {provider_uri}')
+
+    # start and end are block numbers, dates or unix times like for get_partitions
+    partitions = get_partitions(start, str(end), partition_size, provider_uri)
+    # built here once, the processes only map the snapshot
+    load_wallet_filter(to_bool(FilterConfig.FILTER_FOR_LENDING))
+    executor = PartitionProcessExecutor(
+        max_processes=processes,
+        manifest=PartitionManifest(cur_path + str(BackfillConfig.MANIFEST_FILE)),
+        limits={RPC: BackfillConfig.MAX_RPC_REQUESTS, MONGO: BackfillConfig.MAX_MONGO_WRITES},
+        initializer=init_backfill_process,
+        initargs=(provider_uri, output, batch_size, max_workers, tokens_filter_file, event_abi_dir, processes)
+    )
+    failed = executor.execute(partitions, export_backfill_partition)
+    sys.exit(1 if failed else 0)
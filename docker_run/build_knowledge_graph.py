@@ -8,14 +8,18 @@ from services.log_services import config_log
 import logging
 from os import path
 
-from config.config import BuildKnowledgeGraphConfig
+from config.config import BuildKnowledgeGraphConfig, MetricsConfig, StreamerConfig
 from ethereumetl.service.eth_service import get_latest_block
 from blockchainetl.streaming.streaming_utils import configure_signals, configure_logging
 from ethereumetl.providers.auto import get_provider_from_uri
 from ethereumetl.streaming.eth_knowledge_graph_streamer_adapter import EthKnowledgeGraphStreamerAdapter
 from ethereumetl.thread_local_proxy import ThreadLocalProxy
 from ethereumetl.streaming.item_exporter_creator import create_item_exporter
+from blockchainetl.streaming.block_window_controller import BlockWindowController
 from blockchainetl.streaming.streamer import Streamer
+from ethereumetl.streaming.new_heads_tip_waiter import create_tip_waiter
+from services.metrics_service import start_metrics_server
+from utils.boolean_utils import to_bool
 
 if __name__ == '__main__':
     ### get environment variables
@@ -31,6 +35,7 @@ if __name__ == '__main__':
     block_batch_size = int(BuildKnowledgeGraphConfig.BLOCK_BATCH_SIZE)
     tokens_filter_file = str(BuildKnowledgeGraphConfig.TOKENS_FILTER_FILE)
     event_abi_dir = str(BuildKnowledgeGraphConfig.EVENT_ABI_DIR)
+    output = str(BuildKnowledgeGraphConfig.OUTPUT)
 
     # configure_logging(log_file)
     # logging_debug_config()
@@ -40,9 +45,8 @@ if __name__ == '__main__':
 
     cur_path = os.path.dirname(os.path.realpath(__file__)) + "/../"
 
-    # TODO: Implement fallback mechanism for provider uris instead of picking randomly
+    # a comma separated provider uri is load balanced by the provider pool of get_provider_from_uri
     # check provider is can connect
-    output = "knowledge_graph"
 
     last_synced_block_file = cur_path + "data/last_synced_block.txt"
     if path.exists(last_synced_block_file):
@@ -52,6 +56,14 @@ if __name__ == '__main__':
 
     config_log(level=logging.INFO)
     logging.info('Using ' + provider_uri)
+    if MetricsConfig.PORT:
+        start_metrics_server(MetricsConfig.PORT)
+
+    reorg_depth = int(StreamerConfig.REORG_DEPTH)
+    item_exporter = create_item_exporter(output)
+    if reorg_depth and hasattr(item_exporter, 'create_rollback_indexes'):
+        # the rollbacks of reorgs query block ranges
+        item_exporter.create_rollback_indexes()
 
     streamer_adapter = EthKnowledgeGraphStreamerAdapter(
         provider_uri=provider_uri,
@@ -59,10 +71,19 @@ if __name__ == '__main__':
         tokens=None,
         event_abi_dir=event_abi_dir,
         batch_web3_provider=ThreadLocalProxy(lambda: get_provider_from_uri(provider_uri, batch=False)),
-        item_exporter=create_item_exporter(output),
+        item_exporter=item_exporter,
         batch_size=batch_size,
         max_workers=max_workers
     )
+    window_controller = None
+    if to_bool(StreamerConfig.ADAPTIVE_WINDOW):
+        window_controller = BlockWindowController(
+            min_size=block_batch_size,
+            max_size=int(StreamerConfig.MAX_WINDOW),
+            target_seconds_per_block=float(StreamerConfig.TARGET_SECONDS_PER_BLOCK),
+            tip_distance=int(StreamerConfig.TIP_DISTANCE),
+            max_cycle_seconds=float(StreamerConfig.MAX_CYCLE_SECONDS)
+        )
     streamer = Streamer(
         blockchain_streamer_adapter=streamer_adapter,
         last_synced_block_file=last_synced_block_file,
@@ -70,6 +91,9 @@ if __name__ == '__main__':
         start_block=start_block,
         period_seconds=period_seconds,
         block_batch_size=block_batch_size,
-        pid_file=pid_file
+        pid_file=pid_file,
+        window_controller=window_controller,
+        tip_waiter=create_tip_waiter(provider_uri, float(StreamerConfig.MIN_POLL_SECONDS), period_seconds),
+        reorg_depth=reorg_depth
     )
     streamer.stream()
@@ -0,0 +1,74 @@
+"""
+Copies the events and token transfers of the per_contract layout, one collection per contract, into the events
+collection of the single layout. Set MONGO_EVENTS_LAYOUT=single once it's done.
+
+    python docker_run/migrate_event_collections.py [--drop]
+
+Documents keep their _id, so running it again after an interruption skips what was already copied. With --drop,
+the collection of a contract is dropped once the events collection holds as many of its documents.
+"""
+
+import os
+import sys
+
+TOP_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, os.path.join(TOP_DIR, './'))
+
+import logging
+import time
+
+from pymongo.errors import BulkWriteError
+
+from blockchainetl.jobs.exporters.databasse.mongo_db import Database
+from config.constant import EventsLayoutConstant, TokenConstant
+from services.log_services import config_log
+
+logger = logging.getLogger('migrate_event_collections')
+
+batch_size = 1000
+DUPLICATE_KEY_ERROR = 11000
+
+
+def insert_batch(events_collection, documents):
+    """Inserts the documents, those copied by a previous run are skipped, returns how many were inserted"""
+    try:
+        return len(events_collection.insert_many(documents, ordered=False).inserted_ids)
+    except BulkWriteError as e:
+        if any(error.get('code') != DUPLICATE_KEY_ERROR for error in e.details.get('writeErrors', [])):
+            raise
+        return e.details.get('nInserted', 0)
+
+
+def migrate_collection(data_base, collection, drop):
+    start = time.time()
+    inserted = 0
+    batch = []
+    for document in collection.find({}):
+        document.setdefault(TokenConstant.contract_address, collection.name)
+        batch.append(document)
+        if len(batch) >= batch_size:
+            inserted += insert_batch(data_base.mongo_events, batch)
+            batch = []
+    if batch:
+        inserted += insert_batch(data_base.mongo_events, batch)
+
+    number_of_documents = collection.count_documents({})
+    number_of_events = data_base.mongo_events.count_documents({TokenConstant.contract_address: collection.name})
+    logger.info(f"{collection.name}: {number_of_documents} documents, {inserted} copied, "
+                f"{number_of_events} in the events collection, {round(time.time() - start, 1)}s")
+    if not drop:
+        return
+    if number_of_events < number_of_documents:
+        logger.warning(f"Keeping {collection.name}, the events collection misses some of its documents")
+        return
+    collection.drop()
+
+
+if __name__ == '__main__':
+    config_log(level=logging.INFO)
+    drop = '--drop' in sys.argv[1:]
+    data_base = Database(bulk_write=False, events_layout=EventsLayoutConstant.single)
+    names = sorted(data_base.get_token_collection_names())
+    logger.info(f"Migrating {len(names)} contract collections to {data_base.mongo_events.name}")
+    for name in names:
+        migrate_collection(data_base, data_base.mongo_db[name], drop)
@@ -22,6 +22,11 @@
 
 
 class EthBlock(object):
+    __slots__ = (
+        'number', 'hash', 'parent_hash', 'nonce', 'sha3_uncles', 'logs_bloom', 'transactions_root', 'state_root',
+        'receipts_root', 'miner', 'difficulty', 'total_difficulty', 'size', 'extra_data', 'gas_limit', 'gas_used',
+        'timestamp', 'transactions', 'transaction_count')
+
     def __init__(self):
         self.number = None
         self.hash = None
@@ -22,6 +22,8 @@
 
 
 class EthContract(object):
+    __slots__ = ('address', 'bytecode', 'function_sighashes', 'is_erc20', 'is_erc721', 'block_number')
+
     def __init__(self):
         self.address = None
         self.bytecode = None
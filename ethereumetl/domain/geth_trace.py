@@ -22,6 +22,8 @@
 
 
 class EthGethTrace(object):
+    __slots__ = ('block_number', 'transaction_traces')
+
     def __init__(self):
         self.block_number = None
         self.transaction_traces = None
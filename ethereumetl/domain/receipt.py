@@ -22,6 +22,10 @@
 
 
 class EthReceipt(object):
+    __slots__ = (
+        'transaction_hash', 'transaction_index', 'block_hash', 'block_number', 'cumulative_gas_used', 'gas_used',
+        'contract_address', 'logs', 'root', 'status')
+
     def __init__(self):
         self.transaction_hash = None
         self.transaction_index = None
@@ -22,6 +22,10 @@
 
 
 class EthReceiptLog(object):
+    __slots__ = (
+        'log_index', 'transaction_hash', 'transaction_index', 'block_hash', 'block_number', 'address', 'data',
+        'topics')
+
     def __init__(self):
         self.log_index = None
         self.transaction_hash = None
@@ -22,6 +22,8 @@
 
 
 class EthToken(object):
+    __slots__ = ('address', 'symbol', 'name', 'decimals', 'total_supply', 'block_number')
+
     def __init__(self):
         self.address = None
         self.symbol = None
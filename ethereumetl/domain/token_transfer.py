@@ -22,6 +22,9 @@
 
 
 class EthTokenTransfer(object):
+    __slots__ = (
+        'token_address', 'from_address', 'to_address', 'value', 'transaction_hash', 'log_index', 'block_number')
+
     def __init__(self):
         self.token_address = None
         self.from_address = None
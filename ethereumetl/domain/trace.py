@@ -22,6 +22,11 @@
 
 
 class EthTrace(object):
+    __slots__ = (
+        'block_number', 'transaction_hash', 'transaction_index', 'from_address', 'to_address', 'value', 'input',
+        'output', 'trace_type', 'call_type', 'reward_type', 'gas', 'gas_used', 'subtraces', 'trace_address', 'error',
+        'status', 'trace_id')
+
     def __init__(self):
         self.block_number = None
         self.transaction_hash = None
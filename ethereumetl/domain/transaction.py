@@ -22,11 +22,16 @@
 
 
 class EthTransaction(object):
+    __slots__ = (
+        'hash', 'nonce', 'block_hash', 'block_number', 'block_timestamp', 'transaction_index', 'from_address',
+        'to_address', 'value', 'gas', 'gas_price', 'input')
+
     def __init__(self):
         self.hash = None
         self.nonce = None
         self.block_hash = None
         self.block_number = None
+        self.block_timestamp = None
         self.transaction_index = None
         self.from_address = None
         self.to_address = None
@@ -0,0 +1,109 @@
+import json
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from utils.process_limits import set_process_limits
+
+logger = logging.getLogger('PartitionProcessExecutor')
+
+
+class PartitionManifest:
+    """Append only JSON lines file of the completed (start_block, end_block) partitions"""
+
+    def __init__(self, path):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def get_completed(self):
+        completed = set()
+        if not os.path.exists(self.path):
+            return completed
+        with open(self.path) as manifest_file:
+            for line in manifest_file:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # the last line of a crashed run may be cut
+                    continue
+                completed.add((entry['start_block'], entry['end_block']))
+        return completed
+
+    def mark_completed(self, start_block, end_block, partition_dir, seconds):
+        entry = {'start_block': start_block, 'end_block': end_block, 'partition_dir': partition_dir,
+                 'seconds': round(seconds, 3), 'completed_at': int(time.time())}
+        with open(self.path, 'a') as manifest_file:
+            manifest_file.write(json.dumps(entry) + '\n')
+            manifest_file.flush()
+            os.fsync(manifest_file.fileno())
+
+
+class PartitionProcessExecutor:
+    """Exports partitions in a pool of processes and records the completed ones in a manifest.
+
+    Partitions already in the manifest are skipped, so a crashed or stopped run resumes with the unfinished
+    ones. Only this process writes the manifest, a partition is recorded once its export returned. limits maps
+    the names of utils.process_limits to the number of holders allowed at a time over all the processes.
+    """
+
+    def __init__(self, max_processes, manifest, limits=None, initializer=None, initargs=()):
+        self.max_processes = max_processes
+        self.manifest = manifest
+        # spawned processes don't inherit the sockets, threads and locks of this one
+        self._context = multiprocessing.get_context('spawn')
+        self._limits = {name: self._context.BoundedSemaphore(int(value)) for name, value in (limits or {}).items()}
+        self._initializer = initializer
+        self._initargs = initargs
+
+    def execute(self, partitions, export_partition):
+        """export_partition is called with a (start_block, end_block, partition_dir) partition in a pool process.
+
+        :return: the partitions that failed
+        """
+        completed = self.manifest.get_completed()
+        partitions = list(partitions)
+        pending = [partition for partition in partitions if (partition[0], partition[1]) not in completed]
+        logger.info(f"{len(pending)} partitions to export, {len(partitions) - len(pending)} already completed")
+        if not pending:
+            return []
+
+        failed = []
+        start = time.time()
+        exported_blocks = 0
+        with ProcessPoolExecutor(max_workers=min(self.max_processes, len(pending)), mp_context=self._context,
+                                 initializer=_init_process,
+                                 initargs=(self._limits, self._initializer, self._initargs)) as executor:
+            futures = {executor.submit(_export, export_partition, partition): partition for partition in pending}
+            for index, future in enumerate(as_completed(futures)):
+                start_block, end_block, partition_dir = futures[future]
+                try:
+                    seconds = future.result()
+                except Exception as e:
+                    logger.error(f"Exporting partition {start_block}-{end_block} failed: {e!r}")
+                    failed.append(futures[future])
+                    continue
+                self.manifest.mark_completed(start_block, end_block, partition_dir, seconds)
+                exported_blocks += end_block - start_block + 1
+                elapsed = time.time() - start
+                logger.info(f"Exported partition {start_block}-{end_block} in {round(seconds, 1)}s, "
+                            f"{index + 1}/{len(pending)} partitions done, "
+                            f"{round(exported_blocks / elapsed, 1)} blocks/s")
+        if failed:
+            logger.error(f"{len(failed)} partitions failed, they are exported again by the next run")
+        return failed
+
+
+def _init_process(limits, initializer, initargs):
+    set_process_limits(limits)
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def _export(export_partition, partition):
+    start = time.time()
+    export_partition(partition)
+    return time.time() - start
@@ -0,0 +1,80 @@
+import logging
+import queue
+import threading
+
+logger = logging.getLogger('PipelineExecutor')
+
+_END = object()
+
+
+class PipelineExecutor:
+    """Runs work items through stages connected by bounded queues, one thread per stage.
+
+    While a stage works on an item, the previous stage already works on the next one, so the run time per
+    item drops toward the slowest stage. Every stage handles the items one by one in input order.
+    """
+
+    def __init__(self, stages, queue_size=2):
+        self.stages = stages
+        self.queue_size = queue_size
+        self._error = None
+        self._failed = threading.Event()
+
+    def execute(self, work_iterable):
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in self.stages]
+        threads = []
+        for index, stage in enumerate(self.stages):
+            output_queue = queues[index + 1] if index + 1 < len(queues) else None
+            thread = threading.Thread(target=self._run_stage, args=(stage, queues[index], output_queue),
+                                      name=f'PipelineStage-{index}', daemon=True)
+            thread.start()
+            threads.append(thread)
+
+        for work_item in work_iterable:
+            if not self._put(queues[0], work_item):
+                break
+        self._put(queues[0], _END)
+
+        for thread in threads:
+            thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def _run_stage(self, stage, input_queue, output_queue):
+        while True:
+            item = self._get(input_queue)
+            if item is _END:
+                break
+            try:
+                result = stage(item)
+            except Exception as e:
+                logger.exception('An exception occurred in a pipeline stage.')
+                if self._error is None:
+                    self._error = e
+                self._failed.set()
+                break
+            if output_queue is not None and not self._put(output_queue, result):
+                break
+        if output_queue is not None:
+            self._put(output_queue, _END)
+
+    def _put(self, target_queue, item):
+        # fails fast instead of blocking on a full queue once a stage failed, the end marker still goes through
+        while True:
+            if self._failed.is_set() and item is not _END:
+                return False
+            try:
+                target_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                if self._failed.is_set() and item is _END:
+                    return False
+
+    def _get(self, source_queue):
+        while True:
+            if self._failed.is_set():
+                return _END
+            try:
+                return source_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
@@ -28,22 +28,26 @@ from web3 import Web3
 
 from blockchainetl.jobs.base_job import BaseJob
 from config.config import FilterConfig
-from config.constant import LoggerConstant, TransactionConstant, TokenConstant, TestPerformanceConstant
-from data_storage.memory_storage_test_performance import MemoryStoragePerformance
+from config.constant import LoggerConstant, TransactionConstant, TokenConstant, WalletConstant
 from data_storage.wallet_filter_storage import WalletFilterMemoryStorage
 from data_storage.wallet_storage import WalletMemoryStorage
 from ethereumetl.executors.batch_work_executor import BatchWorkExecutor
 from ethereumetl.mappers.block_mapper import EthBlockMapper
-from ethereumetl.mappers.transaction_mapper import EthTransactionMapper
 from ethereumetl.mappers.wallet_mapper import get_wallet_dict
 from ethereumetl.service.eth_service import EthService
 from services.json_rpc_requests import generate_get_block_by_number_json_rpc
-from services.wallet_services import get_balance_at_block, update_balance_to_cache
+from services.metrics_service import JOB_SECONDS, TRANSACTIONS, get_stage_seconds
+from services.wallet_services import update_balance_to_cache
 from utils.boolean_utils import to_bool
 from utils.utils import rpc_response_batch_to_results, validate_range
 
 logger = logging.getLogger(LoggerConstant.ExportBlocksJob)
 
+get_block_by_number_json_seconds = get_stage_seconds('get_block_by_number_json')
+get_balance_seconds = get_stage_seconds('get_balance')
+transaction_handler_seconds = get_stage_seconds('transaction_handler')
+job_seconds = JOB_SECONDS.labels('ExportBlocksJob')
+
 
 # Exports blocks and transactions
 class ExportBlocksJob(BaseJob):
@@ -80,16 +84,13 @@ class ExportBlocksJob(BaseJob):
             raise ValueError('At least one of export_blocks or export_transactions must be True')
 
         self.block_mapper = EthBlockMapper()
-        self.transaction_mapper = EthTransactionMapper()
         self.blocks_cache = []
         self.transactions_cache = []
         if web3:
             self.w3 = web3
         else:
             self.w3 = Web3(batch_web3_provider)
-        self.ethService = EthService(self.w3, provider_uris)
-        # self.ethService = EthService(batch_web3_provider)
-        self.local_storage = MemoryStoragePerformance.getInstance()
+        self.ethService = EthService(self.w3, provider_uris, batch_web3_provider=batch_web3_provider)
 
         self.filter_for_lending = to_bool(FilterConfig.FILTER_FOR_LENDING)
 
@@ -111,45 +112,41 @@ class ExportBlocksJob(BaseJob):
         response = self.batch_web3_provider.make_batch_request(json.dumps(blocks_rpc))
         results = rpc_response_batch_to_results(response)
         end_time = time.time()
-        get_block_by_number_time = self.local_storage.get(TestPerformanceConstant.get_block_by_number_json)
-        self.local_storage.set(TestPerformanceConstant.get_block_by_number_json,
-                               get_block_by_number_time + (time.time() - start_time))
+        get_block_by_number_json_seconds.observe(end_time - start_time)
         # logger.info(
         #     f"time to get info blocks {block_number_batch[0]} - {block_number_batch[-1]} is {end_time - start_time}")
-        blocks = [self.block_mapper.json_dict_to_block(result) for result in results]
-        for block in blocks:
-            self._export_block(block)
-
+        # the export dicts are built straight from the JSON, without EthBlock and EthTransaction in between
+        exported = [self.block_mapper.json_dict_to_export_dicts(result, self.export_transactions)
+                    for result in results]
+        balances = self._get_balances([transaction_dict for _, transaction_dicts in exported
+                                       for transaction_dict in transaction_dicts])
+        for block_dict, transaction_dicts in exported:
+            self._export_block(block_dict, transaction_dicts, balances)
         run_time = time.time() - start_time
-        total_time = self.local_storage.get(TestPerformanceConstant.total_time)
-        self.local_storage.set(TestPerformanceConstant.total_time, total_time + run_time)
+        job_seconds.observe(run_time)
         # logger.info(
         #     f"total time to process {block_number_batch[0]} - {block_number_batch[-1]} blocks  is {run_time}")
 
-    def _export_block(self, block):
+    def _export_block(self, block_dict, transaction_dicts, balances):
         if self.export_blocks:
-            block_dict = self.block_mapper.block_to_dict(block)
             self.blocks_cache.append(block_dict)
             self.item_exporter.export_item(block_dict)
 
         if self.export_transactions:
             start_time = time.time()
-            for tx in block.transactions:
-                transaction_dict = self.transaction_mapper.transaction_to_dict(tx)
-                self._handler_transaction(transaction_dict)
-            num_tx = len(block.transactions)
+            for transaction_dict in transaction_dicts:
+                self._handler_transaction(transaction_dict, balances)
+            num_tx = len(transaction_dicts)
             end_time = time.time() - start_time
-            number = self.local_storage.get(TestPerformanceConstant.transaction_number)
-            self.local_storage.set(TestPerformanceConstant.transaction_number, number + num_tx)
-            tx_handler_time = self.local_storage.get(TestPerformanceConstant.transaction_handler_time)
-            self.local_storage.set(TestPerformanceConstant.transaction_handler_time, tx_handler_time + end_time)
+            TRANSACTIONS.inc(num_tx)
+            transaction_handler_seconds.observe(end_time)
             # logger.info(f"total processed transaction {num_tx} take : {end_time}s")
 
-    def _handler_transaction(self, transaction_dict):
+    def _handler_transaction(self, transaction_dict, balances):
         block_number = int(transaction_dict.get(TransactionConstant.block_number))
         # start_time = time.time()
         if True or not self.latest_block or block_number > self.block_thread_hole:
-            self._update_balance(transaction_dict)
+            self._update_balance(transaction_dict, balances)
             # logger.debug(f"time to update balance " + str(time.time() - start_time))
         self.item_exporter.export_item(transaction_dict)
 
@@ -157,69 +154,80 @@ class ExportBlocksJob(BaseJob):
         self.batch_work_executor.shutdown()
         self.item_exporter.close()
 
-    def _update_balance(self, transaction_dict):
-        # return transaction_dict
-        if transaction_dict.get(TransactionConstant.input) == TokenConstant.native_token:
-            start_time_0 = time.time()
-            block_number = transaction_dict.get(TransactionConstant.block_number)
-            from_address = transaction_dict.get(TransactionConstant.from_address)
-            to_address = transaction_dict.get(TransactionConstant.to_address)
-
-            if self.filter_for_lending and not self.wallet_filter.get(from_address) \
-                    and not self.wallet_filter.get(to_address):
-                return
-
-            value = transaction_dict.get(TransactionConstant.value)
-            if value:
-                value = int(value)
-            else:
-                value = 0
-            # start_time = time.time()
-
-            token_address = TokenConstant.native_token
-            pre_from_balance, _wallet = get_balance_at_block(wallet_storage=self.wallet_storage,
-                                                             ethService=self.ethService,
-                                                             address=from_address, block_number=block_number - 1)
-            # end_time = time.time()
-            # logger.info(f"time to call get balance native token of {from_address} is" + str(
-            #     end_time - start_time))
-            if pre_from_balance == None:
-                # pre_from_balance = 0
-                from_balance = 0
-            else:
-                from_balance = pre_from_balance - value
-
-                update_balance_to_cache(wallet_storage=self.wallet_storage, _wallet=_wallet,
-                                        token_address=token_address,
-                                        balance=from_balance)
-
-            # start_time = time.time()
-
-            pre_to_balance, _wallet = get_balance_at_block(wallet_storage=self.wallet_storage,
-                                                           ethService=self.ethService,
-                                                           address=to_address, block_number=block_number - 1)
-            # end_time = time.time()
-            # logger.info(f"time to call get balance native token of " + from_address + "  is" + str(
-            #     end_time - start_time))
-            if pre_to_balance == None:
-                # pre_to_balance = 0
-                to_balance = 0
-            else:
-                to_balance = pre_to_balance + transaction_dict.get(TransactionConstant.value)
-                update_balance_to_cache(wallet_storage=self.wallet_storage, _wallet=_wallet,
-                                        token_address=token_address,
-                                        balance=to_balance)
-
-            wallets = []
-            if to_balance >= 0:
-                wallet = get_wallet_dict(to_address, str(to_balance), str(pre_to_balance), block_number)
-                wallets.append(wallet)
-            if from_balance >= 0:
-                wallet = get_wallet_dict(from_address, str(from_balance), str(pre_from_balance), block_number)
-                wallets.append(wallet)
-
-            transaction_dict[TransactionConstant.wallets] = wallets
-            # logger.debug(f" Time to process transaction {time.time() - start_time_0}")
+    def _get_balances(self, transaction_dicts):
+        """Resolves the balances before the block of every native transfer of the batch in a few requests"""
+        lookups = []
+        for transaction_dict in transaction_dicts:
+            if self._should_update_balance(transaction_dict):
+                block_number = transaction_dict.get(TransactionConstant.block_number)
+                lookups.append((transaction_dict.get(TransactionConstant.from_address), block_number - 1))
+                lookups.append((transaction_dict.get(TransactionConstant.to_address), block_number - 1))
+        if not lookups:
+            return {}
+
+        start_time = time.time()
+        balances = self.ethService.get_balances(lookups)
+        get_balance_seconds.observe(time.time() - start_time)
+        return balances
+
+    def _should_update_balance(self, transaction_dict):
+        if transaction_dict.get(TransactionConstant.input) != TokenConstant.native_token:
+            return False
+        from_address = transaction_dict.get(TransactionConstant.from_address)
+        to_address = transaction_dict.get(TransactionConstant.to_address)
+        if self.filter_for_lending and not self.wallet_filter.contains(from_address) \
+                and not self.wallet_filter.contains(to_address):
+            return False
+        return True
+
+    def _update_balance(self, transaction_dict, balances):
+        if not self._should_update_balance(transaction_dict):
+            return
+        block_number = transaction_dict.get(TransactionConstant.block_number)
+        from_address = transaction_dict.get(TransactionConstant.from_address)
+        to_address = transaction_dict.get(TransactionConstant.to_address)
+
+        value = transaction_dict.get(TransactionConstant.value)
+        if value:
+            value = int(value)
+        else:
+            value = 0
+
+        token_address = TokenConstant.native_token
+        pre_from_balance = balances.get((from_address, block_number - 1))
+        if pre_from_balance == None:
+            from_balance = 0
+        else:
+            from_balance = pre_from_balance - value
+
+            update_balance_to_cache(wallet_storage=self.wallet_storage, _wallet=self._get_cached_wallet(from_address),
+                                    token_address=token_address,
+                                    balance=from_balance)
+
+        pre_to_balance = balances.get((to_address, block_number - 1))
+        if pre_to_balance == None:
+            to_balance = 0
+        else:
+            to_balance = pre_to_balance + value
+            update_balance_to_cache(wallet_storage=self.wallet_storage, _wallet=self._get_cached_wallet(to_address),
+                                    token_address=token_address,
+                                    balance=to_balance)
+
+        wallets = []
+        if to_balance >= 0:
+            wallet = get_wallet_dict(to_address, str(to_balance), str(pre_to_balance), block_number)
+            wallets.append(wallet)
+        if from_balance >= 0:
+            wallet = get_wallet_dict(from_address, str(from_balance), str(pre_from_balance), block_number)
+            wallets.append(wallet)
+
+        transaction_dict[TransactionConstant.wallets] = wallets
+
+    def _get_cached_wallet(self, address):
+        _wallet = self.wallet_storage.get(address)
+        if not _wallet:
+            _wallet = {WalletConstant.address: address}
+        return _wallet
 
     def get_cache(self):
         return self.blocks_cache + self.transactions_cache
@@ -23,10 +23,8 @@ import logging
 import time
 
 from blockchainetl.jobs.base_job import BaseJob
-from config.constant import EventConstant, EventFilterConstant, TokenConstant, TransactionConstant, LendingTypeConstant, \
-    TestPerformanceConstant
+from config.constant import EventConstant, TokenConstant, TransactionConstant, LendingTypeConstant
 from config.event_lending_constant import EventLendingConstant
-from data_storage.memory_storage_test_performance import MemoryStoragePerformance
 from data_storage.wallet_filter_storage import WalletFilterMemoryStorage
 from ethereumetl.executors.batch_work_executor import BatchWorkExecutor
 from ethereumetl.jobs.export_tokens_job import clean_user_provided_content
@@ -36,12 +34,18 @@ from ethereumetl.mappers.wallet_mapper import get_wallet_dict, wallet_append_len
 from ethereumetl.service.eth_event_service import get_topic_filter, get_list_params_in_order, EventSubscriber, \
     get_all_address_name_field
 from ethereumetl.service.eth_lending_service import EthLendingService
+from ethereumetl.service.eth_logs_service import EthLogsService
 from ethereumetl.service.eth_token_service import EthTokenService
 from ethereumetl.service.event_extractor import EthEventExtractor
+from services.metrics_service import JOB_SECONDS, TRANSACTIONS, get_stage_seconds
 from utils.utils import validate_range
 
 logger = logging.getLogger(__name__)
 
+get_event_filter_seconds = get_stage_seconds('get_event_filter')
+transaction_handler_seconds = get_stage_seconds('transaction_handler')
+job_seconds = JOB_SECONDS.labels('ExportEventsJob')
+
 
 class ExportEventsJob(BaseJob):
     def __init__(
@@ -56,7 +60,8 @@ class ExportEventsJob(BaseJob):
             is_lending=False,
             tokens=None,
             ethTokenService=None,
-            ethLendingService=None
+            ethLendingService=None,
+            batch_web3_provider=None
     ):
         validate_range(start_block, end_block)
         self.start_block = start_block
@@ -72,6 +77,7 @@ class ExportEventsJob(BaseJob):
         self.receipt_log_mapper = EthReceiptLogMapper()
         self.event_mapper = EthEventMapper()
         self.event_extractor = EthEventExtractor()
+        self.logs_service = EthLogsService(batch_web3_provider or web3.provider)
         self.subscriber_event = subscriber_event
         self.topic = ""
         self.event_subscriber = None
@@ -94,7 +100,7 @@ class ExportEventsJob(BaseJob):
         else:
             self.token_type = LendingTypeConstant.ERC20
 
-        self.local_storage = MemoryStoragePerformance.getInstance()
+        self.wallet_filter = WalletFilterMemoryStorage.getInstance()
 
     def _init_events_subscription(self):
         event_abi = self.subscriber_event
@@ -108,7 +114,6 @@ class ExportEventsJob(BaseJob):
             self.address_name_field = get_all_address_name_field(event_abi)
 
     def _start(self):
-        self.wallet_filter = WalletFilterMemoryStorage.getInstance()
         self.item_exporter.open()
 
     def _export(self):
@@ -122,64 +127,70 @@ class ExportEventsJob(BaseJob):
         # self.eth_events_dict_cache = []
         start = time.time()
         assert len(block_number_batch) > 0
-        # https://github.com/ethereum/wiki/wiki/JSON-RPC#eth_getfilterlogs
-        filter_params = {
-            EventFilterConstant.fromBlock: block_number_batch[0],
-            EventFilterConstant.toBlock: block_number_batch[-1],
-            EventFilterConstant.topics: [self.topic]
-        }
-        if self.tokens is not None and len(self.tokens) > 0:
-            filter_params[TokenConstant.address] = self.tokens
-
-        event_filter = self.web3.eth.filter(filter_params)
-        events = event_filter.get_all_entries()
-
-        total_time = self.local_storage.get(TestPerformanceConstant.get_event_filter_time)
-        self.local_storage.set(TestPerformanceConstant.get_event_filter_time, total_time + (time.time() - start))
-
-        for event in events:
-            log = self.receipt_log_mapper.web3_dict_to_receipt_log(event)
+        events = self.logs_service.get_logs(block_number_batch[0], block_number_batch[-1],
+                                            topics=[self.topic], addresses=self.tokens)
+        get_event_filter_seconds.observe(time.time() - start)
+
+        self.export_receipt_logs([self.receipt_log_mapper.json_dict_to_receipt_log(event) for event in events])
+        job_seconds.observe(time.time() - start)
+
+    def export_receipt_logs(self, receipt_logs, start_block=None, end_block=None):
+        """Extracts the subscribed event from already fetched logs, updates the wallets and exports the events
+
+        The block range the logs were fetched for is accepted like ExportTokenTransfersJob does, it isn't needed.
+        """
+        start = time.time()
+        eth_event_dicts = []
+        for log in receipt_logs:
             eth_event = self.event_extractor.extract_event_from_log(log, self.event_subscriber)
             if eth_event is not None:
-                eth_event_dict = self.event_mapper.eth_event_to_dict(eth_event)
-                # logger.info("eth_event_dict ")
-                # logger.info(eth_event_dict)
-                self._update_wallet(eth_event_dict)
-                self.item_exporter.export_item(eth_event_dict)
-        num_tx = len(events)
-        end_time = time.time() - start
-        number = self.local_storage.get(TestPerformanceConstant.transaction_number)
-        self.local_storage.set(TestPerformanceConstant.transaction_number, number + num_tx)
-        tx_handler_time = self.local_storage.get(TestPerformanceConstant.transaction_handler_time)
-        self.local_storage.set(TestPerformanceConstant.transaction_handler_time, tx_handler_time + end_time)
-
-        run_time = time.time() - start
-        total_time = self.local_storage.get(TestPerformanceConstant.total_time)
-        self.local_storage.set(TestPerformanceConstant.total_time, total_time + run_time)
-        self.web3.eth.uninstallFilter(event_filter.filter_id)
+                eth_event_dicts.append(self.event_mapper.eth_event_to_dict(eth_event))
+
+        lending_infos = self._get_lending_infos(eth_event_dicts)
+        for eth_event_dict in eth_event_dicts:
+            self._update_wallet(eth_event_dict, lending_infos)
+            self.item_exporter.export_item(eth_event_dict)
+
+        TRANSACTIONS.inc(len(receipt_logs))
+        transaction_handler_seconds.observe(time.time() - start)
 
     def _end(self):
         self.batch_work_executor.shutdown()
         self.item_exporter.close()
 
-    def _update_wallet(self, eth_event_dict):
-        wallets = []
+    def _get_lending_infos(self, eth_event_dicts):
+        """Resolves the lending info of every wallet in the batch of events in a few requests"""
+        if not self._is_lending:
+            return {}
+        lookups = []
+        for eth_event_dict in eth_event_dicts:
+            lookups.extend(self._get_lending_lookups(eth_event_dict))
+        return self.ethLendingService.get_lending_infos(lookups)
+
+    def _get_lending_lookups(self, eth_event_dict):
         contract_address = eth_event_dict.get(TokenConstant.contract_address)
         block_num = eth_event_dict.get(TransactionConstant.block_number)
+        asset_address = get_asset_address(eth_event_dict)
+        lookups = []
         for address_field in self.address_name_field:
             address = eth_event_dict.get(address_field)
+            if address:
+                lookups.append((contract_address, address, block_num, self.token_type, asset_address))
+        return lookups
 
-            if self._is_lending:
-                asset_address = get_asset_address(eth_event_dict)
-                balance, pre_balance, supply, borrow, unit_token = self.ethLendingService.get_lending_info(
-                    contract_address, address, block_num,
-                    self.token_type, asset_address)
+    def _update_wallet(self, eth_event_dict, lending_infos):
+        wallets = []
+        if self._is_lending:
+            block_num = eth_event_dict.get(TransactionConstant.block_number)
+            for lookup in self._get_lending_lookups(eth_event_dict):
+                address = lookup[1]
+                balance, pre_balance, supply, borrow, unit_token = lending_infos.get(lookup) or (None,) * 5
                 if balance != None and supply != None and borrow != None:
                     wallet = get_wallet_dict(address, balance, pre_balance, block_num, unit_token)
                     wallet_append_lending_info(wallet, supply, borrow)
                     wallets.append(wallet)
 
-                    self.wallet_filter.set(address, wallet)
+                    self.wallet_filter.add(address)
 
         eth_event_dict[TransactionConstant.wallets] = wallets
 
@@ -21,28 +21,41 @@
 # SOFTWARE.
 
 
-import datetime
 import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from time import time
 
 from web3 import Web3
 
-from config.constant import EthKnowledgeGraphStreamerAdapterConstant, TestPerformanceConstant, \
-    MemoryStorageKeyConstant
+from blockchainetl.jobs.exporters.block_ordered_item_exporter import BlockOrderedItemExporter
+from config.config import BalanceLedgerConfig, PipelineConfig, TokenMetadataConfig
+from config.constant import EthKnowledgeGraphStreamerAdapterConstant, MemoryStorageKeyConstant
+from data_storage.balance_ledger import BalanceLedger
 from data_storage.memory_storage import MemoryStorage
-from data_storage.memory_storage_test_performance import MemoryStoragePerformance
+from data_storage.metrics_registry import MetricsRegistry
+from ethereumetl.executors.pipeline_executor import PipelineExecutor
 from ethereumetl.jobs.export_blocks_job import ExportBlocksJob
-from ethereumetl.jobs.export_subscriber_events_job import ExportSubscriberEventsJob
-from ethereumetl.jobs.export_token_transfers_job import ExportTokenTransfersJob
+from ethereumetl.jobs.export_logs_job import ExportLogsJob
 from ethereumetl.jobs.export_tokens_job import ExportTokensJob
+from ethereumetl.jobs.token_metadata_refresher import TokenMetadataRefresher
 from ethereumetl.providers.auto import get_provider_from_uri
+from ethereumetl.providers.cache import get_rpc_caches_stats
+from ethereumetl.providers.pool import get_provider_pools_stats
 from ethereumetl.thread_local_proxy import ThreadLocalProxy
+from services.metrics_service import EXPORTED_BLOCK, MetricsLogger
 from services.time_service import round_timestamp_to_date
+from utils.boolean_utils import to_bool
 
 logger = logging.getLogger('export_knowledge_graph_needed')
 
+# logs the metrics recorded for every block range
+metrics_logger = MetricsLogger()
+
+# refreshes the tokens in the background when TokenMetadataConfig.BACKGROUND_REFRESH is on
+token_metadata_refresher = None
+
 
 def is_log_filter_supported(provider_uri):
     return 'infura' not in provider_uri
@@ -55,195 +68,192 @@ def export_klg_with_item_exporter(partitions, provider_uri, max_workers, batch_s
                                   provider_uris=None,
                                   w3=None,
                                   ethTokenService=None,
-                                  ethLendingService=None
+                                  ethLendingService=None,
+                                  pipelined=None,
+                                  export_tokens=True
                                   ):
     if not w3:
         w3 = Web3(get_provider_from_uri(provider_uri))
+    if pipelined is None:
+        pipelined = to_bool(PipelineConfig.PIPELINED)
     latest_block_num = w3.eth.blockNumber
     thread_local_proxy = ThreadLocalProxy(lambda: w3)
+    subscriber_events = get_subscriber_events(event_abi_dir)
+    checkpoint_storage = MemoryStorage.getInstance()
+    background_refresh = to_bool(TokenMetadataConfig.BACKGROUND_REFRESH)
 
-    for batch_start_block, batch_end_block, partition_dir in partitions:
-        # # # start # # #
-        job_start_time = time()
-        padded_batch_start_block = str(batch_start_block).zfill(8)
-        padded_batch_end_block = str(batch_end_block).zfill(8)
-
-        """
-        init local storage to calculate time test performance
-        """
-        local_storage = MemoryStoragePerformance.getInstance()
-        local_storage.set(TestPerformanceConstant.get_transfer_filter_time, 0)
-        local_storage.set(TestPerformanceConstant.get_event_filter_time, 0)
-        local_storage.set(TestPerformanceConstant.get_balance_smart_contract_time, 0)
-        local_storage.set(TestPerformanceConstant.get_balance_time, 0)
-        local_storage.set(TestPerformanceConstant.get_block_by_number_json, 0)
-        local_storage.set(TestPerformanceConstant.get_lending_info_trava_time, 0)
-        local_storage.set(TestPerformanceConstant.get_lending_info_vtoken_time, 0)
-        local_storage.set(TestPerformanceConstant.read_mongo_time, 0)
-        local_storage.set(TestPerformanceConstant.write_mongo_time, 0)
-        local_storage.set(TestPerformanceConstant.transaction_number, 0)
-        local_storage.set(TestPerformanceConstant.transaction_handler_time, 0)
-        local_storage.set(TestPerformanceConstant.total_time, 0)
-
-        block_range = '{padded_batch_start_block}-{padded_batch_end_block}'.format(
-            padded_batch_start_block=padded_batch_start_block,
-            padded_batch_end_block=padded_batch_end_block,
+    def create_tokens_job(jobs_item_exporter):
+        return ExportTokensJob(
+            token_addresses_iterable=tokens,
+            web3=thread_local_proxy,
+            item_exporter=jobs_item_exporter,
+            max_workers=max_workers,
+            ethTokenService=ethTokenService
         )
 
+    if export_tokens and background_refresh:
+        get_token_metadata_refresher().start(create_tokens_job)
+
+    def create_jobs(batch_start_block, batch_end_block, jobs_item_exporter):
+        jobs = []
         # # # blocks_and_transactions # # #
-        job = ExportBlocksJob(
+        jobs.append(ExportBlocksJob(
             start_block=batch_start_block,
             end_block=batch_end_block,
             batch_size=batch_size,
             batch_web3_provider=ThreadLocalProxy(lambda: get_provider_from_uri(provider_uri, batch=True)),
             max_workers=max_workers,
-            item_exporter=item_exporter,
+            item_exporter=jobs_item_exporter,
             latest_block=latest_block_num,
             provider_uris=provider_uris
-        )
-        job.run()
-
-        # # # token_transfers # # #
-        # token_set = set()
-        start_transfer = time()
-        if is_log_filter_supported(provider_uri):
-            job = ExportTokenTransfersJob(
-                start_block=batch_start_block,
-                end_block=batch_end_block,
-                batch_size=batch_size,
-                w3=w3,
-                item_exporter=item_exporter,
-                max_workers=max_workers,
-                tokens=tokens,
-                latest_block=latest_block_num,
-                provider_uris=provider_uris,
-                ethTokenService=ethTokenService
-            )
-            job.run()
-            # token_transfers_dict = job.get_cache()
-            # token_addresses = extract_dict_key_to_list(token_transfers_dict, "contract_address")
-            # token_set.update(token_addresses)
-            logger.info(f"time to export transfer {time() - start_transfer}s")
-        # print("token set in transfer")
-        # print(token_set)
-        # # # events in artifacts/event-abi # # #
-
-        dir_path = event_abi_dir
-        cur_path = os.path.dirname(os.path.realpath(__file__)) + "/../../"
-        subscriber_events = []
-        for root, dirs, files in os.walk(cur_path + dir_path):
-
-            for filename in files:
-                file_path = cur_path + dir_path + "/" + filename
-
-                with open(file_path) as json_file:
-                    subscriber_event = json.load(json_file)
-                    subscriber_events.append(subscriber_event)
-                # has_get_balance = subscriber_event.get(EventConstant.isLending)
-
-                # if is_log_filter_supported(provider_uri):
-                #     # add_fields_to_export = []
-                #     # for input in inputs:
-                #     #     if input:
-                #     #         add_fields_to_export.append(input.get(EventConstant.name))
-                #
-                #     job = ExportEventsJob(
-                #         start_block=batch_start_block,
-                #         end_block=batch_end_block,
-                #         batch_size=batch_size,
-                #         web3=thread_local_proxy,
-                #         item_exporter=item_exporter,
-                #         max_workers=max_workers,
-                #         subscriber_event=subscriber_event,
-                #         is_lending=has_get_balance,
-                #         tokens=tokens,
-                #         ethTokenService=ethTokenService,
-                #         ethLendingService=ethLendingService
-                #     )
-                #     job.run()
-        start_export_event = time()
-        job = ExportSubscriberEventsJob(
-            batch_start_block,
-            batch_end_block,
-            batch_size,
-            thread_local_proxy,
-            item_exporter,
-            max_workers,
-            subscriber_events,
+        ))
+
+        # # # token_transfers and events in artifacts/event-abi # # #
+        # one eth_getLogs pass per block batch for the transfers and all subscribed events
+        jobs.append(ExportLogsJob(
+            start_block=batch_start_block,
+            end_block=batch_end_block,
+            batch_size=batch_size,
+            web3=thread_local_proxy,
+            item_exporter=jobs_item_exporter,
+            max_workers=max_workers,
+            subscriber_events=subscriber_events,
             tokens=tokens,
+            latest_block=latest_block_num,
             ethTokenService=ethTokenService,
-            ethLendingService=ethLendingService
-        )
-        job.run()
-        logger.info(f"time to extract all events {time() - start_export_event}s")
-        # # # # tokens # # #
-        now = datetime.datetime.now()
-
-        start_time = time()
-        checkpoint_storage = MemoryStorage.getInstance()
-
-        checkpoint = checkpoint_storage.get(MemoryStorageKeyConstant.checkpoint)
-        timestamp = round(start_time)
-        timestamp_day = round_timestamp_to_date(timestamp)
-        if not checkpoint or checkpoint != timestamp_day:
-            job = ExportTokensJob(
-                token_addresses_iterable=tokens,
-                web3=thread_local_proxy,
-                item_exporter=item_exporter,
-                max_workers=max_workers,
-                ethTokenService=ethTokenService
-            )
-            job.run()
-
-            checkpoint_storage.set(MemoryStorageKeyConstant.checkpoint, timestamp_day)
-        # print("token exported")
-        # print(job.get_cache())
-        job.clean_cache()
-
-        """
-        Show total time to call from provider
-        """
-        if local_storage.get_calculate_performance():
-            get_transfer_filter_time = local_storage.get(TestPerformanceConstant.get_transfer_filter_time)
-            get_event_filter_time = local_storage.get(TestPerformanceConstant.get_event_filter_time)
-            get_balance_smart_contract_time = local_storage.get(TestPerformanceConstant.get_balance_smart_contract_time)
-            get_balance_time = local_storage.get(TestPerformanceConstant.get_balance_time)
-            get_block_by_number_json = local_storage.get(TestPerformanceConstant.get_block_by_number_json)
-            get_lending_info_trava_time = local_storage.get(TestPerformanceConstant.get_lending_info_trava_time)
-            get_lending_info_vtoken_time = local_storage.get(TestPerformanceConstant.get_lending_info_vtoken_time)
-            read_mongo_time = local_storage.get(TestPerformanceConstant.read_mongo_time)
-            write_mongo_time = local_storage.get(TestPerformanceConstant.write_mongo_time)
-            transaction_handler_time = local_storage.get(TestPerformanceConstant.transaction_handler_time)
-            transaction_number = local_storage.get(TestPerformanceConstant.transaction_number)
-            total_time_call_provider = get_transfer_filter_time + \
-                                       get_event_filter_time + \
-                                       get_balance_smart_contract_time + \
-                                       get_balance_time + get_block_by_number_json + \
-                                       get_lending_info_trava_time + \
-                                       get_lending_info_vtoken_time
-            total_time = local_storage.get(TestPerformanceConstant.total_time)
-            logger.info(f"Exporting blocks {block_range} get_transfer_filter_time take {get_transfer_filter_time}")
-            logger.info(f"Exporting blocks {block_range} get_event_filter_time take {get_event_filter_time}")
-            logger.info(
-                f"Exporting blocks {block_range} get_balance_smart_contract_time take {get_balance_smart_contract_time}")
-            logger.info(f"Exporting blocks {block_range} get_balance_time take {get_balance_time}")
-            logger.info(f"Exporting blocks {block_range} get_block_by_number_json take {get_block_by_number_json}")
-            logger.info(
-                f"Exporting blocks {block_range} get_lending_info_trava_time take {get_lending_info_trava_time}")
-            logger.info(
-                f"Exporting blocks {block_range} get_lending_info_vtoken_time take {get_lending_info_vtoken_time}")
-            logger.info(f"Exporting blocks {block_range} total time call provider take {total_time_call_provider}")
-            logger.info(f"Exporting blocks {block_range} read_mongo_time take {read_mongo_time}")
-            logger.info(f"Exporting blocks {block_range} write_mongo_time take {write_mongo_time}")
-            logger.info(f"Exporting blocks {block_range} transaction_handler_time take {transaction_handler_time}")
-            logger.info(f"Exporting blocks {block_range} transaction_number take {transaction_number}")
-            logger.info(f"Exporting blocks {block_range} total time to process {total_time}")
-
-        # # # finish # # #
-        # shutil.rmtree(os.path.dirname(cache_output_dir))
-        end_time = time()
-        time_diff = end_time - job_start_time
-        logger.info('Exporting blocks {block_range} took {time_diff} seconds'.format(
-            block_range=block_range,
-            time_diff=time_diff,
+            ethLendingService=ethLendingService,
+            batch_web3_provider=ThreadLocalProxy(lambda: get_provider_from_uri(provider_uri, batch=True))
         ))
+
+        # # # tokens, once a day, unless they are refreshed in the background # # #
+        if export_tokens and not background_refresh and \
+                get_tokens_checkpoint() != checkpoint_storage.get(MemoryStorageKeyConstant.checkpoint):
+            jobs.append(create_tokens_job(jobs_item_exporter))
+        return jobs
+
+    def set_tokens_checkpoint(jobs):
+        if any(isinstance(job, ExportTokensJob) for job in jobs):
+            checkpoint_storage.set(MemoryStorageKeyConstant.checkpoint, get_tokens_checkpoint())
+
+    if not pipelined:
+        for batch_start_block, batch_end_block, partition_dir in partitions:
+            job_start_time = time()
+            block_range = get_block_range(batch_start_block, batch_end_block)
+            set_partition_dir(item_exporter, partition_dir)
+
+            jobs = create_jobs(batch_start_block, batch_end_block, item_exporter)
+            for job in jobs:
+                start_job = time()
+                job.run()
+                logger.info(f"time to run {type(job).__name__} {time() - start_job}s")
+            set_tokens_checkpoint(jobs)
+            if token_metadata_refresher is not None and token_metadata_refresher.has_items():
+                # the jobs closed the exporter
+                item_exporter.open()
+                export_refreshed_tokens(item_exporter)
+                item_exporter.close()
+            EXPORTED_BLOCK.set(batch_end_block)
+
+            log_performance_counters(block_range)
+            logger.info(f"Exporting blocks {block_range} took {time() - job_start_time} seconds")
+        finish_files(item_exporter)
+        return
+
+    # The jobs of a range run concurrently and their items are collected, then written in block order
+    # while the jobs of the next range already run.
+    def fetch(partition):
+        batch_start_block, batch_end_block, partition_dir = partition
+        job_start_time = time()
+        block_range = get_block_range(batch_start_block, batch_end_block)
+
+        ordered_item_exporter = BlockOrderedItemExporter()
+        jobs = create_jobs(batch_start_block, batch_end_block, ordered_item_exporter)
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            for future in [executor.submit(job.run) for job in jobs]:
+                future.result()
+        set_tokens_checkpoint(jobs)
+
+        # mongo times also include the writes of the previous range, which overlap with this one
+        log_performance_counters(block_range)
+        logger.info(f"Fetching blocks {block_range} took {time() - job_start_time} seconds")
+        return block_range, batch_end_block, partition_dir, ordered_item_exporter
+
+    def write(fetched):
+        block_range, batch_end_block, partition_dir, ordered_item_exporter = fetched
+        start_write = time()
+        set_partition_dir(item_exporter, partition_dir)
+        item_exporter.open()
+        number_of_items = ordered_item_exporter.export_to(item_exporter)
+        number_of_items += export_refreshed_tokens(item_exporter)
+        item_exporter.close()
+        EXPORTED_BLOCK.set(batch_end_block)
+        logger.info(f"Writing {number_of_items} items of blocks {block_range} took {time() - start_write} seconds")
+
+    PipelineExecutor([fetch, write], queue_size=int(PipelineConfig.PIPELINE_QUEUE_SIZE)).execute(partitions)
+    finish_files(item_exporter)
+
+
+def get_token_metadata_refresher():
+    global token_metadata_refresher
+    if token_metadata_refresher is None:
+        token_metadata_refresher = TokenMetadataRefresher()
+    return token_metadata_refresher
+
+
+def export_refreshed_tokens(item_exporter):
+    """Writes the tokens the background refresh got since the previous block range, with its items"""
+    if token_metadata_refresher is None:
+        return 0
+    return token_metadata_refresher.export_to(item_exporter)
+
+
+def get_subscriber_events(event_abi_dir):
+    cur_path = os.path.dirname(os.path.realpath(__file__)) + "/../../"
+    subscriber_events = []
+    for root, dirs, files in os.walk(cur_path + event_abi_dir):
+        for filename in files:
+            file_path = cur_path + event_abi_dir + "/" + filename
+
+            with open(file_path) as json_file:
+                subscriber_events.append(json.load(json_file))
+    return subscriber_events
+
+
+def set_partition_dir(item_exporter, partition_dir):
+    # exporters writing files, like the parquet one, name their directories after the partition
+    if hasattr(item_exporter, 'set_partition_dir'):
+        item_exporter.set_partition_dir(partition_dir)
+
+
+def finish_files(item_exporter):
+    # the files are completed once their partitions are exported, not every time the exporter is closed
+    if hasattr(item_exporter, 'finish'):
+        item_exporter.finish()
+
+
+def get_tokens_checkpoint():
+    return round_timestamp_to_date(round(time()))
+
+
+def get_block_range(batch_start_block, batch_end_block):
+    padded_batch_start_block = str(batch_start_block).zfill(8)
+    padded_batch_end_block = str(batch_end_block).zfill(8)
+    return '{padded_batch_start_block}-{padded_batch_end_block}'.format(
+        padded_batch_start_block=padded_batch_start_block,
+        padded_batch_end_block=padded_batch_end_block,
+    )
+
+
+def log_performance_counters(block_range):
+    """
+    Show what the jobs recorded since the previous block range, with the provider, ledger and cache stats
+    """
+    if not MetricsRegistry.getInstance().enabled:
+        return
+    metrics_logger.log(f"Exporting blocks {block_range}")
+    for endpoint_stats in get_provider_pools_stats():
+        logger.info(f"Exporting blocks {block_range} provider {endpoint_stats}")
+    if to_bool(BalanceLedgerConfig.BALANCE_LEDGER):
+        logger.info(f"Exporting blocks {block_range} balance ledger {BalanceLedger.getInstance().get_stats()}")
+    for rpc_cache_stats in get_rpc_caches_stats():
+        logger.info(f"Exporting blocks {block_range} rpc cache {rpc_cache_stats}")
@@ -0,0 +1,133 @@
+import logging
+import time
+
+from blockchainetl.jobs.base_job import BaseJob
+from config.constant import EventConstant
+from ethereumetl.executors.batch_work_executor import BatchWorkExecutor
+from ethereumetl.jobs.export_events_job import ExportEventsJob
+from ethereumetl.jobs.export_token_transfers_job import ExportTokenTransfersJob
+from ethereumetl.mappers.receipt_log_mapper import EthReceiptLogMapper
+from ethereumetl.service.eth_logs_service import EthLogsService
+from ethereumetl.service.token_transfer_extractor import TRANSFER_EVENT_TOPIC
+from services.metrics_service import JOB_SECONDS, get_stage_seconds
+from utils.utils import validate_range
+
+logger = logging.getLogger(__name__)
+
+get_logs_seconds = get_stage_seconds('get_logs')
+job_seconds = JOB_SECONDS.labels('ExportLogsJob')
+
+
+class ExportLogsJob(BaseJob):
+    """Exports token transfers and all subscribed events with a single eth_getLogs pass per block range.
+
+    The logs of every topic0 are fetched together and dispatched by topic0 to the token transfers handler
+    and to the handler of each subscribed event, which are the export jobs themselves.
+    """
+
+    def __init__(
+            self,
+            start_block,
+            end_block,
+            batch_size,
+            web3,
+            item_exporter,
+            max_workers,
+            subscriber_events,
+            export_token_transfers=True,
+            tokens=None,
+            latest_block=None,
+            ethTokenService=None,
+            ethLendingService=None,
+            batch_web3_provider=None
+    ):
+        validate_range(start_block, end_block)
+        self.start_block = start_block
+        self.end_block = end_block
+
+        self.web3 = web3
+        self.tokens = tokens
+        self.item_exporter = item_exporter
+        self.batch_work_executor = BatchWorkExecutor(batch_size, max_workers)
+        self.receipt_log_mapper = EthReceiptLogMapper()
+        self.logs_service = EthLogsService(batch_web3_provider or web3.provider)
+
+        self.handlers = []
+        self.handlers_by_topic = {}
+        if export_token_transfers:
+            self._add_handler(TRANSFER_EVENT_TOPIC, ExportTokenTransfersJob(
+                start_block=start_block,
+                end_block=end_block,
+                batch_size=batch_size,
+                w3=web3,
+                item_exporter=item_exporter,
+                max_workers=max_workers,
+                tokens=tokens,
+                latest_block=latest_block,
+                ethTokenService=ethTokenService,
+                batch_web3_provider=batch_web3_provider
+            ))
+
+        for subscriber_event in subscriber_events:
+            if subscriber_event.get(EventConstant.type) != EventConstant.event:
+                continue
+            handler = ExportEventsJob(
+                start_block=start_block,
+                end_block=end_block,
+                batch_size=batch_size,
+                web3=web3,
+                item_exporter=item_exporter,
+                max_workers=max_workers,
+                subscriber_event=subscriber_event,
+                is_lending=subscriber_event.get(EventConstant.isLending),
+                tokens=tokens,
+                ethTokenService=ethTokenService,
+                ethLendingService=ethLendingService,
+                batch_web3_provider=batch_web3_provider
+            )
+            self._add_handler(handler.topic, handler)
+
+    def _add_handler(self, topic, handler):
+        # several handlers can share a topic0, e.g. events with the same signature and different ABIs
+        self.handlers.append(handler)
+        self.handlers_by_topic.setdefault(topic, []).append(handler)
+
+    def _start(self):
+        self.item_exporter.open()
+
+    def _export(self):
+        if not self.handlers_by_topic:
+            return
+        self.batch_work_executor.execute(
+            range(self.start_block, self.end_block + 1),
+            self._export_batch,
+            total_items=self.end_block - self.start_block + 1
+        )
+
+    def _export_batch(self, block_number_batch):
+        start = time.time()
+        assert len(block_number_batch) > 0
+        # a list at the topic0 position matches any of the topics
+        events = self.logs_service.get_logs(block_number_batch[0], block_number_batch[-1],
+                                            topics=[list(self.handlers_by_topic)], addresses=self.tokens)
+        get_logs_seconds.observe(time.time() - start)
+
+        self.export_receipt_logs([self.receipt_log_mapper.json_dict_to_receipt_log(event) for event in events],
+                                 block_number_batch[0], block_number_batch[-1])
+        job_seconds.observe(time.time() - start)
+
+    def export_receipt_logs(self, receipt_logs, start_block=None, end_block=None):
+        # every handler gets the range, even without logs, the balance ledger tracks which ranges were applied
+        logs_by_handler = {id(handler): [] for handler in self.handlers}
+        for log in receipt_logs:
+            if not log.topics:
+                continue
+            for handler in self.handlers_by_topic.get(log.topics[0], []):
+                logs_by_handler[id(handler)].append(log)
+
+        for handler in self.handlers:
+            handler.export_receipt_logs(logs_by_handler[id(handler)], start_block, end_block)
+
+    def _end(self):
+        self.batch_work_executor.shutdown()
+        self.item_exporter.close()
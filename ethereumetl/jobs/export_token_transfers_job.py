@@ -24,10 +24,9 @@ import logging
 import time
 
 from blockchainetl.jobs.base_job import BaseJob
-from blockchainetl.jobs.exporters.databasse.mongo_db import Database
-from config.config import FilterConfig
-from config.constant import EventFilterConstant, TokenConstant, TransactionConstant, TestPerformanceConstant
-from data_storage.memory_storage_test_performance import MemoryStoragePerformance
+from config.config import BalanceLedgerConfig, FilterConfig
+from config.constant import TokenConstant, TransactionConstant, WalletConstant, EventConstant
+from data_storage.balance_ledger import BalanceLedger
 from data_storage.wallet_filter_storage import WalletFilterMemoryStorage
 from data_storage.wallet_storage import WalletMemoryStorage
 from ethereumetl.executors.batch_work_executor import BatchWorkExecutor
@@ -35,14 +34,20 @@ from ethereumetl.jobs.export_tokens_job import clean_user_provided_content
 from ethereumetl.mappers.receipt_log_mapper import EthReceiptLogMapper
 from ethereumetl.mappers.token_transfer_mapper import EthTokenTransferMapper
 from ethereumetl.mappers.wallet_mapper import get_wallet_dict
+from ethereumetl.service.eth_logs_service import EthLogsService
 from ethereumetl.service.eth_token_service import EthTokenService
 from ethereumetl.service.token_transfer_extractor import EthTokenTransferExtractor, TRANSFER_EVENT_TOPIC
-from services.wallet_services import get_balance_at_block_smart_contract, update_balance_to_cache
+from services.metrics_service import JOB_SECONDS, get_stage_seconds
+from services.wallet_services import update_balance_to_cache
 from utils.boolean_utils import to_bool
 from utils.utils import validate_range
 
 logger = logging.getLogger(__name__)
 
+get_transfer_filter_seconds = get_stage_seconds('get_transfer_filter')
+get_balance_smart_contract_seconds = get_stage_seconds('get_balance_smart_contract')
+job_seconds = JOB_SECONDS.labels('ExportTokenTransfersJob')
+
 
 class ExportTokenTransfersJob(BaseJob):
     def __init__(
@@ -53,12 +58,12 @@ class ExportTokenTransfersJob(BaseJob):
             w3,
             item_exporter,
             max_workers,
-            database=Database(),
+            database=None,
             tokens=None,
             latest_block=None,
             provider_uris=None,
-            ethTokenService=None
-
+            ethTokenService=None,
+            batch_web3_provider=None
     ):
         validate_range(start_block, end_block)
         self.start_block = start_block
@@ -73,6 +78,7 @@ class ExportTokenTransfersJob(BaseJob):
         self.receipt_log_mapper = EthReceiptLogMapper()
         self.token_transfer_mapper = EthTokenTransferMapper()
         self.token_transfer_extractor = EthTokenTransferExtractor()
+        self.logs_service = EthLogsService(batch_web3_provider or w3.provider)
         self.token_dict_cache = []
         if ethTokenService:
             self.ethTokenService = ethTokenService
@@ -84,12 +90,15 @@ class ExportTokenTransfersJob(BaseJob):
         if latest_block:
             self.block_thread_hole = int(latest_block * 0.8)
 
-        self.local_storage = MemoryStoragePerformance.getInstance()
         self.filter_for_lending = to_bool(FilterConfig.FILTER_FOR_LENDING)
-
-    def _start(self):
         self.wallet_storage = WalletMemoryStorage.getInstance()
         self.wallet_filter = WalletFilterMemoryStorage.getInstance()
+        if to_bool(BalanceLedgerConfig.BALANCE_LEDGER):
+            self.balance_ledger = BalanceLedger.getInstance()
+        else:
+            self.balance_ledger = None
+
+    def _start(self):
         self.item_exporter.open()
 
     def _export(self):
@@ -103,80 +112,150 @@ class ExportTokenTransfersJob(BaseJob):
         # self.token_dict_cache = []
         start = time.time()
         assert len(block_number_batch) > 0
-        # https://github.com/ethereum/wiki/wiki/JSON-RPC#eth_getfilterlogs
-        filter_params = {
-            EventFilterConstant.fromBlock: block_number_batch[0],
-            EventFilterConstant.toBlock: block_number_batch[-1],
-            EventFilterConstant.topics: [TRANSFER_EVENT_TOPIC]
-        }
-
-        if self.tokens is not None and len(self.tokens) > 0:
-            filter_params[TokenConstant.address] = self.tokens
-        event_filter = self.web3.eth.filter(filter_params)
-        events = event_filter.get_all_entries()
-        self.web3.eth.uninstallFilter(event_filter.filter_id)
-
-        total_time = self.local_storage.get(TestPerformanceConstant.get_transfer_filter_time)
-
-        self.local_storage.set(TestPerformanceConstant.get_transfer_filter_time, total_time + time.time() - start)
-        for event in events:
-            self._handler_event(event)
-
-        run_time = time.time() - start
-        total_time = self.local_storage.get(TestPerformanceConstant.total_time)
-        self.local_storage.set(TestPerformanceConstant.total_time, total_time + run_time)
-
-    def _handler_event(self, event):
-        log = self.receipt_log_mapper.web3_dict_to_receipt_log(event)
-        start_time1 = start_time = time.time()
+        events = self.logs_service.get_logs(block_number_batch[0], block_number_batch[-1],
+                                            topics=[TRANSFER_EVENT_TOPIC], addresses=self.tokens)
+        get_transfer_filter_seconds.observe(time.time() - start)
+        self.export_receipt_logs([self.receipt_log_mapper.json_dict_to_receipt_log(event) for event in events],
+                                 block_number_batch[0], block_number_batch[-1])
+        job_seconds.observe(time.time() - start)
+
+    def export_receipt_logs(self, receipt_logs, start_block=None, end_block=None):
+        """Extracts the transfers from already fetched logs, updates the balances and exports the transfers
+
+        The balance ledger is used when the block range the logs were fetched for is given, all the transfer logs
+        of the range must be there then.
+        """
+        token_transfer_dicts = []
+        non_fungible_tokens = set()
+        for log in receipt_logs:
+            token_transfer_dict = self._handler_event(log)
+            if token_transfer_dict is not None:
+                token_transfer_dicts.append(token_transfer_dict)
+                if len(log.topics) == 4:
+                    # ERC721 transfers have the token id indexed, the value is the token id
+                    non_fungible_tokens.add(token_transfer_dict.get(TokenConstant.contract_address))
+
+        self._update_balances(token_transfer_dicts, start_block, end_block, non_fungible_tokens)
+        for token_transfer_dict in token_transfer_dicts:
+            self.item_exporter.export_item(token_transfer_dict)
+
+    def _handler_event(self, log):
         token_transfer = self.token_transfer_extractor.extract_transfer_from_log(log)
-        # logger.info(f"time to extract token transfer is {time.time() - start_time}")
         if token_transfer is not None:
-            token_transfer_dict = self.token_transfer_mapper.token_transfer_to_dict(token_transfer)
-            # start_time = time()
-            block_number = int(token_transfer_dict.get(TokenConstant.block_number))
-            if not self.latest_block or block_number > self.block_thread_hole:
-                start_time = time.time()
-                self._update_balance(token_transfer_dict)
-                # logger.info(f"time to update balance is {time.time() - start_time}")
-            # end_time = time()
-            # print("run time to update balance:" + str(end_time - start_time))
-            # print(token_transfer_dict)
-            # self.token_dict_cache.append(token_transfer_dict)
-            # start_time = time.time()
-            self.item_exporter.export_item(token_transfer_dict)
+            return self.token_transfer_mapper.token_transfer_to_dict(token_transfer)
+        return None
 
-            # logger.info(f"Time to export item {time.time() - start_time1}")
+    def _update_balances(self, token_transfer_dicts, start_block=None, end_block=None, non_fungible_tokens=()):
+        """Resolves the balances of every transfer in the batch in a few requests, then updates the transfers"""
+        needed = [self._should_update_balance(token_transfer_dict) for token_transfer_dict in token_transfer_dicts]
+        start_time = time.time()
+        if self.balance_ledger is not None and start_block is not None:
+            pre_balances = self._get_pre_balances_from_ledger(token_transfer_dicts, needed, start_block, end_block,
+                                                              non_fungible_tokens)
+        else:
+            pre_balances = self._get_pre_balances(token_transfer_dicts, needed, non_fungible_tokens)
+        get_balance_smart_contract_seconds.observe(time.time() - start_time)
+
+        for token_transfer_dict, is_needed, (pre_from_balance, pre_to_balance) in zip(token_transfer_dicts, needed,
+                                                                                      pre_balances):
+            if is_needed:
+                self._update_balance(token_transfer_dict, pre_from_balance, pre_to_balance,
+                                     token_transfer_dict.get(TokenConstant.contract_address) in non_fungible_tokens)
+
+    def _get_pre_balances(self, token_transfer_dicts, needed, non_fungible_tokens=()):
+        """Balances before every transfer, read at the end of the previous block then updated in log order by the
+        transfers of the block, so two transfers of an address in one block don't get the same balance"""
+        lookups = []
+        for token_transfer_dict, is_needed in zip(token_transfer_dicts, needed):
+            if is_needed:
+                lookups.extend(self._get_balance_lookups(token_transfer_dict))
+        balances = self.ethTokenService.get_balances(lookups)
+
+        pre_balances = [None] * len(token_transfer_dicts)
+        for index in self._get_log_order(token_transfer_dicts):
+            token_transfer_dict = token_transfer_dicts[index]
+            value = self._get_value(token_transfer_dict, non_fungible_tokens)
+            from_lookup, to_lookup = self._get_balance_lookups(token_transfer_dict)
+            pre_from_balance = balances.get(from_lookup)
+            if pre_from_balance is not None:
+                balances[from_lookup] = pre_from_balance - value
+            pre_to_balance = balances.get(to_lookup)
+            if pre_to_balance is not None:
+                balances[to_lookup] = pre_to_balance + value
+            pre_balances[index] = (pre_from_balance, pre_to_balance)
+        return pre_balances
+
+    def _get_balance_lookups(self, token_transfer_dict):
+        """Balance lookups of both sides at the end of the block before the transfer"""
+        block_number = int(token_transfer_dict.get(TransactionConstant.block_number)) - 1
+        token_address = token_transfer_dict.get(TokenConstant.contract_address)
+        return [(token_address, token_transfer_dict.get(TransactionConstant.from_address), block_number),
+                (token_address, token_transfer_dict.get(TransactionConstant.to_address), block_number)]
+
+    @staticmethod
+    def _get_log_order(token_transfer_dicts):
+        return sorted(range(len(token_transfer_dicts)), key=lambda index: (
+            token_transfer_dicts[index].get(TransactionConstant.block_number),
+            token_transfer_dicts[index].get(EventConstant.log_index)))
+
+    @staticmethod
+    def _get_value(token_transfer_dict, non_fungible_tokens):
+        # the balance of an ERC721 token is the number of tokens owned
+        if token_transfer_dict.get(TokenConstant.contract_address) in non_fungible_tokens:
+            return 1
+        return int(token_transfer_dict.get(TransactionConstant.value))
+
+    def _get_pre_balances_from_ledger(self, token_transfer_dicts, needed, start_block, end_block,
+                                      non_fungible_tokens):
+        order = self._get_log_order(token_transfer_dicts)
+        transfers = []
+        for index in order:
+            token_transfer_dict = token_transfer_dicts[index]
+            transfers.append((token_transfer_dict.get(TokenConstant.contract_address),
+                              token_transfer_dict.get(TransactionConstant.from_address),
+                              token_transfer_dict.get(TransactionConstant.to_address),
+                              self._get_value(token_transfer_dict, non_fungible_tokens),
+                              token_transfer_dict.get(TransactionConstant.block_number), needed[index]))
+        ordered_pre_balances = self.balance_ledger.get_pre_balances(transfers, start_block, end_block,
+                                                                    self.ethTokenService.get_balances)
+        pre_balances = [None] * len(token_transfer_dicts)
+        for index, pre_balance in zip(order, ordered_pre_balances):
+            pre_balances[index] = pre_balance
+        return pre_balances
+
+    def _should_update_balance(self, token_transfer_dict):
+        block_number = int(token_transfer_dict.get(TokenConstant.block_number))
+        if self.latest_block and block_number <= self.block_thread_hole:
+            return False
+        from_address = token_transfer_dict.get(TransactionConstant.from_address)
+        to_address = token_transfer_dict.get(TransactionConstant.to_address)
+        if self.filter_for_lending and not self.wallet_filter.contains(from_address) \
+                and not self.wallet_filter.contains(to_address):
+            return False
+        return True
 
     def _end(self):
         self.batch_work_executor.shutdown()
         self.item_exporter.close()
 
-    def _update_balance(self, token_transfer_dict):
+    def _update_balance(self, token_transfer_dict, pre_from_balance, pre_to_balance, non_fungible=False):
         block_number = token_transfer_dict.get(TransactionConstant.block_number)
         token_address = token_transfer_dict.get(TokenConstant.contract_address)
         from_address = token_transfer_dict.get(TransactionConstant.from_address)
         to_address = token_transfer_dict.get(TransactionConstant.to_address)
-
-        if self.filter_for_lending and not self.wallet_filter.get(from_address) \
-                and not self.wallet_filter.get(to_address):
-            return
+        if non_fungible:
+            value = 1
+        else:
+            value = int(token_transfer_dict.get(TransactionConstant.value))
 
         wallets = []
-        start_time = time.time()
-        pre_from_balance, _wallet = get_balance_at_block_smart_contract(wallet_storage=self.wallet_storage,
-                                                                        ethService=self.ethTokenService,
-                                                                        address=from_address,
-                                                                        token_address=token_address,
-                                                                        block_number=block_number)
-        # logger.info(f"time to get balance of {from_address} at block num {block_number} is {time.time() - start_time}")
         if pre_from_balance == None:
             from_balance = 0
         else:
-            from_balance = pre_from_balance - int(token_transfer_dict.get(TransactionConstant.value))
+            from_balance = pre_from_balance - value
 
             ## update to cache
-            update_balance_to_cache(wallet_storage=self.wallet_storage, _wallet=_wallet,
+            update_balance_to_cache(wallet_storage=self.wallet_storage, _wallet=self._get_cached_wallet(from_address),
                                     token_address=token_address,
                                     balance=from_balance)
 
@@ -185,21 +264,13 @@ class ExportTokenTransfersJob(BaseJob):
                                      token_address)
             wallets.append(wallet)
 
-        start_time = time.time()
-        pre_to_balance, _wallet = get_balance_at_block_smart_contract(wallet_storage=self.wallet_storage,
-                                                                      ethService=self.ethTokenService,
-                                                                      address=token_address,
-                                                                      token_address=token_address,
-                                                                      block_number=block_number)
-
-        # logger.info(f"time to get balance of {from_address} at block num {block_number} is {time.time() - start_time}")
         if pre_to_balance == None:
             to_balance = 0
         else:
-            to_balance = pre_to_balance + int(token_transfer_dict.get(TransactionConstant.value))
+            to_balance = pre_to_balance + value
 
             ## update to cache
-            update_balance_to_cache(wallet_storage=self.wallet_storage, _wallet=_wallet,
+            update_balance_to_cache(wallet_storage=self.wallet_storage, _wallet=self._get_cached_wallet(to_address),
                                     token_address=token_address,
                                     balance=to_balance)
 
@@ -210,6 +281,12 @@ class ExportTokenTransfersJob(BaseJob):
 
         return token_transfer_dict
 
+    def _get_cached_wallet(self, address):
+        _wallet = self.wallet_storage.get(address)
+        if not _wallet:
+            _wallet = {WalletConstant.address: address}
+        return _wallet
+
     def get_cache(self):
         return self.token_dict_cache
 
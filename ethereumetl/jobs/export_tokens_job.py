@@ -22,52 +22,67 @@
 import time
 
 from blockchainetl.jobs.base_job import BaseJob
-from config.constant import TestPerformanceConstant
-from data_storage.memory_storage_test_performance import MemoryStoragePerformance
-from ethereumetl.executors.batch_work_executor import BatchWorkExecutor
+from data_storage.token_metadata_registry import TokenMetadataRegistry
+from ethereumetl.domain.token import EthToken
 from ethereumetl.mappers.token_mapper import EthTokenMapper
 from ethereumetl.service.eth_token_service import EthTokenService
+from services.metrics_service import JOB_SECONDS
 
+job_seconds = JOB_SECONDS.labels('ExportTokensJob')
 
+
+# Symbols, names and decimals come from the registry, only the tokens it doesn't know yet are asked for them.
+# The total supplies of all the tokens are refreshed in one batch of multicalls.
 class ExportTokensJob(BaseJob):
-    def __init__(self, web3, item_exporter, token_addresses_iterable, max_workers, ethTokenService=None):
+    def __init__(self, web3, item_exporter, token_addresses_iterable, max_workers, ethTokenService=None,
+                 token_metadata_registry=None):
         self.item_exporter = item_exporter
         self.token_addresses_iterable = token_addresses_iterable
-        self.batch_work_executor = BatchWorkExecutor(1, max_workers)
 
         if ethTokenService:
             self.token_service = ethTokenService
         else:
             self.token_service = EthTokenService(web3, clean_user_provided_content)
+        self.token_metadata_registry = token_metadata_registry or TokenMetadataRegistry.getInstance()
 
         self.token_mapper = EthTokenMapper()
         self.tokens_cache = []
-        self.local_storage = MemoryStoragePerformance.getInstance()
 
     def _start(self):
         self.item_exporter.open()
 
     def _export(self):
-        self.batch_work_executor.execute(self.token_addresses_iterable, self._export_tokens)
+        start_time = time.time()
+        token_addresses = list(dict.fromkeys(token_address.lower()
+                                             for token_address in self.token_addresses_iterable or []))
+        registry = self.token_metadata_registry
+
+        missing = registry.get_missing(token_addresses)
+        if missing:
+            for token_address, (symbol, name, decimals) in self.token_service.get_tokens_metadata(missing).items():
+                registry.set_metadata(token_address, symbol, name, decimals)
+        unknown = set(registry.get_missing(token_addresses))
+        known = [token_address for token_address in token_addresses if token_address not in unknown]
+        # the time of the refresh is kept even when no token is known, it's tried again after refresh_seconds
+        registry.set_total_supplies(self.token_service.get_total_supplies(known) if known else {})
+        registry.save()
 
-    def _export_tokens(self, token_addresses):
         for token_address in token_addresses:
             self._export_token(token_address)
+        job_seconds.observe(time.time() - start_time)
 
     def _export_token(self, token_address, block_number=None):
-        start_time = time.time()
-        token = self.token_service.get_token(token_address)
+        token = self.token_metadata_registry.get_token(token_address)
+        if token is None:
+            # not a token, or the node didn't answer
+            token = EthToken()
+            token.address = token_address
         token.block_number = block_number
         token_dict = self.token_mapper.token_to_dict(token)
         self.tokens_cache.append(token_dict)
         self.item_exporter.export_item(token_dict)
 
-        run_time = time.time() - start_time
-        total_time = self.local_storage.get(TestPerformanceConstant.total_time)
-        self.local_storage.set(TestPerformanceConstant.total_time, total_time + run_time)
-
     def _end(self):
-        self.batch_work_executor.shutdown()
         self.item_exporter.close()
 
     def get_cache(self):
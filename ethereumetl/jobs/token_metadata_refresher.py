@@ -0,0 +1,59 @@
+import logging
+import threading
+import time
+
+from blockchainetl.jobs.exporters.block_ordered_item_exporter import BlockOrderedItemExporter
+from data_storage.token_metadata_registry import TokenMetadataRegistry
+
+logger = logging.getLogger('TokenMetadataRefresher')
+
+
+class TokenMetadataRefresher:
+    """Runs ExportTokensJob in a daemon thread whenever the total supplies of the registry are due.
+
+    The stream doesn't wait for the refresh, the token items are collected and written with the next block range
+    by export_to.
+    """
+
+    def __init__(self, token_metadata_registry=None, retry_seconds=60):
+        self.token_metadata_registry = token_metadata_registry or TokenMetadataRegistry.getInstance()
+        self.retry_seconds = float(retry_seconds)
+
+        self._create_job = None
+        self._buffer = BlockOrderedItemExporter()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def start(self, create_job):
+        """Starts the thread on the first call, later calls only replace the job factory.
+
+        :param create_job: builds the ExportTokensJob writing to the item exporter it is called with
+        """
+        with self._lock:
+            self._create_job = create_job
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='TokenMetadataRefresher', daemon=True)
+                self._thread.start()
+
+    def has_items(self):
+        return bool(self._buffer.items)
+
+    def export_to(self, item_exporter):
+        """Writes the token items refreshed since the previous call, returns how many"""
+        return self._buffer.export_to(item_exporter)
+
+    def _run(self):
+        while True:
+            time.sleep(self.token_metadata_registry.get_seconds_to_refresh())
+            with self._lock:
+                create_job = self._create_job
+            start_time = time.time()
+            try:
+                create_job(self._buffer).run()
+                logger.info(f"Refreshed the tokens in {time.time() - start_time}s")
+                if not self.token_metadata_registry.get_seconds_to_refresh():
+                    # a job that refreshed nothing is run again after refresh_seconds, not right away
+                    time.sleep(self.token_metadata_registry.refresh_seconds)
+            except Exception as e:
+                logger.warning(f"Refreshing the tokens failed, retrying in {self.retry_seconds}s: {e!r}")
+                time.sleep(self.retry_seconds)
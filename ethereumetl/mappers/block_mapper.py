@@ -86,3 +86,38 @@ class EthBlockMapper(object):
             'timestamp': block.timestamp,
             'transaction_count': block.transaction_count,
         }
+
+    def json_dict_to_export_dicts(self, json_dict, include_transactions=True):
+        """The dicts of block_to_dict and transaction_to_dict built straight from the JSON-RPC block.
+
+        :return: the block dict and the transaction dicts, empty when include_transactions is False
+        """
+        timestamp = hex_to_dec(json_dict.get('timestamp'))
+        transactions = json_dict.get('transactions')
+        block_dict = {
+            'type': 'block',
+            'number': hex_to_dec(json_dict.get('number')),
+            'hash': json_dict.get('hash'),
+            'parent_hash': json_dict.get('parentHash'),
+            'nonce': json_dict.get('nonce'),
+            'sha3_uncles': json_dict.get('sha3Uncles'),
+            'logs_bloom': json_dict.get('logsBloom'),
+            'transactions_root': json_dict.get('transactionsRoot'),
+            'state_root': json_dict.get('stateRoot'),
+            'receipts_root': json_dict.get('receiptsRoot'),
+            'miner': to_normalized_address(json_dict.get('miner')),
+            'difficulty': hex_to_dec(json_dict.get('difficulty')),
+            'total_difficulty': hex_to_dec(json_dict.get('totalDifficulty')),
+            'size': hex_to_dec(json_dict.get('size')),
+            'extra_data': json_dict.get('extraData'),
+            'gas_limit': hex_to_dec(json_dict.get('gasLimit')),
+            'gas_used': hex_to_dec(json_dict.get('gasUsed')),
+            'timestamp': timestamp,
+            'transaction_count': len(transactions) if transactions is not None else 0,
+        }
+        if not include_transactions or not transactions:
+            return block_dict, []
+        json_dict_to_transaction_dict = self.transaction_mapper.json_dict_to_transaction_dict
+        transaction_dicts = [json_dict_to_transaction_dict(transaction, block_timestamp=timestamp)
+                             for transaction in transactions if isinstance(transaction, dict)]
+        return block_dict, transaction_dicts
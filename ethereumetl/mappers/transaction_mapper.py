@@ -58,3 +58,21 @@ class EthTransactionMapper(object):
             'gas_price': transaction.gas_price,
             'input': transaction.input,
         }
+
+    def json_dict_to_transaction_dict(self, json_dict, block_timestamp=None):
+        """transaction_to_dict(json_dict_to_transaction(json_dict)) in a single pass, without an EthTransaction"""
+        return {
+            'type': 'transaction',
+            'hash': json_dict.get('hash'),
+            'nonce': hex_to_dec(json_dict.get('nonce')),
+            'block_hash': json_dict.get('blockHash'),
+            'block_number': hex_to_dec(json_dict.get('blockNumber')),
+            'block_timestamp': block_timestamp,
+            'transaction_index': hex_to_dec(json_dict.get('transactionIndex')),
+            'from_address': to_normalized_address(json_dict.get('from')),
+            'to_address': to_normalized_address(json_dict.get('to')),
+            'value': hex_to_dec(json_dict.get('value')),
+            'gas': hex_to_dec(json_dict.get('gas')),
+            'gas_price': hex_to_dec(json_dict.get('gasPrice')),
+            'input': json_dict.get('input'),
+        }
@@ -0,0 +1,150 @@
+import asyncio
+import itertools
+import json
+import logging
+import threading
+
+import aiohttp
+from web3.providers.base import JSONBaseProvider
+
+from config.config import AsyncProviderConfig
+
+logger = logging.getLogger('AsyncHTTPProvider')
+
+# read-only methods whose identical concurrent calls can share one response
+COALESCED_METHODS = {
+    'eth_blockNumber',
+    'eth_call',
+    'eth_getBalance',
+    'eth_getBlockByNumber',
+    'eth_getCode',
+    'eth_getLogs',
+    'eth_getTransactionReceipt',
+}
+
+
+class AsyncHTTPProvider(JSONBaseProvider):
+    """JSON-RPC provider running all requests on one asyncio event loop with a shared keep-alive pool.
+
+    At most max_in_flight requests are sent at the same time and identical concurrent read-only calls are
+    coalesced into one. Coroutines can await request() and batch_request() directly. make_request() and
+    make_batch_request() are a blocking facade so web3 and the jobs can use it like BatchHTTPProvider,
+    from any number of threads sharing a single instance.
+    """
+
+    def __init__(self, endpoint_uri, timeout=60, max_in_flight=AsyncProviderConfig.MAX_IN_FLIGHT,
+                 pool_size=AsyncProviderConfig.POOL_SIZE):
+        super().__init__()
+        self.endpoint_uri = endpoint_uri
+        self.timeout = timeout
+        self.max_in_flight = int(max_in_flight)
+        self.pool_size = int(pool_size)
+
+        self._request_ids = itertools.count()
+        self._session = None
+        self._semaphore = None
+        self._in_flight_calls = {}
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='AsyncHTTPProvider', daemon=True)
+        self._thread.start()
+
+    # blocking facade
+
+    def make_request(self, method, params):
+        return self._run(self.request(method, params))
+
+    def make_batch_request(self, text):
+        return self._run(self.batch_request(json.loads(text)))
+
+    def make_concurrent_requests(self, calls):
+        """Sends (method, params) calls concurrently and returns their responses in order"""
+        return self._run(self.concurrent_requests(calls))
+
+    def isConnected(self):
+        try:
+            response = self.make_request('web3_clientVersion', [])
+        except (ConnectionError, ValueError):
+            return False
+        return 'error' not in response
+
+    def close(self):
+        if self._session is not None:
+            self._run(self._session.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+    # coroutines, to be awaited on the provider event loop
+
+    async def request(self, method, params):
+        if method not in COALESCED_METHODS:
+            return await self._post(self._rpc(method, params))
+
+        key = (method, json.dumps(params, sort_keys=True))
+        in_flight_call = self._in_flight_calls.get(key)
+        if in_flight_call is not None:
+            return dict(await asyncio.shield(in_flight_call))
+
+        in_flight_call = self._loop.create_task(self._post(self._rpc(method, params)))
+        self._in_flight_calls[key] = in_flight_call
+        try:
+            return await asyncio.shield(in_flight_call)
+        finally:
+            if self._in_flight_calls.get(key) is in_flight_call:
+                del self._in_flight_calls[key]
+
+    async def concurrent_requests(self, calls):
+        return list(await asyncio.gather(*[self.request(method, params) for method, params in calls]))
+
+    async def batch_request(self, requests):
+        # identical calls in a batch are sent once and their response is copied to every id
+        unique_requests = {}
+        for request in requests:
+            key = (request['method'], json.dumps(request['params'], sort_keys=True))
+            if key not in unique_requests:
+                unique_requests[key] = self._rpc(request['method'], request['params'])
+
+        response = await self._post(list(unique_requests.values()))
+        if not isinstance(response, list):
+            return response
+        response_by_id = {response_item.get('id'): response_item for response_item in response}
+        responses = []
+        for request in requests:
+            unique_request = unique_requests[(request['method'], json.dumps(request['params'], sort_keys=True))]
+            responses.append(dict(response_by_id.get(unique_request['id'], {}), id=request.get('id')))
+        return responses
+
+    def _rpc(self, method, params):
+        return {'jsonrpc': '2.0', 'method': method, 'params': params, 'id': next(self._request_ids)}
+
+    async def _post(self, rpc):
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=self.pool_size, keepalive_timeout=60)
+            self._session = aiohttp.ClientSession(connector=connector,
+                                                  timeout=aiohttp.ClientTimeout(total=self.timeout))
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+
+        async with self._semaphore:
+            try:
+                async with self._session.post(self.endpoint_uri, data=json.dumps(rpc).encode('utf-8'),
+                                              headers={'Content-Type': 'application/json'}) as response:
+                    response.raise_for_status()
+                    return json.loads(await response.read())
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                # ConnectionError is retried by the executors like the errors of requests
+                raise ConnectionError(f'Request to {self.endpoint_uri} failed: {e!r}') from e
+
+    def _run(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+
+_providers = {}
+_providers_lock = threading.Lock()
+
+
+def get_shared_async_provider(endpoint_uri, timeout=60):
+    """All threads share one provider per uri, so they share its connection pool and in-flight limit"""
+    with _providers_lock:
+        provider = _providers.get((endpoint_uri, timeout))
+        if provider is None:
+            provider = AsyncHTTPProvider(endpoint_uri, timeout=timeout)
+            _providers[(endpoint_uri, timeout)] = provider
+        return provider
@@ -25,19 +25,61 @@ from urllib.parse import urlparse
 
 from web3 import IPCProvider, HTTPProvider
 from web3 import Web3
+
+from config.config import AsyncProviderConfig, RpcCacheConfig, RpcRecordConfig
+from data_storage.metrics_registry import MetricsRegistry
+from ethereumetl.providers.cache import CachedProvider, get_rpc_cache
 from ethereumetl.providers.ipc import BatchIPCProvider
+from ethereumetl.providers.limited import LimitedBatchProvider, LimitedProvider
+from ethereumetl.providers.metered import MeteredBatchProvider, MeteredProvider
+from ethereumetl.providers.pool import get_provider_pool
+from ethereumetl.providers.recording import RecordingBatchProvider, RecordingProvider, get_rpc_recorder
 from ethereumetl.providers.rpc import BatchHTTPProvider
+from utils.boolean_utils import to_bool
+from utils.process_limits import RPC, has_process_limit
 
 DEFAULT_TIMEOUT = 60
 
 
 def get_provider_from_uri(uri_string, timeout=DEFAULT_TIMEOUT, batch=False):
-    uri = urlparse(uri_string)
+    provider = _get_provider_from_uri(uri_string, timeout=timeout, batch=batch)
+    if MetricsRegistry.getInstance().enabled:
+        provider = wrap_provider(provider, MeteredProvider, MeteredBatchProvider)
+    if has_process_limit(RPC):
+        # cached results are answered without waiting for the limit
+        provider = wrap_provider(provider, LimitedProvider, LimitedBatchProvider)
+    if batch and RpcCacheConfig.RPC_CACHE_PATH:
+        provider = CachedProvider(provider, get_rpc_cache(RpcCacheConfig.RPC_CACHE_PATH))
+    if RpcRecordConfig.RPC_RECORD_PATH:
+        # outermost, so the answers of the cache are recorded too and a replay gets every request
+        provider = wrap_provider(provider, RecordingProvider, RecordingBatchProvider,
+                                 get_rpc_recorder(RpcRecordConfig.RPC_RECORD_PATH))
+    return provider
+
+
+def wrap_provider(provider, provider_class, batch_provider_class, *args):
+    # services send batches when the provider has make_batch_request, a wrapper only has it when the provider does
+    if hasattr(provider, 'make_batch_request'):
+        return batch_provider_class(provider, *args)
+    return provider_class(provider, *args)
+
+
+def _get_provider_from_uri(uri_string, timeout, batch):
+    uris = [uri.strip() for uri in uri_string.split(',') if uri.strip()]
+    if len(uris) > 1:
+        # the pool endpoints are always batch providers, they also answer single requests
+        return get_provider_pool(uris, lambda uri: _get_provider_from_uri(uri, timeout=timeout, batch=True))
+
+    uri = urlparse(uri_string.strip())
     if uri.scheme == 'file':
         if batch:
             return BatchIPCProvider(uri.path, timeout=timeout)
         else:
             return Web3.IPCProvider(uri.path, timeout=timeout)
+    elif (uri.scheme == 'http' or uri.scheme == 'https') and to_bool(AsyncProviderConfig.ASYNC_PROVIDER):
+        # imported here so aiohttp is only needed when the async provider is enabled
+        from ethereumetl.providers.async_rpc import get_shared_async_provider
+        return get_shared_async_provider(uri_string, timeout=timeout)
     elif uri.scheme == 'http' or uri.scheme == 'https':
         request_kwargs = {'timeout': timeout}
         if batch:
@@ -0,0 +1,307 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+
+from web3.providers.base import JSONBaseProvider
+
+from config.config import RpcCacheConfig
+from utils.json_utils import json_loads
+
+logger = logging.getLogger('RpcCache')
+
+# position of the block parameter of the methods whose answer never changes once the block is final
+BLOCK_PARAMETER_INDEXES = {
+    'eth_getBlockByNumber': 0,
+    'debug_traceBlockByNumber': 0,
+    'eth_getBlockTransactionCountByNumber': 0,
+    'eth_call': 1,
+    'eth_getBalance': 1,
+    'eth_getCode': 1,
+    'eth_getTransactionCount': 1,
+    'eth_getStorageAt': 2,
+}
+
+# methods addressed by hash, their answer is cached once the block it comes from is final
+RESULT_BLOCK_METHODS = {
+    'eth_getBlockByHash',
+    'eth_getTransactionByHash',
+    'eth_getTransactionReceipt',
+}
+
+_SQL_VARIABLES_LIMIT = 500
+
+
+class RpcCache(object):
+    """Content addressed SQLite store of JSON-RPC results keyed by the hash of (method, params).
+
+    Only results of final blocks, at least `confirmations` blocks below the head, are stored. The least
+    recently read results are evicted when the stored results exceed max_size bytes, SQLite reuses the freed
+    pages so the file stops growing around that size.
+    """
+
+    def __init__(self, path, max_size=RpcCacheConfig.MAX_SIZE, confirmations=RpcCacheConfig.CONFIRMATIONS,
+                 head_refresh_seconds=RpcCacheConfig.HEAD_REFRESH_SECONDS):
+        self.path = path
+        self.max_size = int(max_size)
+        self.confirmations = int(confirmations)
+        self.head_refresh_seconds = float(head_refresh_seconds)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.execute('CREATE TABLE IF NOT EXISTS rpc_results '
+                                 '(key BLOB PRIMARY KEY, method TEXT, result BLOB, size INTEGER, accessed REAL)')
+        self._connection.execute('CREATE INDEX IF NOT EXISTS rpc_results_accessed ON rpc_results (accessed)')
+        self._size = self._connection.execute('SELECT COALESCE(SUM(size), 0) FROM rpc_results').fetchone()[0]
+
+        self._safe_block_number = None
+        self._head_time = 0
+        self.hits = 0
+        self.misses = 0
+        self.uncacheable = 0
+        self.stores = 0
+        self.evictions = 0
+
+    def is_final(self, block_number, get_head):
+        """get_head is only called when the head known is too old to tell"""
+        with self._lock:
+            safe_block_number = self._safe_block_number
+            if safe_block_number is not None and block_number <= safe_block_number:
+                return True
+            if time.time() - self._head_time < self.head_refresh_seconds:
+                return False
+        try:
+            head = get_head()
+        except Exception as e:
+            logger.warning(f"Can't get the head block, results aren't cached: {e!r}")
+            return False
+        with self._lock:
+            self._safe_block_number = max(self._safe_block_number or 0, head - self.confirmations)
+            self._head_time = time.time()
+            return block_number <= self._safe_block_number
+
+    def get_many(self, keys):
+        """Returns the stored results of the keys found, as JSON bytes"""
+        found = {}
+        with self._lock:
+            for start in range(0, len(keys), _SQL_VARIABLES_LIMIT):
+                chunk = keys[start:start + _SQL_VARIABLES_LIMIT]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self._connection.execute(
+                    f'SELECT key, result FROM rpc_results WHERE key IN ({placeholders})', chunk).fetchall()
+                found.update(rows)
+            if found:
+                now = time.time()
+                self._connection.executemany('UPDATE rpc_results SET accessed = ? WHERE key = ?',
+                                             [(now, key) for key in found])
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, items):
+        """items are (key, method, result) with the result as JSON bytes"""
+        if not items:
+            return
+        now = time.time()
+        with self._lock:
+            self._connection.execute('BEGIN')
+            try:
+                for key, method, result in items:
+                    cursor = self._connection.execute(
+                        'INSERT OR IGNORE INTO rpc_results (key, method, result, size, accessed) VALUES (?, ?, ?, ?, ?)',
+                        (key, method, result, len(result), now))
+                    if cursor.rowcount == 1:
+                        self._size += len(result)
+                        self.stores += 1
+                self._connection.execute('COMMIT')
+            except Exception:
+                self._connection.execute('ROLLBACK')
+                raise
+            if self._size > self.max_size:
+                self._evict()
+
+    def record_uncacheable(self, count):
+        with self._lock:
+            self.uncacheable += count
+
+    def get_stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'path': self.path,
+                'hits': self.hits,
+                'misses': self.misses,
+                'uncacheable': self.uncacheable,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else None,
+                'stores': self.stores,
+                'evictions': self.evictions,
+                'size_mb': round(self._size / 1024 / 1024, 1),
+                'max_size_mb': round(self.max_size / 1024 / 1024, 1),
+            }
+
+    def log_stats(self):
+        logger.info(f"RPC cache {self.get_stats()}")
+
+    def _evict(self):
+        # down to 90% so a full cache doesn't evict on every write
+        target = self.max_size * 0.9
+        self._connection.execute('BEGIN')
+        try:
+            while self._size > target:
+                rows = self._connection.execute(
+                    'SELECT key, size FROM rpc_results ORDER BY accessed LIMIT 1000').fetchall()
+                if not rows:
+                    self._size = 0
+                    break
+                for key, size in rows:
+                    if self._size <= target:
+                        break
+                    self._connection.execute('DELETE FROM rpc_results WHERE key = ?', (key,))
+                    self._size -= size
+                    self.evictions += 1
+            self._connection.execute('COMMIT')
+        except Exception:
+            self._connection.execute('ROLLBACK')
+            raise
+
+
+class CachedProvider(JSONBaseProvider):
+    """Answers requests about final blocks from an RpcCache and sends only the rest to the provider"""
+
+    def __init__(self, provider, cache):
+        super().__init__()
+        self._provider = provider
+        self._cache = cache
+
+    def make_request(self, method, params):
+        key = self._get_key(method, params)
+        if key is None:
+            self._cache.record_uncacheable(1)
+            return self._provider.make_request(method, params)
+
+        found = self._cache.get_many([key])
+        if key in found:
+            return {'jsonrpc': '2.0', 'id': 0, 'result': json_loads(found[key])}
+
+        response = self._provider.make_request(method, params)
+        self._cache.put_many(self._get_storable([(key, method, response)]))
+        return response
+
+    def make_batch_request(self, text):
+        requests = json.loads(text)
+        keys = [self._get_key(request.get('method'), request.get('params')) for request in requests]
+        lookup_keys = [key for key in keys if key is not None]
+        self._cache.record_uncacheable(len(keys) - len(lookup_keys))
+        found = self._cache.get_many(lookup_keys) if lookup_keys else {}
+
+        responses = [None] * len(requests)
+        missing = []
+        for index, (request, key) in enumerate(zip(requests, keys)):
+            if key is not None and key in found:
+                responses[index] = {'jsonrpc': '2.0', 'id': request.get('id'), 'result': json_loads(found[key])}
+            else:
+                missing.append(index)
+        if not missing:
+            return responses
+
+        fetched = self._provider.make_batch_request(json.dumps([requests[index] for index in missing]))
+        if not isinstance(fetched, list):
+            # the whole batch was rejected, the caller handles the error
+            return fetched
+        fetched_by_id = {response.get('id'): response for response in fetched}
+        stored = []
+        for index in missing:
+            response = fetched_by_id.get(requests[index].get('id'))
+            responses[index] = response
+            if keys[index] is not None:
+                stored.append((keys[index], requests[index].get('method'), response))
+        self._cache.put_many(self._get_storable(stored))
+        return [response for response in responses if response is not None]
+
+    def isConnected(self):
+        return self._provider.isConnected()
+
+    def _get_key(self, method, params):
+        """The cache key of a request about a final block, None for any other request"""
+        if method in RESULT_BLOCK_METHODS:
+            # whether the block is final is only known from the result
+            return _hash_request(method, params)
+        block_number = _get_block_number(method, params)
+        if block_number is None or not self._cache.is_final(block_number, self._get_head):
+            return None
+        return _hash_request(method, params)
+
+    def _get_storable(self, items):
+        storable = []
+        for key, method, response in items:
+            if not isinstance(response, dict) or response.get('error') is not None:
+                continue
+            result = response.get('result')
+            if result is None:
+                continue
+            if method in RESULT_BLOCK_METHODS:
+                block_number = _parse_block_number(result.get('blockNumber') or result.get('number'))
+                if block_number is None or not self._cache.is_final(block_number, self._get_head):
+                    continue
+            storable.append((key, method, json.dumps(result, separators=(',', ':')).encode('utf-8')))
+        return storable
+
+    def _get_head(self):
+        response = self._provider.make_request('eth_blockNumber', [])
+        return int(response['result'], 16)
+
+
+def _get_block_number(method, params):
+    if not isinstance(params, list):
+        return None
+    if method == 'eth_getLogs':
+        if not params or not isinstance(params[0], dict) or 'blockHash' in params[0]:
+            return None
+        from_block = _parse_block_number(params[0].get('fromBlock'))
+        to_block = _parse_block_number(params[0].get('toBlock'))
+        return to_block if from_block is not None else None
+    index = BLOCK_PARAMETER_INDEXES.get(method)
+    if index is None or index >= len(params):
+        # a missing block parameter means latest
+        return None
+    return _parse_block_number(params[index])
+
+
+def _parse_block_number(block):
+    """Block numbers only, tags like latest, pending or safe are never final"""
+    if isinstance(block, int):
+        return block
+    if isinstance(block, str) and block.startswith('0x'):
+        try:
+            return int(block, 16)
+        except ValueError:
+            return None
+    return None
+
+
+def _hash_request(method, params):
+    return hashlib.sha256(json.dumps([method, params], sort_keys=True, separators=(',', ':')).encode('utf-8')).digest()
+
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def get_rpc_cache(path):
+    """Every provider of the process shares the cache of a path"""
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            cache = RpcCache(path)
+            _caches[path] = cache
+        return cache
+
+
+def get_rpc_caches_stats():
+    with _caches_lock:
+        caches = list(_caches.values())
+    return [cache.get_stats() for cache in caches]
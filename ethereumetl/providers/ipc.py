@@ -21,7 +21,6 @@
 # SOFTWARE.
 
 
-import json
 import socket
 
 from web3.providers.ipc import IPCProvider
@@ -29,10 +28,9 @@ from web3._utils.threads import (
     Timeout,
 )
 from web3 import Web3
-try:
-    from json import JSONDecodeError
-except ImportError:
-    JSONDecodeError = ValueError
+
+from config.config import IPCConfig
+from utils.json_utils import JsonFrameScanner, json_loads
 
 
 # Mostly copied from web3.py/providers/ipc.py. Supports batch requests.
@@ -41,6 +39,10 @@ except ImportError:
 class BatchIPCProvider(Web3.IPCProvider):
     _socket = None
 
+    def __init__(self, *args, receive_size=IPCConfig.RECEIVE_SIZE, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._reader = JsonRpcSocketReader(receive_size)
+
     def make_batch_request(self, text):
         request = text.encode('utf-8')
         with self._lock, self._socket as sock:
@@ -51,27 +53,46 @@ class BatchIPCProvider(Web3.IPCProvider):
                 sock = self._socket.reset()
                 sock.sendall(request)
 
-            raw_response = b""
-            with Timeout(self.timeout) as timeout:
-                while True:
-                    try:
-                        raw_response += sock.recv(4096)
-                    except socket.timeout:
-                        timeout.sleep(0)
-                        continue
-                    if raw_response == b"":
-                        timeout.sleep(0)
-                    elif has_valid_json_rpc_ending(raw_response):
-                        try:
-                            response = json.loads(raw_response.decode('utf-8'))
-                        except JSONDecodeError:
-                            timeout.sleep(0)
-                            continue
-                        else:
-                            return response
-                    else:
-                        timeout.sleep(0)
-                        continue
+            return self._reader.read(sock, self.timeout)
+
+
+class JsonRpcSocketReader(object):
+    """Reads one JSON-RPC response from a socket.
+
+    The response is received straight into a reused bytearray that doubles when it's full, its end is found
+    by scanning only the new bytes of every chunk and it's parsed once, with orjson or ujson when installed.
+    Not thread safe, the provider reads under its lock.
+    """
+
+    def __init__(self, receive_size=IPCConfig.RECEIVE_SIZE):
+        self.receive_size = int(receive_size)
+        self._buffer = bytearray(self.receive_size)
+        self._scanner = JsonFrameScanner()
+
+    def read(self, sock, timeout):
+        buffer = self._buffer
+        scanner = self._scanner
+        scanner.reset()
+        length = 0
+        with Timeout(timeout) as _timeout:
+            while True:
+                if len(buffer) - length < self.receive_size:
+                    buffer.extend(bytes(len(buffer)))
+                try:
+                    with memoryview(buffer) as view:
+                        received = sock.recv_into(view[length:])
+                except socket.timeout:
+                    _timeout.sleep(0)
+                    continue
+                if received == 0:
+                    _timeout.sleep(0)
+                    continue
+                length += received
+                end = scanner.scan(buffer, length)
+                if end is None:
+                    _timeout.sleep(0)
+                    continue
+                return json_loads(buffer[:end])
 
 
 # A valid JSON RPC response can only end in } or ] http://www.jsonrpc.org/specification
@@ -0,0 +1,26 @@
+from web3.providers.base import JSONBaseProvider
+
+from utils.process_limits import RPC, process_limit
+
+
+class LimitedProvider(JSONBaseProvider):
+    """Sends the requests of a provider within the RPC limit shared by the processes of a backfill"""
+
+    def __init__(self, provider):
+        super().__init__()
+        self._provider = provider
+
+    def make_request(self, method, params):
+        with process_limit(RPC):
+            return self._provider.make_request(method, params)
+
+    def isConnected(self):
+        return self._provider.isConnected()
+
+
+class LimitedBatchProvider(LimitedProvider):
+    """A LimitedProvider of a batch provider, a batch takes one request of the limit"""
+
+    def make_batch_request(self, text):
+        with process_limit(RPC):
+            return self._provider.make_batch_request(text)
@@ -0,0 +1,45 @@
+import re
+import time
+
+from web3.providers.base import JSONBaseProvider
+
+from services.metrics_service import RPC_REQUESTS, RPC_SECONDS
+
+_METHOD_PATTERN = re.compile(r'"method":\s*"([^"]+)"')
+
+
+class MeteredProvider(JSONBaseProvider):
+    """Records the round trip of every request of a provider, MeteredBatchProvider also the one of its batches"""
+
+    def __init__(self, provider):
+        super().__init__()
+        self._provider = provider
+
+    def make_request(self, method, params):
+        start = time.time()
+        try:
+            return self._provider.make_request(method, params)
+        finally:
+            RPC_SECONDS.labels(method).observe(time.time() - start)
+            RPC_REQUESTS.labels(method).inc()
+
+    def isConnected(self):
+        return self._provider.isConnected()
+
+
+class MeteredBatchProvider(MeteredProvider):
+    """A MeteredProvider of a batch provider.
+
+    A batch is observed once under the method of its first request, the batches of the project never mix
+    methods. Requests are counted one by one, batched ones included.
+    """
+
+    def make_batch_request(self, text):
+        match = _METHOD_PATTERN.search(text)
+        method = match.group(1) if match else 'unknown'
+        start = time.time()
+        try:
+            return self._provider.make_batch_request(text)
+        finally:
+            RPC_SECONDS.labels(method).observe(time.time() - start)
+            RPC_REQUESTS.labels(method).inc(text.count('"method"'))
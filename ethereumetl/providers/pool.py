@@ -0,0 +1,263 @@
+import json
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from web3.providers.base import JSONBaseProvider
+
+from config.config import ProviderPoolConfig
+from ethereumetl.thread_local_proxy import ThreadLocalProxy
+from utils.utils import is_retriable_error
+
+logger = logging.getLogger('ProviderPool')
+
+# only idempotent calls are hedged, the project never sends transactions
+HEDGED_METHODS = {
+    'eth_blockNumber',
+    'eth_call',
+    'eth_getBalance',
+    'eth_getBlockByNumber',
+    'eth_getCode',
+    'eth_getLogs',
+    'eth_getTransactionReceipt',
+    'debug_traceBlockByNumber',
+}
+
+
+class EndpointStats(object):
+    def __init__(self, uri, ewma_alpha, latency_window):
+        self.uri = uri
+        self.ewma_alpha = ewma_alpha
+        self.latency_ewma = None
+        self.error_rate = 0.0
+        self.latencies = deque(maxlen=latency_window)
+        self.requests = 0
+        self.errors = 0
+        self.hedged = 0
+        self.block_number = None
+        self.ejected_until = 0
+        self.ejected_reason = None
+
+    def record(self, latency, error):
+        self.requests += 1
+        if error:
+            self.errors += 1
+        else:
+            self.latencies.append(latency)
+            if self.latency_ewma is None:
+                self.latency_ewma = latency
+            else:
+                self.latency_ewma += self.ewma_alpha * (latency - self.latency_ewma)
+        self.error_rate += self.ewma_alpha * ((1.0 if error else 0.0) - self.error_rate)
+
+    def p95(self):
+        if len(self.latencies) < 20:
+            return None
+        latencies = sorted(self.latencies)
+        return latencies[int(len(latencies) * 0.95) - 1]
+
+    def score(self):
+        # endpoints without samples yet are tried first so every endpoint gets measured, errors add a penalty
+        # of their own since failing endpoints may have no latency samples
+        latency = self.latency_ewma if self.latency_ewma is not None else 0.0
+        return latency * (1 + 10 * self.error_rate) + self.error_rate
+
+    def is_ejected(self, now):
+        return self.ejected_until > now
+
+    def to_dict(self, now):
+        p95 = self.p95()
+        return {
+            'uri': self.uri,
+            'latency_ewma_ms': round(self.latency_ewma * 1000, 1) if self.latency_ewma is not None else None,
+            'latency_p95_ms': round(p95 * 1000, 1) if p95 is not None else None,
+            'error_rate': round(self.error_rate, 3),
+            'requests': self.requests,
+            'errors': self.errors,
+            'hedged': self.hedged,
+            'block_number': self.block_number,
+            'ejected': self.is_ejected(now),
+            'ejected_reason': self.ejected_reason if self.is_ejected(now) else None,
+        }
+
+
+class ProviderPool(JSONBaseProvider):
+    """Routes requests over several endpoints by health.
+
+    Every endpoint keeps an EWMA of its latency and error rate and requests go to the healthiest one. A
+    read-only request still running after the endpoint p95 latency is hedged with a duplicate on the next
+    best endpoint and the first answer wins. A failed request fails over to the next endpoint. Endpoints
+    with a high error rate or lagging behind the highest block are ejected for a while.
+    """
+
+    def __init__(self, uris, provider_factory, hedge_after_seconds=ProviderPoolConfig.HEDGE_AFTER_SECONDS,
+                 max_error_rate=ProviderPoolConfig.MAX_ERROR_RATE, max_lag_blocks=ProviderPoolConfig.MAX_LAG_BLOCKS,
+                 eject_seconds=ProviderPoolConfig.EJECT_SECONDS,
+                 health_check_seconds=ProviderPoolConfig.HEALTH_CHECK_SECONDS):
+        super().__init__()
+        self.uris = list(uris)
+        self.hedge_after_seconds = float(hedge_after_seconds)
+        self.max_error_rate = float(max_error_rate)
+        self.max_lag_blocks = int(max_lag_blocks)
+        self.eject_seconds = float(eject_seconds)
+        self.health_check_seconds = float(health_check_seconds)
+
+        # each thread, including the hedging threads, has its own provider per endpoint
+        self._providers = {uri: ThreadLocalProxy(lambda uri=uri: provider_factory(uri)) for uri in self.uris}
+        self._stats = {uri: EndpointStats(uri, ewma_alpha=0.2, latency_window=200) for uri in self.uris}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=int(ProviderPoolConfig.MAX_WORKERS),
+                                            thread_name_prefix='ProviderPool')
+        self._last_health_check = 0
+        self._health_check_running = False
+
+    def make_request(self, method, params):
+        return self._execute(lambda provider: provider.make_request(method, params), hedge=method in HEDGED_METHODS)
+
+    def make_batch_request(self, text):
+        methods = {request.get('method') for request in json.loads(text)}
+        return self._execute(lambda provider: provider.make_batch_request(text), hedge=methods <= HEDGED_METHODS)
+
+    def isConnected(self):
+        return any(self._providers[uri].isConnected() for uri in self.uris)
+
+    def get_stats(self):
+        now = time.time()
+        with self._lock:
+            return [self._stats[uri].to_dict(now) for uri in self.uris]
+
+    def log_stats(self):
+        for stats in self.get_stats():
+            logger.info(f"Endpoint {stats}")
+
+    def _execute(self, call, hedge):
+        self._check_health_if_needed()
+        uris = self._rank()
+        last_error = None
+        for index, uri in enumerate(uris):
+            hedge_uri = uris[index + 1] if hedge and index + 1 < len(uris) else None
+            try:
+                return self._call_with_hedge(call, uri, hedge_uri)
+            except Exception as e:
+                last_error = e
+                logger.warning(f"Request to {uri} failed, trying the next endpoint: {e!r}")
+        raise last_error
+
+    def _call_with_hedge(self, call, uri, hedge_uri):
+        primary = self._executor.submit(self._timed_call, call, uri)
+        if hedge_uri is None:
+            return primary.result()
+
+        done, _ = wait([primary], timeout=self._hedge_deadline(uri))
+        if done:
+            return primary.result()
+
+        with self._lock:
+            self._stats[uri].hedged += 1
+        hedged = self._executor.submit(self._timed_call, call, hedge_uri)
+        pending = {primary, hedged}
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    return future.result()
+                except Exception as e:
+                    error = e
+        raise error
+
+    def _timed_call(self, call, uri):
+        start = time.time()
+        try:
+            response = call(self._providers[uri])
+        except Exception:
+            self._record(uri, time.time() - start, error=True)
+            raise
+        self._record(uri, time.time() - start, error=_is_node_error(response))
+        return response
+
+    def _record(self, uri, latency, error):
+        with self._lock:
+            stats = self._stats[uri]
+            stats.record(latency, error)
+            if stats.requests >= 20 and stats.error_rate > self.max_error_rate and not stats.is_ejected(time.time()):
+                self._eject(stats, f"error rate {round(stats.error_rate, 3)}")
+
+    def _hedge_deadline(self, uri):
+        with self._lock:
+            p95 = self._stats[uri].p95()
+        return p95 if p95 is not None else self.hedge_after_seconds
+
+    def _rank(self):
+        now = time.time()
+        with self._lock:
+            healthy = [uri for uri in self.uris if not self._stats[uri].is_ejected(now)]
+            # when every endpoint is ejected, the least bad one is still better than nothing
+            candidates = healthy or list(self.uris)
+            return sorted(candidates, key=lambda uri: self._stats[uri].score())
+
+    def _eject(self, stats, reason):
+        stats.ejected_until = time.time() + self.eject_seconds
+        stats.ejected_reason = reason
+        logger.warning(f"Ejecting {stats.uri} for {self.eject_seconds}s: {reason}")
+
+    def _check_health_if_needed(self):
+        with self._lock:
+            if self._health_check_running or time.time() - self._last_health_check < self.health_check_seconds:
+                return
+            self._health_check_running = True
+        self._executor.submit(self._check_health)
+
+    def _check_health(self):
+        try:
+            block_numbers = {}
+            for uri in self.uris:
+                try:
+                    response = self._timed_call(lambda provider: provider.make_request('eth_blockNumber', []), uri)
+                    block_numbers[uri] = int(response['result'], 16)
+                except Exception as e:
+                    logger.warning(f"Health check of {uri} failed: {e!r}")
+
+            with self._lock:
+                for uri, block_number in block_numbers.items():
+                    self._stats[uri].block_number = block_number
+                if block_numbers:
+                    highest_block = max(block_numbers.values())
+                    for uri, block_number in block_numbers.items():
+                        lag = highest_block - block_number
+                        if lag > self.max_lag_blocks:
+                            self._eject(self._stats[uri], f"{lag} blocks behind")
+        finally:
+            with self._lock:
+                self._last_health_check = time.time()
+                self._health_check_running = False
+
+
+def _is_node_error(response):
+    if isinstance(response, list):
+        return any(_is_node_error(response_item) for response_item in response)
+    error = response.get('error') if isinstance(response, dict) else None
+    return error is not None and is_retriable_error(error.get('code'))
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_provider_pool(uris, provider_factory):
+    """Endpoint health is shared by every user of the same list of uris"""
+    key = tuple(uris)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = ProviderPool(uris, provider_factory)
+            _pools[key] = pool
+        return pool
+
+
+def get_provider_pools_stats():
+    with _pools_lock:
+        pools = list(_pools.values())
+    return [stats for pool in pools for stats in pool.get_stats()]
@@ -0,0 +1,123 @@
+import atexit
+import gzip
+import json
+import logging
+import os
+import threading
+
+from web3.providers.base import JSONBaseProvider
+
+from utils.json_utils import json_loads
+
+logger = logging.getLogger('RpcRecorder')
+
+
+class RpcRecorder(object):
+    """Appends the requests answered by a node and their answers to a gzipped JSON lines fixture.
+
+    A line is one request, those of a batch are split, with its method, params and the result or the error
+    of the answer, the id is dropped. Every run appends a gzip member, gzip reads them back as one file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._file = gzip.open(path, 'at', encoding='utf-8')
+        self.records = 0
+
+    def record(self, method, params, response):
+        if not isinstance(response, dict) or ('result' not in response and 'error' not in response):
+            return
+        line = {'method': method, 'params': list(params or [])}
+        if response.get('error') is not None:
+            line['error'] = response['error']
+        else:
+            line['result'] = response.get('result')
+        text = json.dumps(line, separators=(',', ':')) + '\n'
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(text)
+            self.records += 1
+
+    def close(self):
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.close()
+            self._file = None
+        logger.info(f"Recorded {self.records} requests to {self.path}")
+
+
+class RecordingProvider(JSONBaseProvider):
+    """Records the requests of a provider and their answers with an RpcRecorder"""
+
+    def __init__(self, provider, recorder):
+        super().__init__()
+        self._provider = provider
+        self._recorder = recorder
+
+    def make_request(self, method, params):
+        response = self._provider.make_request(method, params)
+        self._recorder.record(method, params, response)
+        return response
+
+    def isConnected(self):
+        return self._provider.isConnected()
+
+
+class RecordingBatchProvider(RecordingProvider):
+    """A RecordingProvider of a batch provider, the requests of a batch are recorded one by one"""
+
+    def make_batch_request(self, text):
+        response = self._provider.make_batch_request(text)
+        if not isinstance(response, list):
+            # a rejected batch isn't an answer to any of its requests
+            return response
+        requests_by_id = {request.get('id'): request for request in json_loads(text)}
+        for response_item in response:
+            request = requests_by_id.get(response_item.get('id'))
+            if request is not None:
+                self._recorder.record(request.get('method'), request.get('params'), response_item)
+        return response
+
+
+def get_request_key(method, params):
+    """What a request is matched on, its id aside"""
+    return json.dumps([method, list(params or [])], sort_keys=True, separators=(',', ':'))
+
+
+def read_fixture(path):
+    """Yields the (method, params, response) of a fixture, the response without its id"""
+    with gzip.open(path, 'rt', encoding='utf-8') as fixture_file:
+        try:
+            for line in fixture_file:
+                try:
+                    record = json_loads(line)
+                except ValueError:
+                    # the last line of a run that was killed
+                    logger.warning(f"Skipping a cut record of {path}")
+                    continue
+                response = {'error': record['error']} if 'error' in record else {'result': record.get('result')}
+                yield record['method'], record['params'], response
+        except EOFError:
+            # the gzip member of a run that was killed isn't terminated, what was flushed of it is kept
+            logger.warning(f"{path} ends with a cut gzip member")
+
+
+_recorders = {}
+_recorders_lock = threading.Lock()
+
+
+def get_rpc_recorder(path):
+    """Every provider of the process records to the same file, it's closed at exit"""
+    with _recorders_lock:
+        recorder = _recorders.get(path)
+        if recorder is None:
+            recorder = RpcRecorder(path)
+            _recorders[path] = recorder
+            atexit.register(recorder.close)
+        return recorder
@@ -0,0 +1,165 @@
+import json
+import logging
+import os
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from ethereumetl.providers.recording import get_request_key, read_fixture
+from utils.json_utils import JsonFrameScanner, json_loads
+
+logger = logging.getLogger('RpcReplay')
+
+NOT_RECORDED_ERROR_CODE = -32001
+RECEIVE_SIZE = 65536
+
+
+class RpcFixture(object):
+    """The answers of a fixture written by RpcRecorder, by request.
+
+    A request recorded several times, like eth_blockNumber, gets its answers in the order they were recorded
+    and the last one once they are used up. A request that wasn't recorded gets an error. The answers are
+    kept serialized so replaying costs little CPU to the process it runs in.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._answers = {}
+        self._positions = {}
+        self._lock = threading.Lock()
+        self.answered = 0
+        self.misses = 0
+
+        for method, params, response in read_fixture(path):
+            if 'error' in response:
+                answer = b'"error":' + _dumps(response['error'])
+            else:
+                answer = b'"result":' + _dumps(response['result'])
+            self._answers.setdefault(get_request_key(method, params), []).append(answer)
+        logger.info(f"Loaded {sum(len(answers) for answers in self._answers.values())} answers "
+                    f"of {len(self._answers)} requests from {path}")
+
+    def answer(self, body):
+        """The JSON-RPC answer of a request or batch body, and the number of requests it held"""
+        request = json_loads(body)
+        if isinstance(request, list):
+            return b'[' + b','.join(self._answer_request(item) for item in request) + b']', len(request)
+        return self._answer_request(request), 1
+
+    def get_stats(self):
+        with self._lock:
+            return {'path': self.path, 'answered': self.answered, 'misses': self.misses}
+
+    def _answer_request(self, request):
+        method = request.get('method')
+        key = get_request_key(method, request.get('params'))
+        with self._lock:
+            answers = self._answers.get(key)
+            if answers:
+                position = self._positions.get(key, 0)
+                self._positions[key] = position + 1
+                answer = answers[min(position, len(answers) - 1)]
+                self.answered += 1
+            else:
+                answer = None
+                self.misses += 1
+        if answer is None:
+            logger.warning(f"No recorded answer to {key[:200]}")
+            answer = b'"error":' + _dumps({'code': NOT_RECORDED_ERROR_CODE, 'message': f"{method} not recorded"})
+        return b'{"jsonrpc":"2.0","id":' + _dumps(request.get('id')) + b',' + answer + b'}'
+
+
+class ReplayServer(object):
+    """Serves an RpcFixture over HTTP and IPC like a node would, from daemon threads.
+
+    Every request or batch is answered after latency_seconds plus call_latency_seconds for each of its
+    requests, to stand for the round trip and the work of a node.
+    """
+
+    def __init__(self, fixture, latency_seconds=0, call_latency_seconds=0):
+        self.fixture = fixture
+        self.latency_seconds = float(latency_seconds)
+        self.call_latency_seconds = float(call_latency_seconds)
+        self._servers = []
+
+    def serve_http(self, host='127.0.0.1', port=0):
+        """Returns the uri served, a free port is picked when port is 0"""
+        server = ThreadingHTTPServer((host, int(port)), _HttpHandler)
+        server.daemon_threads = True
+        server.replay_server = self
+        self._start(server)
+        return f"http://{host}:{server.server_address[1]}"
+
+    def serve_ipc(self, path):
+        """Returns the uri served, a socket left at path by a previous server is replaced"""
+        if os.path.exists(path):
+            os.remove(path)
+        server = socketserver.ThreadingUnixStreamServer(path, _IpcHandler)
+        server.daemon_threads = True
+        server.replay_server = self
+        self._start(server)
+        return f"file://{path}"
+
+    def answer(self, body):
+        payload, requests = self.fixture.answer(body)
+        delay = self.latency_seconds + self.call_latency_seconds * requests
+        if delay > 0:
+            time.sleep(delay)
+        return payload
+
+    def close(self):
+        for server in self._servers:
+            server.shutdown()
+            server.server_close()
+            if isinstance(server.server_address, str) and os.path.exists(server.server_address):
+                os.remove(server.server_address)
+        self._servers = []
+
+    def _start(self, server):
+        thread = threading.Thread(target=server.serve_forever, name='RpcReplayServer', daemon=True)
+        thread.start()
+        self._servers.append(server)
+
+
+class _HttpHandler(BaseHTTPRequestHandler):
+    # the connections of the providers are kept alive, the body isn't held back until the headers are acknowledged
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        try:
+            payload = self.server.replay_server.answer(body)
+        except ValueError:
+            self.send_error(400)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _IpcHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        buffer = bytearray()
+        scanner = JsonFrameScanner()
+        while True:
+            received = self.request.recv(RECEIVE_SIZE)
+            if not received:
+                return
+            buffer += received
+            end = scanner.scan(buffer)
+            while end is not None:
+                self.request.sendall(self.server.replay_server.answer(buffer[:end]) + b'\n')
+                del buffer[:end]
+                scanner.reset()
+                end = scanner.scan(buffer)
+
+
+def _dumps(value):
+    return json.dumps(value, separators=(',', ':')).encode('utf-8')
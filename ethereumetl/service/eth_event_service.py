@@ -1,6 +1,7 @@
 from eth_utils import keccak
 
 from config.constant import EventConstant, EventInputConstant
+from ethereumetl.service.event_decoder import EventDecoder
 
 
 def get_topic_filter(event_abi):
@@ -36,6 +37,8 @@ class EventSubscriber:
         self.topic_hash = topic_hash
         self.name = name
         self.list_params_in_order = list_params_in_order
+        # compiled once, every log of the event is decoded with it
+        self.decoder = EventDecoder(list_params_in_order)
 
 
 class EthEvent(object):
@@ -22,31 +22,33 @@
 import logging
 import time
 
-from web3 import Web3
-from web3.exceptions import BadFunctionCallOutput
+from eth_utils import function_signature_to_4byte_selector
 
-from artifacts.abi_pi.erc20_abi import ERC20_ABI
-from artifacts.abi_pi.lending_pool_abi import LENDING_POOL_ABI
-from artifacts.abi_pi.vToken_abi import VTOKEN_ABI
-from config.constant import WalletConstant, LendingTypeConstant, LoggerConstant, VTokenConstant, TestPerformanceConstant
-from data_storage.memory_storage import MemoryStorage
-from ethereumetl.providers.auto import get_provider_from_uri
-from ethereumetl.thread_local_proxy import ThreadLocalProxy
+from config.constant import WalletConstant, LendingTypeConstant, LoggerConstant, VTokenConstant
+from ethereumetl.service.eth_multicall_service import EthMulticallService, encode_call, decode_uint, \
+    decode_address
+from services.metrics_service import get_stage_seconds
 
 logger = logging.getLogger(LoggerConstant.EthLendingService)
 
+get_lending_info_trava_seconds = get_stage_seconds('get_lending_info_trava')
+get_lending_info_vtoken_seconds = get_stage_seconds('get_lending_info_vtoken')
+
+BALANCE_OF_SELECTOR = function_signature_to_4byte_selector('balanceOf(address)')
+GET_RESERVE_DATA_SELECTOR = function_signature_to_4byte_selector('getReserveData(address)')
+EXCHANGE_RATE_CURRENT_SELECTOR = function_signature_to_4byte_selector('exchangeRateCurrent()')
+BALANCE_OF_UNDERLYING_SELECTOR = function_signature_to_4byte_selector('balanceOfUnderlying(address)')
+BORROW_BALANCE_CURRENT_SELECTOR = function_signature_to_4byte_selector('borrowBalanceCurrent(address)')
+
+# word positions of tTokenAddress and variableDebtTokenAddress in the ReserveData struct
+RESERVE_DATA_T_TOKEN_WORD = 6
+RESERVE_DATA_VARIABLE_DEBT_TOKEN_WORD = 7
+
 
 class EthLendingService(object):
-    def __init__(self, web3, function_call_result_transformer=None, provider_uris=None):
+    def __init__(self, web3, function_call_result_transformer=None, provider_uris=None, batch_web3_provider=None):
         self._web3 = web3
-        self.web3s = [web3]
-        if provider_uris:
-            for provider in provider_uris:
-                batch_web3_provider = ThreadLocalProxy(lambda: get_provider_from_uri(provider, batch=True))
-                w3 = Web3(batch_web3_provider)
-                self.web3s.append(w3)
         self._function_call_result_transformer = function_call_result_transformer
-        self.token_contract = {}
         # self.mapping_abi = {
         #     TokenABIConfig.ERC20: ERC20_ABI,
         #     TokenABIConfig.VTOKEN: VToken_ABI
@@ -55,9 +57,11 @@ class EthLendingService(object):
             LendingTypeConstant.VTOKEN: self.get_lending_info_v_token,
             LendingTypeConstant.LENDING_POOL: self.get_lending_info_pool
         }
-        self.local_storage = MemoryStorage.getInstance()
-        self.local_storage.set(TestPerformanceConstant.get_lending_info_trava_time, 0)
-        self.local_storage.set(TestPerformanceConstant.get_lending_info_vtoken_time, 0)
+        self.batch_mapping_handler = {
+            LendingTypeConstant.VTOKEN: self.get_lending_infos_v_token,
+            LendingTypeConstant.LENDING_POOL: self.get_lending_infos_pool
+        }
+        self.multicall_service = EthMulticallService(web3, batch_web3_provider)
 
     def get_lending_info(self, contract_address, address, block_identifier="latest",
                          token_type=LendingTypeConstant.VTOKEN, asset_address=None):
@@ -71,6 +75,107 @@ class EthLendingService(object):
             return
         return handler(contract_address, address, block_identifier, asset_address)
 
+    def get_lending_infos(self, lookups):
+        """Resolves many (contract_address, address, block, token_type, asset_address) lookups in a few requests
+
+        :rtype: dict of lookup to (balance, pre_balance, supply, borrow, unit_token)
+        """
+        lookups_by_type = {}
+        for lookup in dict.fromkeys(lookups):
+            lookups_by_type.setdefault(lookup[3], []).append(lookup)
+
+        lending_infos = {}
+        for token_type, typed_lookups in lookups_by_type.items():
+            handler = self.batch_mapping_handler.get(token_type)
+            if not handler:
+                logger.warning(f"getting lending info for smart contract type :{token_type} has not supported ")
+                continue
+            lending_infos.update(handler(typed_lookups))
+        return lending_infos
+
+    def get_lending_infos_v_token(self, lookups):
+        start_time = time.time()
+        lookups = [lookup for lookup in lookups if lookup[1] != WalletConstant.address_nowhere]
+        exchange_rate_calls = list(dict.fromkeys(
+            (contract_address.lower(), encode_call(EXCHANGE_RATE_CURRENT_SELECTOR), block)
+            for contract_address, _, block, _, _ in lookups))
+        calls = list(exchange_rate_calls)
+        for contract_address, address, block, _, _ in lookups:
+            calls.append((contract_address, encode_call(BALANCE_OF_UNDERLYING_SELECTOR, address), block))
+            calls.append((contract_address, encode_call(BORROW_BALANCE_CURRENT_SELECTOR, address), block))
+        results = self.multicall_service.call(calls)
+
+        exchange_rates = {}
+        for (contract_address, _, block), result in zip(exchange_rate_calls, results):
+            exchange_rates[(contract_address, block)] = decode_uint(result)
+
+        lending_infos = {}
+        for index, lookup in enumerate(lookups):
+            contract_address, address, block, _, _ = lookup
+            exchange_rate = exchange_rates.get((contract_address.lower(), block))
+            supply = decode_uint(results[len(exchange_rate_calls) + 2 * index])
+            borrow = decode_uint(results[len(exchange_rate_calls) + 2 * index + 1])
+            if not exchange_rate or supply is None or borrow is None:
+                lending_infos[lookup] = None, None, None, None, None
+                continue
+            exchange_rate /= 10 ** VTokenConstant.EXCHANGE_RATE_DECIMALS
+            lending_infos[lookup] = 0, 0, round(supply / exchange_rate), round(borrow / exchange_rate), \
+                                    contract_address.lower()
+
+        get_lending_info_vtoken_seconds.observe(time.time() - start_time)
+        return lending_infos
+
+    def get_lending_infos_pool(self, lookups):
+        start_time = time.time()
+        lookups = [lookup for lookup in lookups
+                   if lookup[1] != WalletConstant.address_nowhere and lookup[4] is not None]
+        reserve_calls = list(dict.fromkeys(
+            (contract_address.lower(), encode_call(GET_RESERVE_DATA_SELECTOR, asset_address.lower()), block)
+            for contract_address, _, block, _, asset_address in lookups))
+        reserves = {}
+        for (contract_address, call_data, block), result in zip(reserve_calls,
+                                                                self.multicall_service.call(reserve_calls)):
+            reserves[(contract_address, call_data, block)] = (
+                decode_address(result, RESERVE_DATA_T_TOKEN_WORD),
+                decode_address(result, RESERVE_DATA_VARIABLE_DEBT_TOKEN_WORD)
+            )
+
+        balance_lookups = []
+        for contract_address, address, block, _, asset_address in lookups:
+            t_token_address, debt_token_address = reserves.get(
+                (contract_address.lower(), encode_call(GET_RESERVE_DATA_SELECTOR, asset_address.lower()), block))
+            if t_token_address is None or debt_token_address is None:
+                continue
+            balance_lookups.extend([
+                (t_token_address, address, block),
+                (debt_token_address, address, block),
+                (asset_address.lower(), address, block),
+                (asset_address.lower(), address, block - 1),
+            ])
+        balance_lookups = list(dict.fromkeys(balance_lookups))
+        balance_calls = [(token_address, encode_call(BALANCE_OF_SELECTOR, address), block)
+                         for token_address, address, block in balance_lookups]
+        balances = {lookup: decode_uint(result)
+                    for lookup, result in zip(balance_lookups, self.multicall_service.call(balance_calls))}
+
+        lending_infos = {}
+        for lookup in lookups:
+            contract_address, address, block, _, asset_address = lookup
+            t_token_address, debt_token_address = reserves.get(
+                (contract_address.lower(), encode_call(GET_RESERVE_DATA_SELECTOR, asset_address.lower()), block))
+            unit_token = asset_address.lower()
+            supply = balances.get((t_token_address, address, block))
+            borrow = balances.get((debt_token_address, address, block))
+            balance = balances.get((unit_token, address, block))
+            pre_balance = balances.get((unit_token, address, block - 1))
+            if supply is None or borrow is None or balance is None:
+                lending_infos[lookup] = None, None, None, None, None
+                continue
+            lending_infos[lookup] = balance, pre_balance, supply, borrow, unit_token
+
+        get_lending_info_trava_seconds.observe(time.time() - start_time)
+        return lending_infos
+
     def get_lending_info_v_token(self, contract_address, address, block_identifier="latest", asset_address=None):
         """
 
@@ -79,47 +184,31 @@ class EthLendingService(object):
 
         if address == WalletConstant.address_nowhere:
             return
-        # w3 = random.choice(self.web3s)
         start_time = time.time()
-        checksum_address = self._web3.toChecksumAddress(address)
-        checksum_token_address = self._web3.toChecksumAddress(contract_address)
-        contract_address = str(checksum_token_address).lower()
-        if not self.token_contract.get(contract_address):
-            self.token_contract[contract_address] = self._web3.eth.contract(address=checksum_token_address,
-                                                                            abi=VTOKEN_ABI)
-        contract = self.token_contract.get(contract_address)
+        contract_address = contract_address.lower()
+        address = address.lower()
 
         try:
-            # balance = self._get_first_result(contract.functions.balanceOf(checksum_address),
-            #                                  block_identifier=block_identifier)
-            # pre_balance = self._get_first_result(contract.functions.balanceOf(checksum_address),
-            #                                      block_identifier=block_identifier - 1)
-
             balance = 0
             pre_balance = 0
 
-            exchange_rate = self._get_first_result(contract.functions.exchangeRateCurrent(),
-                                                   block_identifier=block_identifier)
-
+            exchange_rate = self._call_uint(contract_address, encode_call(EXCHANGE_RATE_CURRENT_SELECTOR),
+                                            block_identifier)
             exchange_rate /= 10 ** VTokenConstant.EXCHANGE_RATE_DECIMALS
 
-            supply = self._get_first_result(contract.functions.balanceOfUnderlying(checksum_address),
-                                            block_identifier=block_identifier)
-            borrow = self._get_first_result(contract.functions.borrowBalanceCurrent(checksum_address),
-                                            block_identifier=block_identifier)
+            supply = self._call_uint(contract_address, encode_call(BALANCE_OF_UNDERLYING_SELECTOR, address),
+                                     block_identifier)
+            borrow = self._call_uint(contract_address, encode_call(BORROW_BALANCE_CURRENT_SELECTOR, address),
+                                     block_identifier)
             supply = round(supply / exchange_rate)
             borrow = round(borrow / exchange_rate)
             unit_token = contract_address
 
-            total_time = self.local_storage.get(TestPerformanceConstant.get_lending_info_vtoken_time)
-            self.local_storage.set(TestPerformanceConstant.get_lending_info_vtoken_time,
-                                   total_time + (time.time() - start_time))
+            get_lending_info_vtoken_seconds.observe(time.time() - start_time)
             return balance, pre_balance, supply, borrow, unit_token
 
         except Exception as e:
             logger.error(e)
-            # print(e)
-            # data_balance["data"] = None
             return None, None, None, None, None
 
     def get_lending_info_pool(self, contract_address, address, block_identifier="latest", asset_address=None):
@@ -129,99 +218,34 @@ class EthLendingService(object):
         """
         if address == WalletConstant.address_nowhere:
             return
-            # w3 = random.choice(self.web3s)
         start = time.time()
-        checksum_address = self._web3.toChecksumAddress(address)
-        checksum_token_address = self._web3.toChecksumAddress(contract_address)
-        contract_address = str(checksum_token_address).lower()
-        if not self.token_contract.get(contract_address):
-            self.token_contract[contract_address] = self._web3.eth.contract(address=checksum_token_address,
-                                                                            abi=LENDING_POOL_ABI)
-        contract = self.token_contract.get(contract_address)
+        contract_address = contract_address.lower()
+        address = address.lower()
 
         try:
-            # totalCollateralETH, totalDebtETH, availableBorrowsETH, currentLiquidationThreshold, ltv, healthFactor = self._get_first_result(
-            #     contract.functions.getUserAccountData(checksum_address),
-            #     block_identifier=block_identifier)
-            asset_address = self._web3.toChecksumAddress(asset_address)
-            ReserveData = self._get_first_result(contract.functions.getReserveData(asset_address),
-                                                 block_identifier=block_identifier)
-            tTokenAddress = str(ReserveData[6]).lower()
-            variableDebtTokenAddress = str(ReserveData[7]).lower()
-            unit_token = str(asset_address).lower()
-
-            if not self.token_contract.get(tTokenAddress):
-                checksum_token_address = self._web3.toChecksumAddress(tTokenAddress)
-                self.token_contract[tTokenAddress] = self._web3.eth.contract(address=checksum_token_address,
-                                                                             abi=ERC20_ABI)
-
-            if not self.token_contract.get(variableDebtTokenAddress):
-                checksum_token_address = self._web3.toChecksumAddress(variableDebtTokenAddress)
-                self.token_contract[variableDebtTokenAddress] = self._web3.eth.contract(address=checksum_token_address,
-                                                                                        abi=ERC20_ABI)
-            if not self.token_contract.get(unit_token):
-                checksum_token_address = self._web3.toChecksumAddress(unit_token)
-                self.token_contract[unit_token] = self._web3.eth.contract(address=checksum_token_address,
-                                                                          abi=ERC20_ABI)
-            contract_tToken = self.token_contract.get(tTokenAddress)
-            contract_dToken = self.token_contract.get(variableDebtTokenAddress)
-
-            contract_Token = self.token_contract.get(unit_token)
-            supply = self._get_first_result(contract_tToken.functions.balanceOf(checksum_address),
-                                            block_identifier=block_identifier)
-            borrow = self._get_first_result(contract_dToken.functions.balanceOf(checksum_address),
-                                            block_identifier=block_identifier)
-            balance = self._get_first_result(contract_Token.functions.balanceOf(checksum_address),
-                                             block_identifier=block_identifier)
-            pre_balance = self._get_first_result(contract_Token.functions.balanceOf(checksum_address),
-                                                 block_identifier=block_identifier - 1)
-
-            total_time = self.local_storage.get(TestPerformanceConstant.get_lending_info_trava_time)
-            self.local_storage.set(TestPerformanceConstant.get_lending_info_trava_time,
-                                   total_time + (time.time() - start))
+            unit_token = asset_address.lower()
+            reserve_data = self.multicall_service.call_one(
+                contract_address, encode_call(GET_RESERVE_DATA_SELECTOR, unit_token), block_identifier)
+            t_token_address = decode_address(reserve_data, RESERVE_DATA_T_TOKEN_WORD)
+            variable_debt_token_address = decode_address(reserve_data, RESERVE_DATA_VARIABLE_DEBT_TOKEN_WORD)
+            if t_token_address is None or variable_debt_token_address is None:
+                raise ValueError(f"No reserve data for asset {unit_token} in lending pool {contract_address}")
+
+            balance_of = encode_call(BALANCE_OF_SELECTOR, address)
+            supply = self._call_uint(t_token_address, balance_of, block_identifier)
+            borrow = self._call_uint(variable_debt_token_address, balance_of, block_identifier)
+            balance = self._call_uint(unit_token, balance_of, block_identifier)
+            pre_balance = self._call_uint(unit_token, balance_of, block_identifier - 1)
+
+            get_lending_info_trava_seconds.observe(time.time() - start)
             return balance, pre_balance, supply, borrow, unit_token
 
         except Exception as e:
             logger.error(e)
-            print(e)
-            # data_balance["data"] = None
             return None, None, None, None, None
 
-    def _get_first_result(self, *funcs, block_identifier="latest"):
-        for func in funcs:
-
-            result = self._call_contract_function(func, block_identifier=block_identifier)
-            if result is not None:
-                return result
-        return None
-
-    def _call_contract_function(self, func, block_identifier="latest"):
-        # BadFunctionCallOutput exception happens if the token doesn't implement a particular function
-        # or was self-destructed
-        # OverflowError exception happens if the return type of the function doesn't match the expected type
-        result = call_contract_function(
-            func=func,
-            ignore_errors=(BadFunctionCallOutput, OverflowError, ValueError),
-            default_value=None,
-            block_identifier=block_identifier
-        )
-
-        if self._function_call_result_transformer is not None:
+    def _call_uint(self, contract_address, call_data, block_identifier="latest"):
+        result = decode_uint(self.multicall_service.call_one(contract_address, call_data, block_identifier))
+        if result is not None and self._function_call_result_transformer is not None:
             return self._function_call_result_transformer(result)
-        else:
-            return result
-
-
-def call_contract_function(func, ignore_errors, default_value=None, block_identifier="latest"):
-    try:
-
-        result = func.call(block_identifier=block_identifier)
         return result
-    except Exception as ex:
-        if type(ex) in ignore_errors:
-            logger.exception('An exception occurred in function {} of contract {}. '.format(func.fn_name, func.address)
-                             + 'This exception can be safely ignored.')
-            return default_value
-        else:
-            logger.exception(ex)
-            return default_value
@@ -0,0 +1,84 @@
+import json
+import logging
+
+from config.config import GetLogsConfig
+from config.constant import LoggerConstant
+from ethereumetl.misc.retriable_value_error import RetriableValueError
+from services.json_rpc_requests import generate_get_logs_json_rpc
+from utils.utils import rpc_response_to_result, split_to_batches
+
+logger = logging.getLogger(LoggerConstant.EthLogsService)
+
+# error messages of providers limiting the size of an eth_getLogs response
+TOO_MANY_RESULTS_ERRORS = (
+    'more than',
+    'too many',
+    'limit exceeded',
+    'response size exceeded',
+    'response size should not greater than',
+    'exceed maximum block range',
+    'block range is too wide',
+    'query timeout exceeded',
+)
+
+
+class EthLogsService(object):
+    """Fetches logs with stateless eth_getLogs requests.
+
+    The block range is split into sub-ranges sent together as JSON-RPC batches. A sub-range rejected
+    because it has too many results is split in half and requested again, down to a single block.
+    """
+
+    def __init__(self, batch_web3_provider, sub_range_size=GetLogsConfig.SUB_RANGE_SIZE,
+                 max_batch_requests=GetLogsConfig.MAX_BATCH_REQUESTS):
+        self.batch_web3_provider = batch_web3_provider
+        self.sub_range_size = int(sub_range_size)
+        self.max_batch_requests = int(max_batch_requests)
+
+    def get_logs(self, from_block, to_block, topics=None, addresses=None):
+        """Returns the JSON logs of the block range, ordered by block"""
+        logs_by_range = {}
+        block_ranges = list(split_to_batches(from_block, to_block, self.sub_range_size))
+        while block_ranges:
+            batch, block_ranges = block_ranges[:self.max_batch_requests], block_ranges[self.max_batch_requests:]
+            for block_range, response in zip(batch, self._get_logs_batch(batch, topics, addresses)):
+                if is_too_many_results(response):
+                    block_ranges.extend(split_block_range(block_range, response))
+                    continue
+                logs_by_range[block_range] = rpc_response_to_result(response)
+
+        logs = []
+        for block_range in sorted(logs_by_range):
+            logs.extend(logs_by_range[block_range])
+        return logs
+
+    def _get_logs_batch(self, block_ranges, topics, addresses):
+        rpc = list(generate_get_logs_json_rpc(block_ranges, topics, addresses))
+        make_batch_request = getattr(self.batch_web3_provider, 'make_batch_request', None)
+        if make_batch_request is None:
+            return [self.batch_web3_provider.make_request(request['method'], request['params']) for request in rpc]
+
+        response = make_batch_request(json.dumps(rpc))
+        if not isinstance(response, list):
+            # the whole batch was rejected, raises a (retriable) error
+            rpc_response_to_result(response)
+        response_by_id = {response_item.get('id'): response_item for response_item in response}
+        return [response_by_id.get(request['id'], {}) for request in rpc]
+
+
+def is_too_many_results(response):
+    error = response.get('error')
+    if not error:
+        return False
+    message = str(error.get('message', '')).lower()
+    return any(too_many_results_error in message for too_many_results_error in TOO_MANY_RESULTS_ERRORS)
+
+
+def split_block_range(block_range, response):
+    from_block, to_block = block_range
+    if from_block == to_block:
+        # a single block can't be split any further, let the executor retry it
+        raise RetriableValueError(f"Too many logs in block {from_block}: {response.get('error')}")
+    middle = (from_block + to_block) // 2
+    logger.debug(f"Splitting eth_getLogs range {from_block}-{to_block} at {middle}")
+    return [(from_block, middle), (middle + 1, to_block)]
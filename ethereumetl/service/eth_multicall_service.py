@@ -0,0 +1,165 @@
+import json
+import logging
+
+from eth_abi import encode_abi, decode_abi
+from eth_utils import function_signature_to_4byte_selector
+
+from config.config import MulticallConfig
+from config.constant import LoggerConstant
+from services.json_rpc_requests import generate_eth_call_json_rpc
+from utils.utils import rpc_response_to_result
+
+logger = logging.getLogger(LoggerConstant.EthMulticallService)
+
+TRY_AGGREGATE_SELECTOR = function_signature_to_4byte_selector('tryAggregate(bool,(address,bytes)[])')
+
+
+class EthMulticallService(object):
+    """Resolves many (contract_address, call_data, block) calls in a few requests.
+
+    Calls at the same block are packed into Multicall2/Multicall3 tryAggregate calls and all of them are
+    sent as one JSON-RPC batch. When the multicall contract doesn't answer (not deployed on the chain or
+    not deployed yet at the block), the calls are sent as a JSON-RPC batch of plain eth_calls instead.
+    """
+
+    def __init__(self, web3, batch_web3_provider=None, multicall_address=MulticallConfig.MULTICALL_ADDRESS,
+                 batch_size=MulticallConfig.MULTICALL_BATCH_SIZE):
+        self._web3 = web3
+        self._batch_web3_provider = batch_web3_provider
+        self.multicall_address = multicall_address
+        self.batch_size = int(batch_size)
+
+    def call(self, calls):
+        """Returns the return data bytes of every call in order, None for calls that failed"""
+        calls = list(calls)
+        results = [None] * len(calls)
+        if not calls:
+            return results
+
+        fallback = []
+        if self.multicall_address:
+            indexes_by_block = {}
+            for index, (_, _, block) in enumerate(calls):
+                indexes_by_block.setdefault(block, []).append(index)
+
+            aggregate_calls = []
+            aggregate_indexes = []
+            for block, indexes in indexes_by_block.items():
+                for chunk in _chunks(indexes, self.batch_size):
+                    data = _encode_try_aggregate([(calls[index][0].lower(), calls[index][1]) for index in chunk])
+                    aggregate_calls.append((self.multicall_address, data, block))
+                    aggregate_indexes.append(chunk)
+
+            responses = self._eth_call_batch(aggregate_calls)
+            for indexes, response in zip(aggregate_indexes, responses):
+                decoded = _decode_try_aggregate(response)
+                if decoded is None or len(decoded) != len(indexes):
+                    fallback.extend(indexes)
+                    continue
+                for index, (success, return_data) in zip(indexes, decoded):
+                    results[index] = return_data if success and return_data else None
+        else:
+            fallback = list(range(len(calls)))
+
+        if fallback:
+            logger.debug(f"Resolving {len(fallback)} calls without multicall")
+            responses = self._eth_call_batch([calls[index] for index in fallback])
+            for index, response in zip(fallback, responses):
+                results[index] = response if response else None
+
+        return results
+
+    def _eth_call_batch(self, calls):
+        provider = self._batch_web3_provider if self._batch_web3_provider is not None else self._web3.provider
+        make_batch_request = getattr(provider, 'make_batch_request', None)
+        if make_batch_request is None:
+            return [self._eth_call(call) for call in calls]
+
+        results = []
+        for chunk in _chunks(calls, self.batch_size):
+            rpc = list(generate_eth_call_json_rpc(
+                (contract_address, '0x' + data.hex(), block) for contract_address, data, block in chunk))
+            response = make_batch_request(json.dumps(rpc))
+            if not isinstance(response, list):
+                # the whole batch was rejected, raises a (retriable) error
+                rpc_response_to_result(response)
+            response_by_id = {response_item.get('id'): response_item for response_item in response}
+            for request in rpc:
+                response_item = response_by_id.get(request['id'], {})
+                result = response_item.get('result')
+                if result is None:
+                    logger.debug(f"eth_call {request['params']} failed: {response_item.get('error')}")
+                    results.append(None)
+                else:
+                    results.append(bytes.fromhex(result[2:]))
+        return results
+
+    def call_one(self, contract_address, call_data, block='latest'):
+        """Return data of a single call, None when it failed.
+
+        The request is sent to the provider as is, skipping the contract objects, the ABI encoding and the
+        checksummed addresses of web3, call_data comes from encode_call with a precomputed selector.
+        """
+        return self._eth_call((contract_address, call_data, block))
+
+    def _eth_call(self, call):
+        contract_address, data, block = call
+        response = self._web3.provider.make_request('eth_call', [
+            {'to': contract_address, 'data': '0x' + data.hex()}, hex(block) if isinstance(block, int) else block])
+        result = response.get('result')
+        if result is None:
+            logger.debug(f"eth_call to {contract_address} at block {block} failed: {response.get('error')}")
+            return None
+        return bytes.fromhex(result[2:])
+
+
+def encode_call(selector, *addresses):
+    """Call data for a function whose arguments are all addresses"""
+    data = selector
+    for address in addresses:
+        data += bytes(12) + bytes.fromhex(address[2:])
+    return data
+
+
+def decode_uint(return_data, word_index=0):
+    if return_data is None or len(return_data) < (word_index + 1) * 32:
+        return None
+    return int.from_bytes(return_data[word_index * 32:(word_index + 1) * 32], 'big')
+
+
+def decode_address(return_data, word_index=0):
+    if return_data is None or len(return_data) < (word_index + 1) * 32:
+        return None
+    return '0x' + return_data[word_index * 32 + 12:(word_index + 1) * 32].hex()
+
+
+def decode_string(return_data):
+    """An ABI string, or a bytes32 right padded with zeros as some tokens return for name and symbol"""
+    if return_data is None or len(return_data) < 32:
+        return None
+    if len(return_data) >= 64:
+        offset = int.from_bytes(return_data[:32], 'big')
+        if offset + 32 <= len(return_data):
+            length = int.from_bytes(return_data[offset:offset + 32], 'big')
+            if offset + 32 + length <= len(return_data):
+                return return_data[offset + 32:offset + 32 + length].decode('utf-8', errors='replace')
+    return return_data[:32].rstrip(b'\x00').decode('utf-8', errors='replace')
+
+
+def _encode_try_aggregate(calls):
+    return TRY_AGGREGATE_SELECTOR + encode_abi(['bool', '(address,bytes)[]'], [False, calls])
+
+
+def _decode_try_aggregate(return_data):
+    if not return_data:
+        return None
+    try:
+        return decode_abi(['(bool,bytes)[]'], return_data)[0]
+    except Exception as e:
+        logger.debug(f"Can't decode tryAggregate result: {e}")
+        return None
+
+
+def _chunks(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
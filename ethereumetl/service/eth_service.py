@@ -19,28 +19,29 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+import json
 import logging
 from datetime import datetime, timezone
 
 from web3 import Web3
 
+from config.config import GetBalanceConfig
 from config.constant import LoggerConstant
 from ethereumetl.providers.auto import get_provider_from_uri
 from ethereumetl.thread_local_proxy import ThreadLocalProxy
 from services.graph_operations import GraphOperations, OutOfBoundsError, Point
+from services.json_rpc_requests import generate_get_balance_json_rpc
+from utils.utils import rpc_response_to_result
 
 
 class EthService(object):
-    def __init__(self, web3, provider_uris=None):
+    def __init__(self, web3, provider_uris=None, batch_web3_provider=None,
+                 balance_batch_size=GetBalanceConfig.BATCH_SIZE):
         graph = BlockTimestampGraph(web3)
         self._graph_operations = GraphOperations(graph)
         self.web3 = web3
-        self.web3s = [web3]
-        if provider_uris:
-            for provider in provider_uris:
-                batch_web3_provider = ThreadLocalProxy(lambda: get_provider_from_uri(provider, batch=True))
-                w3 = Web3(batch_web3_provider)
-                self.web3s.append(w3)
+        self.batch_web3_provider = batch_web3_provider
+        self.balance_batch_size = int(balance_batch_size)
 
     def get_block_range_for_date(self, date):
         start_datetime = datetime.combine(date, datetime.min.time().replace(tzinfo=timezone.utc))
@@ -78,8 +79,6 @@ class EthService(object):
     def get_balance(self, address, block_identifier="latest"):
         try:
             checksum_address = self.web3.toChecksumAddress(address)
-            # w3 = random.choice(self.web3s)
-            # balance = w3.eth.getBalance(checksum_address, block_identifier=block_identifier)
             balance = self.web3.eth.getBalance(checksum_address, block_identifier=block_identifier)
             return balance
         except Exception as e:
@@ -87,6 +86,35 @@ class EthService(object):
             # print(e)
             return None
 
+    def get_balances(self, lookups):
+        """Resolves many (address, block) native balance lookups in a few JSON-RPC batches
+
+        :rtype: dict of (address, block) to balance, None where the request failed
+        """
+        lookups = [lookup for lookup in dict.fromkeys(lookups) if lookup[1] >= 0]
+        make_batch_request = getattr(self.batch_web3_provider, 'make_batch_request', None)
+        if make_batch_request is None:
+            return {(address, block): self.get_balance(address, block) for address, block in lookups}
+
+        balances = {}
+        for start in range(0, len(lookups), self.balance_batch_size):
+            chunk = lookups[start:start + self.balance_batch_size]
+            response = make_batch_request(json.dumps(list(generate_get_balance_json_rpc(chunk))))
+            if not isinstance(response, list):
+                # the whole batch was rejected, raises a (retriable) error
+                rpc_response_to_result(response)
+            response_by_id = {response_item.get('id'): response_item for response_item in response}
+            for idx, lookup in enumerate(chunk):
+                response_item = response_by_id.get(idx, {})
+                result = response_item.get('result')
+                if result is None:
+                    logging.getLogger(LoggerConstant.EthService).error(
+                        f"eth_getBalance {lookup} failed: {response_item.get('error')}")
+                    balances[lookup] = None
+                else:
+                    balances[lookup] = int(result, 16)
+        return balances
+
 
 class BlockTimestampGraph(object):
     def __init__(self, web3):
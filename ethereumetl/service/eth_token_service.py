@@ -21,47 +21,35 @@
 # SOFTWARE.
 import logging
 
-from web3 import Web3
-from web3.exceptions import BadFunctionCallOutput
+from eth_utils import function_signature_to_4byte_selector
 
-from artifacts.abi_pi.erc20_abi import ERC20_ABI
 from config.constant import WalletConstant
 from ethereumetl.domain.token import EthToken
-from ethereumetl.providers.auto import get_provider_from_uri
-from ethereumetl.thread_local_proxy import ThreadLocalProxy
+from ethereumetl.service.eth_multicall_service import EthMulticallService, encode_call, decode_string, decode_uint
 
 logger = logging.getLogger('eth_token_service')
 
+BALANCE_OF_SELECTOR = function_signature_to_4byte_selector('balanceOf(address)')
+TOTAL_SUPPLY_SELECTOR = function_signature_to_4byte_selector('totalSupply()')
+# (lower case, upper case) selectors of the metadata functions, a few old tokens only have the upper case ones
+SYMBOL_SELECTORS = (function_signature_to_4byte_selector('symbol()'), function_signature_to_4byte_selector('SYMBOL()'))
+NAME_SELECTORS = (function_signature_to_4byte_selector('name()'), function_signature_to_4byte_selector('NAME()'))
+DECIMALS_SELECTORS = (function_signature_to_4byte_selector('decimals()'),
+                      function_signature_to_4byte_selector('DECIMALS()'))
+
 
 class EthTokenService(object):
-    def __init__(self, web3, function_call_result_transformer=None, provider_uris=None):
+    def __init__(self, web3, function_call_result_transformer=None, provider_uris=None, batch_web3_provider=None):
         self._web3 = web3
-        self.web3s = [web3]
-        if provider_uris:
-            for provider in provider_uris:
-                batch_web3_provider = ThreadLocalProxy(lambda: get_provider_from_uri(provider, batch=True))
-                w3 = Web3(batch_web3_provider)
-                self.web3s.append(w3)
         self._function_call_result_transformer = function_call_result_transformer
-        self.token_contract = {}
+        self.multicall_service = EthMulticallService(web3, batch_web3_provider)
 
     def get_token(self, token_address):
-        checksum_address = self._web3.toChecksumAddress(token_address)
-        contract = self._web3.eth.contract(address=checksum_address, abi=ERC20_ABI)
         token = EthToken()
         token.address = token_address.lower()
         try:
-            symbol = self._get_first_result(contract.functions.symbol(), contract.functions.SYMBOL())
-            name = self._get_first_result(contract.functions.name(), contract.functions.NAME())
-            decimals = self._get_first_result(contract.functions.decimals(), contract.functions.DECIMALS())
-            total_supply = self._get_first_result(contract.functions.totalSupply())
-
-
-
-            token.symbol = symbol
-            token.name = name
-            token.decimals = decimals
-            token.total_supply = total_supply
+            token.symbol, token.name, token.decimals = self.get_tokens_metadata([token.address])[token.address]
+            token.total_supply = self.get_total_supplies([token.address])[token.address]
         except Exception as e:
             logger.error(e)
             token.symbol = None
@@ -70,78 +58,62 @@ class EthTokenService(object):
             token.total_supply = None
         return token
 
-    def get_balance(self, token_address, address, block_identifier="latest", abi=ERC20_ABI):
-        # start_time = time()
-
+    def get_balance(self, token_address, address, block_identifier="latest"):
         if address == WalletConstant.address_nowhere:
             return
-        # w3 = random.choice(self.web3s)
-        checksum_address = self._web3.toChecksumAddress(address)
-        checksum_token_address = self._web3.toChecksumAddress(token_address)
-        token_address = str(checksum_token_address).lower()
-        if not self.token_contract.get(token_address):
-            self.token_contract[token_address] = self._web3.eth.contract(address=checksum_token_address,
-                                                                         abi=abi)
-        contract = self.token_contract.get(token_address)
-        # checksum_token_address = w3.toChecksumAddress(token_address)
-        # checksum_address = w3.toChecksumAddress(address)
-        # contract = w3.eth.contract(address=checksum_token_address, abi=ERC20_ABI)
-
         try:
-
-            # start_time = time.time()
-            balance = self._get_first_result(contract.functions.balanceOf(checksum_address),
-                                             block_identifier=block_identifier)
-            # print("balance ",balance)
-            # data_balance["data"] = balance
-            # print("time to call get balance of " + address + " at contract " + token_address + " is " + str(
-            #     time.time() - start_time))
-            return balance
-
+            result = self.multicall_service.call_one(token_address.lower(),
+                                                     encode_call(BALANCE_OF_SELECTOR, address.lower()),
+                                                     block_identifier)
+            return self._transform(decode_uint(result))
         except Exception as e:
             logger.error(e)
-            print(e)
-            # data_balance["data"] = None
             return None
 
-    def _get_first_result(self, *funcs, block_identifier="latest"):
-        try:
-            for func in funcs:
-
-                result = self._call_contract_function(func, block_identifier=block_identifier)
-                if result is not None:
-                    return result
-            return None
-        except Exception as e:
-            logger.error(e)
-
-    def _call_contract_function(self, func, block_identifier="latest"):
-        # BadFunctionCallOutput exception happens if the token doesn't implement a particular function
-        # or was self-destructed
-        # OverflowError exception happens if the return type of the function doesn't match the expected type
-        result = call_contract_function(
-            func=func,
-            ignore_errors=(BadFunctionCallOutput, OverflowError, ValueError),
-            default_value=None,
-            block_identifier=block_identifier
-        )
-
-        if self._function_call_result_transformer is not None:
+    def get_balances(self, lookups):
+        """Resolves many (token_address, address, block) balance lookups in a few requests
+
+        :rtype: dict of (token_address, address, block) to balance, None where the call failed
+        """
+        lookups = [lookup for lookup in dict.fromkeys(lookups) if lookup[1] != WalletConstant.address_nowhere]
+        calls = [(token_address, encode_call(BALANCE_OF_SELECTOR, address), block)
+                 for token_address, address, block in lookups]
+        results = self.multicall_service.call(calls)
+        return {lookup: decode_uint(result) for lookup, result in zip(lookups, results)}
+
+    def get_tokens_metadata(self, token_addresses):
+        """Symbols, names and decimals of many tokens in a few requests
+
+        :rtype: dict of token_address to (symbol, name, decimals), None where the token doesn't answer
+        """
+        token_addresses = list(dict.fromkeys(token_addresses))
+        fields = [(SYMBOL_SELECTORS, decode_string), (NAME_SELECTORS, decode_string),
+                  (DECIMALS_SELECTORS, decode_uint)]
+        values = {(token_address, field): None for token_address in token_addresses for field in range(len(fields))}
+        # the upper case functions are only called for the fields the lower case ones didn't answer
+        for selector_index in range(2):
+            keys = [key for key, value in values.items() if value is None]
+            if not keys:
+                break
+            results = self.multicall_service.call(
+                [(token_address, fields[field][0][selector_index], 'latest') for token_address, field in keys])
+            for (token_address, field), result in zip(keys, results):
+                values[(token_address, field)] = self._transform(fields[field][1](result))
+
+        return {token_address: tuple(values[(token_address, field)] for field in range(len(fields)))
+                for token_address in token_addresses}
+
+    def get_total_supplies(self, token_addresses, block_identifier='latest'):
+        """Total supplies of many tokens in one batch of multicalls
+
+        :rtype: dict of token_address to total supply, None where the call failed
+        """
+        token_addresses = list(dict.fromkeys(token_addresses))
+        results = self.multicall_service.call(
+            [(token_address, TOTAL_SUPPLY_SELECTOR, block_identifier) for token_address in token_addresses])
+        return {token_address: decode_uint(result) for token_address, result in zip(token_addresses, results)}
+
+    def _transform(self, result):
+        if result is not None and self._function_call_result_transformer is not None:
             return self._function_call_result_transformer(result)
-        else:
-            return result
-
-
-def call_contract_function(func, ignore_errors, default_value=None, block_identifier="latest"):
-    try:
-
-        result = func.call(block_identifier=block_identifier)
         return result
-    except Exception as ex:
-        if type(ex) in ignore_errors:
-            logger.exception('An exception occurred in function {} of contract {}. '.format(func.fn_name, func.address)
-                             + 'This exception can be safely ignored.')
-            return default_value
-        else:
-            logger.exception(ex)
-            return default_value
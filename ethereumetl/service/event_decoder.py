@@ -0,0 +1,163 @@
+import re
+
+from config.constant import EventInputConstant
+
+# hex digits of an ABI word
+WORD = 64
+
+_ARRAY_PATTERN = re.compile(r'^(.*)\[(\d*)\]$')
+_INT_PATTERN = re.compile(r'^(u?)int(\d*)$')
+_FIXED_PATTERN = re.compile(r'^(u?)fixed(\d+x\d+)?$')
+_BYTES_PATTERN = re.compile(r'^bytes(\d+)$')
+
+
+class EventDecoder(object):
+    """Decodes the topics and data of the logs of an event, compiled once from its parameters.
+
+    Every parameter gets a decoder reading a fixed slice of the topics or of the data head, values of dynamic types
+    are read at the offset of their head slot. Integers and addresses are strings like the previous decoding,
+    arrays are lists. Indexed parameters of dynamic types are only known by the hash in their topic, which is kept.
+    """
+
+    def __init__(self, list_params_in_order):
+        self.num_topics = 1
+        self.head_size = 0
+        self.is_dynamic = False
+        self._decoders = []
+        for param in list_params_in_order:
+            name = param.get(EventInputConstant.name)
+            abi_type = param.get(EventInputConstant.type)
+            if param.get(EventInputConstant.indexed):
+                self._decoders.append((name, True, self.num_topics, _get_topic_decoder(abi_type)))
+                self.num_topics += 1
+            else:
+                is_dynamic, words, decode = _get_type_decoder(abi_type)
+                self._decoders.append((name, False, self.head_size, decode))
+                self.head_size += WORD if is_dynamic else words * WORD
+                self.is_dynamic = self.is_dynamic or is_dynamic
+
+    def decode(self, topics, data):
+        """The params of the log, None when the topics or the data don't fit the event"""
+        if len(topics) != self.num_topics:
+            return None
+        data = data[2:] if data else ''
+        if len(data) < self.head_size or (not self.is_dynamic and len(data) != self.head_size):
+            return None
+        params = {}
+        try:
+            for name, indexed, position, decode in self._decoders:
+                if indexed:
+                    params[name] = decode(topics[position])
+                else:
+                    params[name] = decode(data, 0, position)
+        except (ValueError, IndexError):
+            # an offset or length out of the data
+            return None
+        return params
+
+
+def _get_topic_decoder(abi_type):
+    if _is_dynamic(abi_type) or _ARRAY_PATTERN.match(abi_type):
+        return lambda topic: topic
+    convert = _get_word_converter(abi_type)
+    return lambda topic: convert(topic[2:])
+
+
+def _get_type_decoder(abi_type):
+    """(is dynamic, words in the head when static, decode(data, base, position))
+
+    position is where the head slot starts, base where the encoding the offsets are relative to starts.
+    """
+    array = _ARRAY_PATTERN.match(abi_type)
+    if array:
+        element_type, size = array.group(1), array.group(2)
+        element_dynamic, element_words, decode_element = _get_type_decoder(element_type)
+        if size:
+            return _get_fixed_array_decoder(int(size), element_dynamic, element_words, decode_element)
+        return True, 1, _get_dynamic_array_decoder(element_dynamic, element_words, decode_element)
+
+    if abi_type == 'string':
+        return True, 1, lambda data, base, position: bytes.fromhex(_read_bytes(data, base, position)).decode(
+            'utf-8', errors='replace')
+    if abi_type == 'bytes':
+        return True, 1, lambda data, base, position: '0x' + _read_bytes(data, base, position)
+
+    convert = _get_word_converter(abi_type)
+    return False, 1, lambda data, base, position: convert(data[position:position + WORD])
+
+
+def _get_fixed_array_decoder(size, element_dynamic, element_words, decode_element):
+    if not element_dynamic:
+        def decode_static(data, base, position):
+            return [decode_element(data, base, position + index * element_words * WORD) for index in range(size)]
+
+        return False, size * element_words, decode_static
+
+    def decode_dynamic(data, base, position):
+        start = base + _read_offset(data, position)
+        return [decode_element(data, start, start + index * WORD) for index in range(size)]
+
+    return True, 1, decode_dynamic
+
+
+def _get_dynamic_array_decoder(element_dynamic, element_words, decode_element):
+    slot_size = WORD if element_dynamic else element_words * WORD
+
+    def decode(data, base, position):
+        start = base + _read_offset(data, position)
+        length = int(data[start:start + WORD], 16)
+        if start + WORD + length * slot_size > len(data):
+            raise ValueError(f"Array of {length} elements out of the data")
+        start += WORD
+        return [decode_element(data, start, start + index * slot_size) for index in range(length)]
+
+    return decode
+
+
+def _read_offset(data, position):
+    offset = int(data[position:position + WORD], 16) * 2
+    if offset + WORD > len(data):
+        raise ValueError(f"Offset {offset // 2} out of the data")
+    return offset
+
+
+def _read_bytes(data, base, position):
+    start = base + _read_offset(data, position)
+    length = int(data[start:start + WORD], 16) * 2
+    if start + WORD + length > len(data):
+        raise ValueError(f"{length // 2} bytes out of the data")
+    return data[start + WORD:start + WORD + length]
+
+
+def _get_word_converter(abi_type):
+    """Converts the 64 hex digits of a static type"""
+    integer = _INT_PATTERN.match(abi_type) or _FIXED_PATTERN.match(abi_type)
+    if integer:
+        # fixed point numbers are kept unscaled
+        if integer.group(1):
+            return lambda word: str(int(word, 16))
+        return _to_signed
+    if abi_type == 'address':
+        return lambda word: '0x' + word[-40:].lower()
+    if abi_type == 'bool':
+        return lambda word: str(int(word, 16) != 0)
+    fixed_bytes = _BYTES_PATTERN.match(abi_type)
+    if fixed_bytes:
+        size = int(fixed_bytes.group(1)) * 2
+        return lambda word: '0x' + word[:size]
+    if abi_type == 'function':
+        return lambda word: '0x' + word[:48]
+    # tuples and unknown types, the raw word
+    return lambda word: '0x' + word
+
+
+def _to_signed(word):
+    value = int(word, 16)
+    # ints are sign extended to 256 bits
+    if value >= 2 ** 255:
+        value -= 2 ** 256
+    return str(value)
+
+
+def _is_dynamic(abi_type):
+    return abi_type in ('string', 'bytes')
@@ -1,19 +1,31 @@
+import json
+import logging
 import os
 from csv import reader
 
 from web3 import Web3
 from web3.middleware import geth_poa_middleware
 
+from blockchainetl.jobs.exporters.block_recording_item_exporter import BlockRecordingItemExporter
 from blockchainetl.jobs.exporters.console_item_exporter import ConsoleItemExporter
 from blockchainetl.jobs.exporters.databasse.mongo_db import Database
 from config.config import FilterConfig
-from config.constant import EthKnowledgeGraphStreamerAdapterConstant, WalletConstant
+from config.constant import EthKnowledgeGraphStreamerAdapterConstant, LendingTypeConstant, TokenConstant
+from data_storage.balance_ledger import BalanceLedger
 from data_storage.wallet_filter_storage import WalletFilterMemoryStorage
 from ethereumetl.jobs.export_knowledge_graph_needed_common import export_klg_with_item_exporter
+from ethereumetl.providers.auto import get_provider_from_uri
 from ethereumetl.service.eth_lending_service import EthLendingService
+from ethereumetl.service.eth_service import EthService
 from ethereumetl.service.eth_token_service import EthTokenService
+from ethereumetl.thread_local_proxy import ThreadLocalProxy
+from services.json_rpc_requests import generate_get_block_by_number_json_rpc
 from services.partition_service import get_partitions
 from utils.boolean_utils import to_bool
+from utils.resource_utils import get_root_path
+from utils.utils import rpc_response_to_result
+
+logger = logging.getLogger('EthKnowledgeGraphStreamerAdapter')
 
 
 class EthKnowledgeGraphStreamerAdapter:
@@ -28,7 +40,8 @@ class EthKnowledgeGraphStreamerAdapter:
             tokens=None,
             batch_size=EthKnowledgeGraphStreamerAdapterConstant.batch_size_default,
             max_workers=EthKnowledgeGraphStreamerAdapterConstant.max_workers_default,
-            provider_uris=None
+            provider_uris=None,
+            export_tokens=True
     ):
 
         self.provider_uri = provider_uri
@@ -36,6 +49,8 @@ class EthKnowledgeGraphStreamerAdapter:
         self.w3 = Web3(batch_web3_provider)
         self.w3.middleware_onion.inject(geth_poa_middleware, layer=0)
         self.item_exporter = item_exporter
+        # the blocks exported are checked by the streamer for reorgs
+        self.block_recorder = BlockRecordingItemExporter(item_exporter)
         self.batch_size = batch_size
         self.max_workers = max_workers
 
@@ -44,47 +59,34 @@ class EthKnowledgeGraphStreamerAdapter:
         self.tokens_filter_file = self.cur_path + tokens_filter_file
         self.tokens = tokens
         self.provider_uris = provider_uris
+        # the tokens and their total supplies, refreshed by one process writing the token metadata file
+        self.export_tokens = export_tokens
         self.event_abi_dir = event_abi_dir
-        self.ethTokenService = EthTokenService(self.w3, clean_user_provided_content)
-        self.ethLendingService = EthLendingService(self.w3, clean_user_provided_content)
+        # balance lookups are sent as JSON-RPC batches even when the web3 provider is not a batch one
+        self.balance_batch_provider = ThreadLocalProxy(lambda: get_provider_from_uri(provider_uri, batch=True))
+        self.ethTokenService = EthTokenService(self.w3, clean_user_provided_content,
+                                               batch_web3_provider=self.balance_batch_provider)
+        self.ethLendingService = EthLendingService(self.w3, clean_user_provided_content,
+                                                   batch_web3_provider=self.balance_batch_provider)
+        self.ethService = EthService(self.w3, batch_web3_provider=self.balance_batch_provider)
         self.filter_for_lending = to_bool(FilterConfig.FILTER_FOR_LENDING)
-        if self.filter_for_lending:
-            self.get_wallet_filter()
-        self.wallet_filter = WalletFilterMemoryStorage.getInstance()
-
-        # self.get_wallet_filter()
-        self.init_wallet_filter_from_file()
+        self.wallet_filter = load_wallet_filter(self.filter_for_lending)
 
     def open(self):
         self.item_exporter.open()
 
-    def get_wallet_filter(self):
-        self.database = Database()
-        wallets = self.database.get_all_wallet()
-        for wallet in wallets:
-            address = wallet.get(WalletConstant.address)
-            self.wallet_filter.set(address, wallet)
-
-    def init_wallet_filter_from_file(self):
-
-        file_csv_1 = self.cur_path + "artifacts/wallet_filter/Orai-holder-eth.csv"
-        file_csv_bsc = self.cur_path + "artifacts/wallet_filter/Orai-holder-bsc.csv"
-        with open(file_csv_bsc, 'r') as read_obj:
-            # pass the file object to reader() to get the reader object
-            csv_reader = reader(read_obj)
-            # Iterate over each row in the csv using reader object
-            for row in csv_reader:
-                address = str(row[0]).lower()
-                print(address)
-                self.wallet_filter.set(address, {})
-
     def get_current_block_number(self):
         return int(self.w3.eth.blockNumber)
 
     def export_all(self, start_block, end_block):
         partition_batch_size = EthKnowledgeGraphStreamerAdapterConstant.partition_batch_size_default
         partitions = get_partitions(str(start_block), str(end_block), partition_batch_size, self.provider_uri)
-        item_exporter = self.item_exporter
+        self.export_partitions(partitions)
+
+    def export_partitions(self, partitions):
+        """partitions are (start_block, end_block, partition_dir) as yielded by get_partitions"""
+        item_exporter = self.block_recorder
+        self.block_recorder.pop_blocks()
         with open(self.tokens_filter_file, "r") as file:
             tokens_list = file.read().splitlines()
             tokens = []
@@ -98,9 +100,57 @@ class EthKnowledgeGraphStreamerAdapter:
                                           provider_uris=self.provider_uris,
                                           w3=self.w3,
                                           ethTokenService=self.ethTokenService,
-                                          ethLendingService=self.ethLendingService
+                                          ethLendingService=self.ethLendingService,
+                                          export_tokens=self.export_tokens
                                           )
 
+    def get_exported_blocks(self):
+        """(number, hash, parent_hash) of the blocks of the last export"""
+        return self.block_recorder.pop_blocks()
+
+    def get_block_hashes(self, block_numbers):
+        """block number -> hash of the canonical chain of the node"""
+        rpc = list(generate_get_block_by_number_json_rpc(block_numbers, False))
+        response = self.balance_batch_provider.make_batch_request(json.dumps(rpc))
+        if not isinstance(response, list):
+            rpc_response_to_result(response)
+        block_hashes = {}
+        for response_item in response:
+            result = rpc_response_to_result(response_item)
+            block_hashes[int(result['number'], 16)] = result['hash']
+        return block_hashes
+
+    def rollback(self, start_block, end_block):
+        """Removes what was exported for the blocks of the range, a reorg orphaned them"""
+        if hasattr(self.item_exporter, 'rollback'):
+            self.item_exporter.rollback(start_block, end_block, self.read_wallet_states)
+        else:
+            logger.warning(f"{type(self.item_exporter).__name__} can't roll back, "
+                           f"the orphaned blocks {start_block}-{end_block} stay exported")
+        BalanceLedger.getInstance().rollback(start_block - 1)
+
+    def read_wallet_states(self, balance_keys, lending_keys, block_number):
+        """Balances by (address, unit token) and (supply, borrow) by (address, unit token, contract address) at
+        the end of the block, read from the node, None where the calls failed"""
+        native_keys = [key for key in balance_keys if key[1] == TokenConstant.native_token]
+        token_keys = [key for key in balance_keys if key[1] != TokenConstant.native_token]
+        native_balances = self.ethService.get_balances([(address, block_number) for address, _ in native_keys])
+        token_balances = self.ethTokenService.get_balances(
+            [(unit_token, address, block_number) for address, unit_token in token_keys])
+        balances = {key: native_balances.get((key[0], block_number)) for key in native_keys}
+        balances.update({key: token_balances.get((key[1], key[0], block_number)) for key in token_keys})
+
+        # the unit token of a vToken is the vToken itself, the one of a lending pool is the asset of the reserve
+        lookups = {key: (key[2], key[0], block_number,
+                         LendingTypeConstant.VTOKEN if key[1] == key[2] else LendingTypeConstant.LENDING_POOL, key[1])
+                   for key in lending_keys}
+        lending_infos = self.ethLendingService.get_lending_infos(list(lookups.values()))
+        lendings = {}
+        for key, lookup in lookups.items():
+            _, _, supply, borrow, _ = lending_infos.get(lookup) or (None,) * 5
+            lendings[key] = (supply, borrow) if supply is not None and borrow is not None else None
+        return balances, lendings
+
     def close(self):
         self.item_exporter.close()
 
@@ -114,3 +164,29 @@ def clean_user_provided_content(content):
         return content.translate({ASCII_0: None})
     else:
         return content
+
+
+def load_wallet_filter(filter_for_lending):
+    """The wallet filter, its snapshot is built from the holders of the filter file and, with the lending filter,
+    the wallets of the database on the first start.
+
+    The wallets found later by the lending events are added to it. Processes sharing the snapshot build it once,
+    the backfill builds it before starting its processes.
+    """
+    wallet_filter = WalletFilterMemoryStorage.getInstance()
+    if wallet_filter.build_if_missing(lambda: get_wallet_filter_addresses(filter_for_lending)):
+        logger.info(f"Built the wallet filter of {len(wallet_filter)} addresses")
+    return wallet_filter
+
+
+def get_wallet_filter_addresses(filter_for_lending):
+    addresses = get_wallet_filter_from_file()
+    if filter_for_lending:
+        addresses.extend(Database().get_all_wallet_addresses())
+    return addresses
+
+
+def get_wallet_filter_from_file():
+    with open(get_root_path("artifacts/wallet_filter/Orai-holder-bsc.csv"), 'r') as read_obj:
+        # the first column is the holder address, the header row isn't an address and is skipped
+        return [str(row[0]).lower() for row in reader(read_obj) if row and str(row[0]).startswith('0x')]
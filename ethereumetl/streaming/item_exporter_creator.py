@@ -30,6 +30,10 @@ def create_item_exporter(output):
         item_exporter = ConsoleItemExporter()
     elif item_exporter_type == ItemExporterType.KNOWLEDGE_GRAPH:
         item_exporter = KnowledgeGraphExporter()
+    elif item_exporter_type == ItemExporterType.PARQUET:
+        # imported here so pyarrow, from requirements-parquet.txt, is only needed when exporting to parquet
+        from blockchainetl.jobs.exporters.parquet_item_exporter import ParquetItemExporter
+        item_exporter = ParquetItemExporter(output[len('parquet://'):])
     else:
         raise ValueError('Unable to determine item exporter type for output ' + output)
 
@@ -39,6 +43,8 @@ def create_item_exporter(output):
 def determine_item_exporter_type(output):
     if output is not None and output.startswith('knowledge_graph'):
         return ItemExporterType.KNOWLEDGE_GRAPH
+    elif output is not None and output.startswith('parquet://'):
+        return ItemExporterType.PARQUET
     elif output is None or output == 'console':
         return ItemExporterType.CONSOLE
     else:
@@ -50,4 +56,5 @@ class ItemExporterType:
     POSTGRES = 'postgres'
     CONSOLE = 'console'
     KNOWLEDGE_GRAPH = 'knowledge_graph'
+    PARQUET = 'parquet'
     UNKNOWN = 'unknown'
@@ -0,0 +1,39 @@
+import logging
+
+from ethereumetl.providers.auto import get_provider_from_uri
+from ethereumetl.streaming.eth_knowledge_graph_streamer_adapter import EthKnowledgeGraphStreamerAdapter
+from ethereumetl.streaming.item_exporter_creator import create_item_exporter
+from ethereumetl.thread_local_proxy import ThreadLocalProxy
+from config.config import MetricsConfig
+from services.log_services import config_log
+from services.metrics_service import start_metrics_server
+
+# the adapter of the backfill process, created once by init_backfill_process
+_adapter = None
+
+
+def init_backfill_process(provider_uri, output, batch_size, max_workers, tokens_filter_file, event_abi_dir,
+                          processes=1):
+    global _adapter
+    config_log(level=logging.INFO)
+    if MetricsConfig.PORT:
+        # every process serves its metrics on one of the processes ports from METRICS_PORT
+        start_metrics_server(MetricsConfig.PORT, tries=processes)
+    _adapter = EthKnowledgeGraphStreamerAdapter(
+        provider_uri=provider_uri,
+        tokens_filter_file=tokens_filter_file,
+        tokens=None,
+        event_abi_dir=event_abi_dir,
+        batch_web3_provider=ThreadLocalProxy(lambda: get_provider_from_uri(provider_uri, batch=False)),
+        item_exporter=create_item_exporter(output),
+        batch_size=batch_size,
+        max_workers=max_workers,
+        # the stream keeps the tokens, the processes would all refresh them and write the same metadata file
+        export_tokens=False
+    )
+    _adapter.open()
+
+
+def export_backfill_partition(partition):
+    # the jobs close the item exporter when they end, the items of the partition are written on return
+    _adapter.export_partitions([partition])
@@ -0,0 +1,94 @@
+import json
+import logging
+import socket
+import threading
+import time
+from urllib.parse import urlparse
+
+from blockchainetl.streaming.tip_waiter import PollingTipWaiter
+from utils.json_utils import json_loads
+
+logger = logging.getLogger('NewHeadsTipWaiter')
+
+
+class NewHeadsTipWaiter:
+    """Waits for the newHeads notifications of an eth_subscribe subscription over an IPC socket.
+
+    A daemon thread keeps the subscription and reconnects when it breaks, the fallback polling waiter is used
+    while it's down. max_seconds bounds a wait, in case a notification is missed.
+    """
+
+    def __init__(self, ipc_path, fallback, max_seconds=60, reconnect_seconds=5):
+        self.ipc_path = ipc_path
+        self.fallback = fallback
+        self.max_seconds = float(max_seconds)
+        self.reconnect_seconds = float(reconnect_seconds)
+
+        self._condition = threading.Condition()
+        self._head = None
+        self._subscribed = False
+        self._thread = threading.Thread(target=self._run, name='NewHeadsSubscription', daemon=True)
+        self._thread.start()
+
+    def wait_for_block(self, block_number):
+        with self._condition:
+            # a head already announced but not synced means the node queried lags, polling then
+            if self._subscribed and (self._head is None or self._head < block_number):
+                logging.info(f'Nothing to sync. Waiting for block {block_number}...')
+                self._condition.wait_for(lambda: not self._subscribed or
+                                         (self._head is not None and self._head >= block_number),
+                                         timeout=self.max_seconds)
+                if self._subscribed:
+                    return
+        self.fallback.wait_for_block(block_number)
+
+    def reset(self):
+        self.fallback.reset()
+
+    def _run(self):
+        while True:
+            try:
+                self._subscribe()
+            except Exception as e:
+                logger.warning(f"newHeads subscription on {self.ipc_path} failed, polling instead: {e!r}")
+            with self._condition:
+                self._subscribed = False
+                self._condition.notify_all()
+            time.sleep(self.reconnect_seconds)
+
+    def _subscribe(self):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(self.ipc_path)
+            request = {'jsonrpc': '2.0', 'id': 1, 'method': 'eth_subscribe', 'params': ['newHeads']}
+            sock.sendall(json.dumps(request).encode('utf-8'))
+            # the node writes one JSON message per line
+            with sock.makefile('rb') as messages:
+                for line in messages:
+                    if line.strip():
+                        self._handle(json_loads(line))
+        raise ConnectionError('the node closed the socket')
+
+    def _handle(self, message):
+        if message.get('id') == 1:
+            if message.get('error'):
+                raise ValueError(message['error'])
+            logger.info(f"Subscribed to newHeads on {self.ipc_path}")
+            with self._condition:
+                self._subscribed = True
+            return
+        head = message.get('params', {}).get('result', {}).get('number')
+        if message.get('method') != 'eth_subscription' or head is None:
+            return
+        with self._condition:
+            self._head = int(head, 16)
+            self._condition.notify_all()
+
+
+def create_tip_waiter(provider_uri, min_seconds, max_seconds):
+    """Subscribes to newHeads when one of the provider uris is an IPC socket, polls with backoff otherwise"""
+    fallback = PollingTipWaiter(min_seconds, max_seconds)
+    for uri in provider_uri.split(','):
+        uri = urlparse(uri.strip())
+        if uri.scheme == 'file':
+            return NewHeadsTipWaiter(uri.path, fallback, max_seconds=max(float(max_seconds), 60))
+    return fallback
@@ -57,7 +57,7 @@ if __name__ == '__main__':
     from ethereumetl.streaming.item_exporter_creator import create_item_exporter
     from blockchainetl.streaming.streamer import Streamer
 
-    # TODO: Implement fallback mechanism for provider uris instead of picking randomly
+    # a comma separated provider uri is load balanced by the provider pool of get_provider_from_uri
     provider_uris = [uri.strip() for uri in provider_uri.split(',')]
     config_log()
     logging.info('Using ' + provider_uri)
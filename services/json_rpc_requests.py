@@ -58,6 +58,38 @@ def generate_get_code_json_rpc(contract_addresses, block='latest'):
         )
 
 
+def generate_eth_call_json_rpc(calls):
+    for idx, (contract_address, data, block) in enumerate(calls):
+        yield generate_json_rpc(
+            method='eth_call',
+            params=[{'to': contract_address, 'data': data}, hex(block) if isinstance(block, int) else block],
+            request_id=idx
+        )
+
+
+def generate_get_balance_json_rpc(lookups):
+    for idx, (address, block) in enumerate(lookups):
+        yield generate_json_rpc(
+            method='eth_getBalance',
+            params=[address, hex(block) if isinstance(block, int) else block],
+            request_id=idx
+        )
+
+
+def generate_get_logs_json_rpc(block_ranges, topics=None, addresses=None):
+    for idx, (from_block, to_block) in enumerate(block_ranges):
+        filter_params = {'fromBlock': hex(from_block), 'toBlock': hex(to_block)}
+        if topics:
+            filter_params['topics'] = topics
+        if addresses:
+            filter_params['address'] = addresses
+        yield generate_json_rpc(
+            method='eth_getLogs',
+            params=[filter_params],
+            request_id=idx
+        )
+
+
 def generate_json_rpc(method, params, request_id=1):
     return {
         'jsonrpc': '2.0',
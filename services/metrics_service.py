@@ -0,0 +1,112 @@
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from data_storage.metrics_registry import MetricsRegistry, get_quantile
+
+logger = logging.getLogger('MetricsService')
+
+registry = MetricsRegistry.getInstance()
+
+STAGE_SECONDS = registry.histogram(
+    'ethereum_etl_stage_seconds', 'Time spent in a stage of the export jobs', ['stage'])
+JOB_SECONDS = registry.histogram(
+    'ethereum_etl_job_seconds', 'Run time of the export jobs', ['job'])
+RPC_SECONDS = registry.histogram(
+    'ethereum_etl_rpc_seconds', 'Round trip of a JSON-RPC request or batch, by method of its first request', ['method'])
+RPC_REQUESTS = registry.counter(
+    'ethereum_etl_rpc_requests_total', 'JSON-RPC requests sent, batched ones included', ['method'])
+MONGO_SECONDS = registry.histogram(
+    'ethereum_etl_mongo_seconds', 'Time of the mongo operations', ['operation', 'collection'])
+MONGO_OPERATIONS = registry.counter(
+    'ethereum_etl_mongo_operations_total', 'Documents written to mongo', ['collection'])
+TRANSACTIONS = registry.counter(
+    'ethereum_etl_transactions_total', 'Transactions and receipt logs handled')
+EXPORTED_BLOCK = registry.gauge(
+    'ethereum_etl_exported_block', 'Last block of the last exported block range')
+
+
+def get_stage_seconds(stage):
+    return STAGE_SECONDS.labels(stage)
+
+
+def start_metrics_server(port, tries=1):
+    """Serves the metrics in the Prometheus text format on /metrics from a daemon thread.
+
+    The next ports are tried when the port is taken, up to tries ports, so every process of a backfill gets one.
+    :return: the port served, None when none could be bound
+    """
+    for candidate in range(int(port), int(port) + tries):
+        try:
+            server = ThreadingHTTPServer(('', candidate), _MetricsHandler)
+        except OSError:
+            continue
+        thread = threading.Thread(target=server.serve_forever, name='MetricsServer', daemon=True)
+        thread.start()
+        logger.info(f"Serving metrics on port {candidate}")
+        return candidate
+    logger.warning(f"No port free to serve metrics in {port}-{int(port) + tries - 1}")
+    return None
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split('?')[0] not in ('/', '/metrics'):
+            self.send_error(404)
+            return
+        body = registry.to_prometheus_text().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MetricsLogger:
+    """Logs what the histograms and counters recorded since the previous call, with quantiles"""
+
+    def __init__(self, metrics=None):
+        self.metrics = metrics
+        self._previous = {}
+
+    def log(self, prefix):
+        if not registry.enabled:
+            return
+        current = {}
+        for metric in self.metrics or registry.get_metrics():
+            for label_values, child in metric.get_children():
+                key = (metric.name, label_values)
+                if metric.type == 'histogram':
+                    current[key] = child.get()
+                    self._log_histogram(prefix, metric, label_values, current[key], self._previous.get(key))
+                elif metric.type == 'counter':
+                    current[key] = child.get()
+                    count = current[key] - (self._previous.get(key) or 0)
+                    if count:
+                        logger.info(f"{prefix} {_get_label(metric, label_values)} {count}")
+        self._previous = current
+
+    @staticmethod
+    def _log_histogram(prefix, metric, label_values, values, previous):
+        bucket_counts, total, count = values
+        if previous is not None:
+            bucket_counts = [bucket_count - previous_count
+                             for bucket_count, previous_count in zip(bucket_counts, previous[0])]
+            total -= previous[1]
+            count -= previous[2]
+        if not count:
+            return
+        quantiles = ', '.join(f"p{int(quantile * 100)} {round(get_quantile(metric.buckets, bucket_counts, quantile), 4)}s"
+                              for quantile in (0.5, 0.95, 0.99))
+        logger.info(f"{prefix} {_get_label(metric, label_values)} took {round(total, 3)}s in {count} calls, "
+                    f"{quantiles}")
+
+
+def _get_label(metric, label_values):
+    name = metric.name[len('ethereum_etl_'):] if metric.name.startswith('ethereum_etl_') else metric.name
+    if not label_values:
+        return name
+    return f"{name}{{{','.join(label_values)}}}"
@@ -0,0 +1,102 @@
+"""
+Maps a block with full transactions to the export dicts through EthBlock and EthTransaction, as ExportBlocksJob
+did, and with EthBlockMapper.json_dict_to_export_dicts, and prints the CPU time and the memory allocated
+per transaction of both.
+
+    python test_code/benchmark_block_mapper.py [block.json]
+
+block.json is the result, or the whole response, of eth_getBlockByNumber with full transactions, recorded with
+    curl -s -X POST -H 'Content-Type: application/json' <provider uri> \\
+        -d '{"jsonrpc":"2.0","id":1,"method":"eth_getBlockByNumber","params":["0xc5043f",true]}' > block.json
+A synthetic block shaped like a mainnet one is used without it.
+"""
+
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+TOP_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, os.path.join(TOP_DIR, './'))
+
+from ethereumetl.mappers.block_mapper import EthBlockMapper
+
+transactions_per_block = 200
+number_of_runs = 200
+
+
+def generate_block():
+    transactions = [{
+        "blockHash": "0x" + os.urandom(32).hex(),
+        "blockNumber": "0xc5043f",
+        "from": "0x" + os.urandom(20).hex().upper(),
+        "gas": "0x5208",
+        "gasPrice": "0x12a05f200",
+        "hash": "0x" + os.urandom(32).hex(),
+        "input": "0x" if index % 3 else "0x" + os.urandom(68).hex(),
+        "nonce": hex(index),
+        "to": "0x" + os.urandom(20).hex(),
+        "transactionIndex": hex(index),
+        "value": hex(index * 10 ** 15),
+        "type": "0x0",
+        "v": "0x26",
+        "r": "0x" + os.urandom(32).hex(),
+        "s": "0x" + os.urandom(32).hex(),
+    } for index in range(transactions_per_block)]
+    return {
+        "number": "0xc5043f", "hash": "0x" + os.urandom(32).hex(), "parentHash": "0x" + os.urandom(32).hex(),
+        "nonce": "0x" + os.urandom(8).hex(), "sha3Uncles": "0x" + os.urandom(32).hex(),
+        "logsBloom": "0x" + os.urandom(256).hex(), "transactionsRoot": "0x" + os.urandom(32).hex(),
+        "stateRoot": "0x" + os.urandom(32).hex(), "receiptsRoot": "0x" + os.urandom(32).hex(),
+        "miner": "0x" + os.urandom(20).hex(), "difficulty": "0x1bc16d674ec80000",
+        "totalDifficulty": "0x5fe8c3dba9d9ba1b3f8", "size": "0x1a2b3", "extraData": "0x" + os.urandom(32).hex(),
+        "gasLimit": "0x1c9c380", "gasUsed": "0x1c9a2b1", "timestamp": "0x60d3f0a1",
+        "transactions": transactions, "uncles": [],
+    }
+
+
+def load_block(path):
+    with open(path) as block_file:
+        block = json.load(block_file)
+    return block.get('result', block) if 'jsonrpc' in block else block
+
+
+def map_with_domain_objects(block_mapper, json_dict):
+    block = block_mapper.json_dict_to_block(json_dict)
+    transaction_mapper = block_mapper.transaction_mapper
+    return block_mapper.block_to_dict(block), [transaction_mapper.transaction_to_dict(transaction)
+                                               for transaction in block.transactions]
+
+
+def map_to_export_dicts(block_mapper, json_dict):
+    return block_mapper.json_dict_to_export_dicts(json_dict)
+
+
+def measure(name, map_block, block_mapper, json_dict):
+    number_of_transactions = len(json_dict['transactions'])
+    start = time.process_time()
+    for _ in range(number_of_runs):
+        map_block(block_mapper, json_dict)
+    cpu_time = time.process_time() - start
+
+    # the peak counts the intermediate objects, freed once the dicts are built
+    tracemalloc.start()
+    result = map_block(block_mapper, json_dict)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    print(f"{name}: {round(cpu_time / number_of_runs / number_of_transactions * 1e6, 2)}us CPU, "
+          f"{round(peak / number_of_transactions)} bytes allocated at the peak and "
+          f"{round(retained / number_of_transactions)} retained per transaction")
+
+
+if __name__ == '__main__':
+    json_dict = load_block(sys.argv[1]) if len(sys.argv) > 1 else generate_block()
+    block_mapper = EthBlockMapper()
+    assert map_with_domain_objects(block_mapper, json_dict) == map_to_export_dicts(block_mapper, json_dict)
+
+    print(f"block of {len(json_dict['transactions'])} transactions, {number_of_runs} runs")
+    measure('EthBlock/EthTransaction then dicts', map_with_domain_objects, block_mapper, json_dict)
+    measure('json_dict_to_export_dicts', map_to_export_dicts, block_mapper, json_dict)
@@ -0,0 +1,143 @@
+"""
+Calls balanceOf, totalSupply, exchangeRateCurrent, balanceOfUnderlying, borrowBalanceCurrent and getReserveData
+through web3 contract objects, as EthTokenService and EthLendingService did, and as raw eth_calls with
+precomputed selectors, against a provider answering canned return data, and prints the CPU time per call of both.
+"""
+
+import os
+import sys
+import time
+
+from web3 import Web3
+from web3.providers.base import BaseProvider
+
+TOP_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, os.path.join(TOP_DIR, './'))
+
+from artifacts.abi_pi.erc20_abi import get_erc20_abi
+from artifacts.abi_pi.lending_pool_abi import get_lending_pool_abi
+from artifacts.abi_pi.vToken_abi import get_vtoken_abi
+from ethereumetl.service.eth_lending_service import BALANCE_OF_UNDERLYING_SELECTOR, BORROW_BALANCE_CURRENT_SELECTOR, \
+    EXCHANGE_RATE_CURRENT_SELECTOR, GET_RESERVE_DATA_SELECTOR, RESERVE_DATA_T_TOKEN_WORD
+from ethereumetl.service.eth_multicall_service import EthMulticallService, decode_address, decode_uint, encode_call
+from ethereumetl.service.eth_token_service import BALANCE_OF_SELECTOR, TOTAL_SUPPLY_SELECTOR
+
+number_of_calls = 2000
+block_number = 15000000
+
+
+def word(value):
+    return value.to_bytes(32, 'big')
+
+
+def address_word(address):
+    return bytes(12) + bytes.fromhex(address[2:])
+
+
+RETURN_DATA = {
+    BALANCE_OF_SELECTOR: word(123 * 10 ** 18),
+    TOTAL_SUPPLY_SELECTOR: word(10 ** 27),
+    EXCHANGE_RATE_CURRENT_SELECTOR: word(2 * 10 ** 26),
+    BALANCE_OF_UNDERLYING_SELECTOR: word(45 * 10 ** 18),
+    BORROW_BALANCE_CURRENT_SELECTOR: word(6 * 10 ** 18),
+    # configuration, 4 indexes and rates, lastUpdateTimestamp, 3 addresses, id
+    GET_RESERVE_DATA_SELECTOR: b''.join([word(1), word(10 ** 27), word(10 ** 27), word(10 ** 25), word(10 ** 25),
+                                         word(1650000000)] +
+                                        [address_word('0x' + os.urandom(20).hex()) for _ in range(3)] + [word(1)]),
+}
+
+
+class CannedProvider(BaseProvider):
+    """Answers eth_call with the return data of the called function, without any I/O"""
+
+    def make_request(self, method, params):
+        if method == 'eth_call':
+            return_data = RETURN_DATA[bytes.fromhex(params[0]['data'][2:10])]
+            return {'jsonrpc': '2.0', 'id': 1, 'result': '0x' + return_data.hex()}
+        if method == 'eth_chainId':
+            return {'jsonrpc': '2.0', 'id': 1, 'result': '0x38'}
+        raise ValueError(f"Unexpected {method}")
+
+    def isConnected(self):
+        return True
+
+
+def get_web3_calls(w3, token_address, address):
+    """Calls built like the services did before: checksummed addresses and a contract object per address"""
+    contracts = {}
+
+    def contract(contract_address, abi):
+        checksum_contract_address = w3.toChecksumAddress(contract_address)
+        # a contract object per service, each with the ABI of its service
+        key = (str(checksum_contract_address).lower(), id(abi))
+        if key not in contracts:
+            contracts[key] = w3.eth.contract(address=checksum_contract_address, abi=abi)
+        return contracts[key]
+
+    def call_with_address(abi, function_name):
+        def call():
+            checksum_address = w3.toChecksumAddress(address)
+            function = getattr(contract(token_address, abi).functions, function_name)
+            return function(checksum_address).call(block_identifier=block_number)
+
+        return call
+
+    def call_without_arguments(abi, function_name):
+        return lambda: getattr(contract(token_address, abi).functions, function_name)().call(
+            block_identifier=block_number)
+
+    def get_reserve_data():
+        reserve_data = contract(token_address, get_lending_pool_abi()).functions.getReserveData(
+            w3.toChecksumAddress(address)).call(block_identifier=block_number)
+        return str(reserve_data[RESERVE_DATA_T_TOKEN_WORD]).lower()
+
+    return {
+        'balanceOf': call_with_address(get_erc20_abi(), 'balanceOf'),
+        'totalSupply': call_without_arguments(get_erc20_abi(), 'totalSupply'),
+        'exchangeRateCurrent': call_without_arguments(get_vtoken_abi(), 'exchangeRateCurrent'),
+        'balanceOfUnderlying': call_with_address(get_vtoken_abi(), 'balanceOfUnderlying'),
+        'borrowBalanceCurrent': call_with_address(get_vtoken_abi(), 'borrowBalanceCurrent'),
+        'getReserveData': get_reserve_data,
+    }
+
+
+def get_raw_calls(multicall_service, token_address, address):
+    """Calls as the services make them now"""
+
+    def call_uint(selector, *addresses):
+        return lambda: decode_uint(multicall_service.call_one(token_address, encode_call(selector, *addresses),
+                                                              block_number))
+
+    return {
+        'balanceOf': call_uint(BALANCE_OF_SELECTOR, address),
+        'totalSupply': call_uint(TOTAL_SUPPLY_SELECTOR),
+        'exchangeRateCurrent': call_uint(EXCHANGE_RATE_CURRENT_SELECTOR),
+        'balanceOfUnderlying': call_uint(BALANCE_OF_UNDERLYING_SELECTOR, address),
+        'borrowBalanceCurrent': call_uint(BORROW_BALANCE_CURRENT_SELECTOR, address),
+        'getReserveData': lambda: decode_address(multicall_service.call_one(
+            token_address, encode_call(GET_RESERVE_DATA_SELECTOR, address), block_number), RESERVE_DATA_T_TOKEN_WORD),
+    }
+
+
+def measure(call):
+    start = time.process_time()
+    for _ in range(number_of_calls):
+        call()
+    return (time.process_time() - start) / number_of_calls * 1e6
+
+
+if __name__ == '__main__':
+    w3 = Web3(CannedProvider())
+    token_address = '0x' + os.urandom(20).hex()
+    address = '0x' + os.urandom(20).hex()
+    web3_calls = get_web3_calls(w3, token_address, address)
+    raw_calls = get_raw_calls(EthMulticallService(w3, multicall_address=None), token_address, address)
+
+    print(f"{number_of_calls} calls each, CPU per call")
+    for function_name, web3_call in web3_calls.items():
+        raw_call = raw_calls[function_name]
+        assert web3_call() == raw_call(), function_name
+        web3_microseconds = measure(web3_call)
+        raw_microseconds = measure(raw_call)
+        print(f"  {function_name:<22} web3 contract {round(web3_microseconds, 1):>7}us  "
+              f"raw eth_call {round(raw_microseconds, 1):>6}us  {round(web3_microseconds / raw_microseconds, 1)}x")
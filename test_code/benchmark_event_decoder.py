@@ -0,0 +1,98 @@
+"""
+Extracts the events of synthetic logs of the event ABIs of artifacts/event-abi with the previous extractor
+(topics and data split into words, every word decoded by the type name of its parameter) and with the
+EventDecoder compiled by EventSubscriber, and prints logs/s for each, best of number_of_runs.
+"""
+
+import gc
+import json
+import os
+import sys
+import time
+
+TOP_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, os.path.join(TOP_DIR, './'))
+
+from ethereumetl.domain.receipt_log import EthReceiptLog
+from ethereumetl.service.eth_event_service import EthEvent, EventSubscriber, get_list_params_in_order, get_topic_filter
+from ethereumetl.service.event_extractor import EthEventExtractor
+from ethereumetl.service.token_transfer_extractor import split_to_words, word_to_address
+from utils.utils import hex_to_dec, to_normalized_address
+
+number_of_logs = 20000
+number_of_runs = 3
+event_abi_dir = os.path.join(TOP_DIR, 'artifacts/event-abi')
+
+
+def generate_logs(event_abi, topic_hash):
+    logs = []
+    for index in range(number_of_logs):
+        log = EthReceiptLog()
+        log.log_index = index
+        log.transaction_hash = '0x' + os.urandom(32).hex()
+        log.block_number = 15000000
+        log.address = '0x' + os.urandom(20).hex()
+        log.topics = [topic_hash]
+        data = ''
+        for param in event_abi['inputs']:
+            word = '0' * 24 + os.urandom(20).hex() if param['type'] == 'address' else format(index * 10 ** 18, '064x')
+            if param.get('indexed'):
+                log.topics.append('0x' + word)
+            else:
+                data += word
+        log.data = '0x' + data
+        logs.append(log)
+    return logs
+
+
+def extract_with_previous_loop(receipt_log, event_subscriber):
+    topics = receipt_log.topics
+    if event_subscriber.topic_hash != topics[0]:
+        return None
+    topics_with_data = (topics + split_to_words(receipt_log.data))[1:]
+    list_params_in_order = event_subscriber.list_params_in_order
+    if len(topics_with_data) != len(list_params_in_order):
+        return None
+    event = EthEvent()
+    event.contract_address = to_normalized_address(receipt_log.address)
+    event.transaction_hash = receipt_log.transaction_hash
+    event.log_index = receipt_log.log_index
+    event.block_number = receipt_log.block_number
+    event.event_type = event_subscriber.name
+    for param, data in zip(list_params_in_order, topics_with_data):
+        param_type = param.get('type')
+        if param_type in ('uint256', 'int256'):
+            value = hex_to_dec(data)
+        elif param_type == 'address':
+            value = word_to_address(data)
+        else:
+            value = data
+        event.params[param.get('name')] = str(value)
+    return event
+
+
+def measure(name, extract, logs, event_subscriber):
+    run_times = []
+    for _ in range(number_of_runs):
+        gc.collect()
+        start = time.time()
+        for log in logs:
+            extract(log, event_subscriber)
+        run_times.append(time.time() - start)
+    run_time = min(run_times)
+    print(f"  {name}: {round(len(logs) / run_time)} logs/s")
+
+
+if __name__ == '__main__':
+    extractor = EthEventExtractor()
+    for file_name in sorted(os.listdir(event_abi_dir)):
+        with open(os.path.join(event_abi_dir, file_name)) as event_abi_file:
+            event_abi = json.load(event_abi_file)
+        topic_hash = get_topic_filter(event_abi)
+        event_subscriber = EventSubscriber(topic_hash, event_abi['name'], get_list_params_in_order(event_abi))
+        logs = generate_logs(event_abi, topic_hash)
+
+        print(f"{event_abi['name']}({', '.join(param['type'] for param in event_abi['inputs'])}), "
+              f"{number_of_logs} logs")
+        measure('previous extractor', extract_with_previous_loop, logs, event_subscriber)
+        measure('EthEventExtractor with EventDecoder', extractor.extract_event_from_log, logs, event_subscriber)
@@ -0,0 +1,133 @@
+"""
+Writes the same synthetic events to both layouts of the events, one collection per contract with the hashed
+indexes of insert_to_token_collection, and the single events collection with its ranged indexes, then scans
+block ranges of single contracts and block ranges of all of them as a rollback does, and prints the time of each.
+Needs the mongo configured in .env, the benchmark writes into a database of its own and drops it.
+
+    python test_code/benchmark_event_layout.py [number of contracts]
+"""
+
+import os
+import random
+import sys
+import time
+
+TOP_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, os.path.join(TOP_DIR, './'))
+
+from blockchainetl.jobs.exporters.databasse.mongo_db import Database, create_events_indexes, \
+    create_token_collection_indexes
+from config.config import MongoDBConfig
+
+number_of_contracts = 1000
+number_of_blocks = 2000
+events_per_block = 100
+batch_size = 1000
+number_of_scans = 200
+scan_blocks = 100
+
+
+def generate_events(contracts):
+    for block_number in range(number_of_blocks):
+        for log_index in range(events_per_block):
+            yield {
+                "type": "Transfer", "contract_address": random.choice(contracts),
+                "transaction_hash": "0x" + os.urandom(32).hex(), "log_index": log_index,
+                "block_number": block_number, "from_address": "0x" + os.urandom(20).hex(),
+                "to_address": "0x" + os.urandom(20).hex(), "value": str(random.randrange(10 ** 20)),
+            }
+
+
+def write_per_contract(benchmark_db, events):
+    collections = {}
+    batch = {}
+    for index, event in enumerate(events):
+        contract_address = event["contract_address"]
+        if contract_address not in collections:
+            collections[contract_address] = benchmark_db[contract_address]
+            create_token_collection_indexes(collections[contract_address])
+        batch.setdefault(contract_address, []).append(event)
+        # flushed per collection like MongoBulkWriter
+        if (index + 1) % batch_size == 0:
+            for batch_contract_address, documents in batch.items():
+                collections[batch_contract_address].insert_many(documents, ordered=False)
+            batch = {}
+    for batch_contract_address, documents in batch.items():
+        collections[batch_contract_address].insert_many(documents, ordered=False)
+
+
+def write_single(benchmark_db, events):
+    collection = benchmark_db[MongoDBConfig.EVENTS]
+    create_events_indexes(collection)
+    batch = []
+    for event in events:
+        batch.append(event)
+        if len(batch) >= batch_size:
+            collection.insert_many(batch, ordered=False)
+            batch = []
+    if batch:
+        collection.insert_many(batch, ordered=False)
+
+
+def scan_contracts_per_contract(benchmark_db, scans):
+    return sum(len(list(benchmark_db[contract_address].find(
+        {"block_number": {"$gte": start_block, "$lte": start_block + scan_blocks}})))
+        for contract_address, start_block in scans)
+
+
+def scan_contracts_single(benchmark_db, scans):
+    collection = benchmark_db[MongoDBConfig.EVENTS]
+    return sum(len(list(collection.find(
+        {"contract_address": contract_address,
+         "block_number": {"$gte": start_block, "$lte": start_block + scan_blocks}})))
+        for contract_address, start_block in scans)
+
+
+def scan_blocks_per_contract(benchmark_db, start_block):
+    block_range = {"block_number": {"$gte": start_block, "$lte": start_block + scan_blocks}}
+    return sum(len(list(benchmark_db[name].find(block_range)))
+               for name in benchmark_db.list_collection_names(filter={'name': {'$regex': '^0x'}}))
+
+
+def scan_blocks_single(benchmark_db, start_block):
+    block_range = {"block_number": {"$gte": start_block, "$lte": start_block + scan_blocks}}
+    return len(list(benchmark_db[MongoDBConfig.EVENTS].find(block_range)))
+
+
+def measure(name, function, *args):
+    start = time.time()
+    result = function(*args)
+    print(f"  {name}: {round(time.time() - start, 3)}s")
+    return result
+
+
+if __name__ == '__main__':
+    contracts_count = int(sys.argv[1]) if len(sys.argv) > 1 else number_of_contracts
+    contracts = ["0x" + os.urandom(20).hex() for _ in range(contracts_count)]
+    events = list(generate_events(contracts))
+    scans = [(random.choice(contracts), random.randrange(number_of_blocks - scan_blocks))
+             for _ in range(number_of_scans)]
+    rollback_start_block = number_of_blocks - scan_blocks
+
+    database_name = f"{MongoDBConfig.DATABASE}_benchmark"
+    mongo = Database(bulk_write=False).mongo
+    mongo.drop_database(database_name)
+    benchmark_db = mongo[database_name]
+    try:
+        print(f"{len(events)} events of {contracts_count} contracts over {number_of_blocks} blocks")
+        print("collection per contract")
+        # insert_many sets the _id of the documents, each layout gets copies
+        measure("bulk insert", write_per_contract, benchmark_db, [dict(event) for event in events])
+        per_contract_found = measure(f"{number_of_scans} scans of {scan_blocks} blocks of a contract",
+                                     scan_contracts_per_contract, benchmark_db, scans)
+        per_contract_rollback = measure(f"scan of {scan_blocks} blocks of all contracts",
+                                        scan_blocks_per_contract, benchmark_db, rollback_start_block)
+        print("single events collection")
+        measure("bulk insert", write_single, benchmark_db, [dict(event) for event in events])
+        single_found = measure(f"{number_of_scans} scans of {scan_blocks} blocks of a contract",
+                               scan_contracts_single, benchmark_db, scans)
+        single_rollback = measure(f"scan of {scan_blocks} blocks of all contracts",
+                                  scan_blocks_single, benchmark_db, rollback_start_block)
+        assert per_contract_found == single_found and per_contract_rollback == single_rollback
+    finally:
+        mongo.drop_database(database_name)
@@ -0,0 +1,64 @@
+"""
+Imports the modules imported by an entry point, docker_run/build_knowledge_graph.py by default, in fresh
+interpreters with python -X importtime, and prints the median startup time and the slowest modules.
+
+    python test_code/benchmark_import_time.py [entry point] [number of runs]
+"""
+
+import ast
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+TOP_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+default_entry_point = os.path.join(TOP_DIR, 'docker_run/build_knowledge_graph.py')
+number_of_runs = 5
+number_of_slowest = 15
+
+
+def get_imports(entry_point):
+    """The top level import statements of the entry point, those under if __name__ == '__main__' excluded"""
+    with open(entry_point) as entry_point_file:
+        source = entry_point_file.read()
+    return '\n'.join(ast.get_source_segment(source, node) for node in ast.parse(source).body
+                     if isinstance(node, (ast.Import, ast.ImportFrom)))
+
+
+def run(imports):
+    start = time.time()
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', imports], cwd=TOP_DIR,
+                             env=dict(os.environ, PYTHONPATH=TOP_DIR), capture_output=True, text=True)
+    seconds = time.time() - start
+    if process.returncode:
+        raise RuntimeError(process.stderr.splitlines()[-1])
+    return seconds, parse_import_times(process.stderr)
+
+
+def parse_import_times(output):
+    """module -> cumulative microseconds, from lines like 'import time:  self [us] | cumulative | imported package'"""
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        _, cumulative, module = line[len('import time:'):].split('|')
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+if __name__ == '__main__':
+    entry_point = sys.argv[1] if len(sys.argv) > 1 else default_entry_point
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else number_of_runs
+    imports = get_imports(entry_point)
+
+    results = [run(imports) for _ in range(runs)]
+    seconds = statistics.median(result[0] for result in results)
+    modules = results[0][1].keys()
+    medians = {module: statistics.median(result[1].get(module, 0) for result in results) for module in modules}
+
+    print(f"{os.path.relpath(entry_point, TOP_DIR)}: interpreter start and imports {round(seconds * 1000)}ms, "
+          f"median of {runs} runs")
+    for module, microseconds in sorted(medians.items(), key=lambda item: -item[1])[:number_of_slowest]:
+        print(f"  {round(microseconds / 1000, 1):>8}ms  {module}")
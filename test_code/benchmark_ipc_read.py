@@ -0,0 +1,92 @@
+"""
+Serves a synthetic JSON-RPC batch response of blocks with full transactions over a unix socket pair and reads it
+with the previous IPC read loop (recv(4096) appended to bytes, json.loads tried on every chunk ending in }\\n)
+and with JsonRpcSocketReader, and prints MB/s for each.
+"""
+
+import json
+import os
+import socket
+import sys
+import threading
+import time
+
+TOP_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, os.path.join(TOP_DIR, './'))
+
+from ethereumetl.providers.ipc import JsonRpcSocketReader, has_valid_json_rpc_ending
+from utils.json_utils import JSON_BACKEND
+
+number_of_blocks = 32
+transactions_per_block = 300
+number_of_runs = 5
+
+
+def generate_response():
+    response = []
+    for block_number in range(number_of_blocks):
+        transactions = [{
+            "blockNumber": hex(block_number),
+            "from": "0x" + os.urandom(20).hex(),
+            "to": "0x" + os.urandom(20).hex(),
+            "gas": "0x5208",
+            "gasPrice": "0x12a05f200",
+            "hash": "0x" + os.urandom(32).hex(),
+            "input": "0x" + os.urandom(68).hex(),
+            "nonce": hex(index),
+            "transactionIndex": hex(index),
+            "value": "0x0",
+            "v": "0x94",
+            "r": "0x" + os.urandom(32).hex(),
+            "s": "0x" + os.urandom(32).hex(),
+        } for index in range(transactions_per_block)]
+        block = {
+            "number": hex(block_number),
+            "hash": "0x" + os.urandom(32).hex(),
+            "parentHash": "0x" + os.urandom(32).hex(),
+            "extraData": "0x" + os.urandom(97).hex(),
+            "gasLimit": "0x1c9c380",
+            "gasUsed": "0xe4e1c0",
+            "timestamp": "0x61a8c0e0",
+            "transactions": transactions,
+        }
+        response.append({"jsonrpc": "2.0", "id": block_number, "result": block})
+    return (json.dumps(response) + "\n").encode('utf-8')
+
+
+def legacy_read(sock):
+    raw_response = b""
+    while True:
+        raw_response += sock.recv(4096)
+        if has_valid_json_rpc_ending(raw_response):
+            try:
+                return json.loads(raw_response.decode('utf-8'))
+            except ValueError:
+                continue
+
+
+def run(name, read, raw_response):
+    reader_socket, writer_socket = socket.socketpair()
+    try:
+        run_time = 0
+        for _ in range(number_of_runs):
+            writer = threading.Thread(target=writer_socket.sendall, args=(raw_response,))
+            start = time.time()
+            writer.start()
+            response = read(reader_socket)
+            run_time += time.time() - start
+            writer.join()
+            assert len(response) == number_of_blocks
+    finally:
+        reader_socket.close()
+        writer_socket.close()
+    megabytes = len(raw_response) * number_of_runs / 1024 / 1024
+    print(f"{name}: {round(run_time / number_of_runs, 4)}s per response, {round(megabytes / run_time, 1)} MB/s")
+
+
+if __name__ == '__main__':
+    raw_response = generate_response()
+    print(f"response of {round(len(raw_response) / 1024 / 1024, 2)} MB, json backend {JSON_BACKEND}")
+    reader = JsonRpcSocketReader()
+    run("recv(4096) into bytes", legacy_read, raw_response)
+    run("recv_into bytearray with frame scanning", lambda sock: reader.read(sock, timeout=10), raw_response)
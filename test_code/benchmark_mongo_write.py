@@ -0,0 +1,77 @@
+"""
+Writes the same synthetic blocks, native transfers and token transfers through KnowledgeGraphExporter
+with one write per item, with buffered bulk writes and with the write-behind wallet cache on top,
+and prints items/s for each mode.
+Needs the mongo configured in .env, the benchmark writes into it.
+"""
+
+import os
+import sys
+import time
+
+TOP_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, os.path.join(TOP_DIR, './'))
+
+from blockchainetl.jobs.exporters.knowledge_graph_exporter import KnowledgeGraphExporter
+from services.metrics_service import MONGO_SECONDS
+
+number_of_blocks = 200
+transactions_per_block = 50
+number_of_wallets = 500
+token_address = "0x" + "ab" * 20
+
+
+def generate_items(start_block):
+    for block_number in range(start_block, start_block + number_of_blocks):
+        yield {"type": "block", "number": block_number, "gas_limit": 30000000, "gas_used": 1000000}
+        for index in range(transactions_per_block):
+            from_address = "0x" + str(index % number_of_wallets).zfill(40)
+            to_address = "0x" + str((index * 7) % number_of_wallets).zfill(40)
+            wallets = [
+                {"address": from_address, "new_balance_of_concerning_token": 10, "old_balance_of_concerning_token": 11,
+                 "block_number": block_number},
+                {"address": to_address, "new_balance_of_concerning_token": 21, "old_balance_of_concerning_token": 20,
+                 "block_number": block_number},
+            ]
+            yield {"type": "transaction", "hash": "0x" + os.urandom(32).hex(), "block_number": block_number,
+                   "from_address": from_address, "to_address": to_address, "value": 1, "gas": 21000,
+                   "gas_price": 5000000000, "input": "0x", "related_wallets": wallets}
+            yield {"type": "token_transfer", "contract_address": token_address, "from_address": from_address,
+                   "to_address": to_address, "value": 1, "transaction_hash": "0x" + os.urandom(32).hex(),
+                   "log_index": index, "block_number": block_number,
+                   "related_wallets": [dict(wallet) for wallet in wallets]}
+
+
+def get_mongo_times():
+    """Seconds spent reading and writing mongo so far"""
+    read_time = write_time = 0
+    for (operation, _), child in MONGO_SECONDS.get_children():
+        if operation == 'find_one':
+            read_time += child.get()[1]
+        else:
+            write_time += child.get()[1]
+    return read_time, write_time
+
+
+def run(bulk_write, wallet_cache, start_block):
+    previous_read_time, previous_write_time = get_mongo_times()
+    exporter = KnowledgeGraphExporter(bulk_write=bulk_write, wallet_cache=wallet_cache)
+    exporter.open()
+    number_of_items = 0
+    start = time.time()
+    for item in generate_items(start_block):
+        exporter.export_item(item)
+        number_of_items += 1
+    exporter.close()
+    run_time = time.time() - start
+    read_time, write_time = get_mongo_times()
+    print(f"bulk_write={bulk_write} wallet_cache={wallet_cache}: {number_of_items} items in {round(run_time, 3)}s, "
+          f"{round(number_of_items / run_time)} items/s, "
+          f"write_mongo_time {round(write_time - previous_write_time, 3)}s, "
+          f"read_mongo_time {round(read_time - previous_read_time, 3)}s")
+
+
+if __name__ == '__main__':
+    run(bulk_write=False, wallet_cache=False, start_block=0)
+    run(bulk_write=True, wallet_cache=False, start_block=number_of_blocks)
+    run(bulk_write=True, wallet_cache=True, start_block=2 * number_of_blocks)
@@ -0,0 +1,42 @@
+"""
+Writes the synthetic items of benchmark_mongo_write with ParquetItemExporter, one partition per number_of_blocks
+blocks, and prints items/s to compare with the mongo modes of benchmark_mongo_write.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+TOP_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, os.path.join(TOP_DIR, './'))
+
+from blockchainetl.jobs.exporters.parquet_item_exporter import ParquetItemExporter
+from test_code.benchmark_mongo_write import generate_items, number_of_blocks
+
+number_of_partitions = 5
+
+
+def run(output_dir):
+    exporter = ParquetItemExporter(output_dir)
+    number_of_items = 0
+    start = time.time()
+    for partition in range(number_of_partitions):
+        start_block = partition * number_of_blocks
+        exporter.set_partition_dir(f"/start_block={str(start_block).zfill(8)}"
+                                   f"/end_block={str(start_block + number_of_blocks - 1).zfill(8)}")
+        exporter.open()
+        for item in generate_items(start_block):
+            exporter.export_item(item)
+            number_of_items += 1
+        exporter.close()
+    exporter.finish()
+    run_time = time.time() - start
+    size = sum(os.path.getsize(os.path.join(root, file)) for root, _, files in os.walk(output_dir) for file in files)
+    print(f"parquet compression={exporter.compression}: {number_of_items} items in {round(run_time, 3)}s, "
+          f"{round(number_of_items / run_time)} items/s, {round(size / 1024 / 1024, 2)} MB written")
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as output_dir:
+        run(output_dir)
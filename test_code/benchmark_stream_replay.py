@@ -0,0 +1,162 @@
+"""
+Runs the Streamer with the EthKnowledgeGraphStreamerAdapter over a block range and prints blocks/s, items/s,
+the items by type and the time of the jobs, stages and RPC methods, with the items counted instead of exported.
+
+Record the range once against a node, then replay it offline from a local server as often as needed:
+
+    python test_code/benchmark_stream_replay.py record <provider uri> <fixture.jsonl.gz> <start block> <end block>
+    python test_code/benchmark_stream_replay.py replay <fixture.jsonl.gz> <start block> <end block> [http | ipc]
+        [latency ms] [latency ms per request]
+
+The replay server runs in a process of its own so its CPU isn't taken from the pipeline. Requests missing from
+the fixture are answered with an error and counted, a replay with the same range and settings has none.
+The token metadata and the wallet filter are kept in a temp directory, no database or other service is needed.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from multiprocessing import Pipe, Process
+
+TOP_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, os.path.join(TOP_DIR, './'))
+
+import logging
+
+from blockchainetl.streaming.streamer import Streamer
+from config.config import RpcRecordConfig
+from data_storage.metrics_registry import MetricsRegistry
+from data_storage.token_metadata_registry import TokenMetadataRegistry
+from data_storage.wallet_filter_storage import WalletFilterMemoryStorage
+from ethereumetl.providers.auto import get_provider_from_uri
+from ethereumetl.providers.replay import ReplayServer, RpcFixture
+from ethereumetl.streaming.eth_knowledge_graph_streamer_adapter import EthKnowledgeGraphStreamerAdapter, \
+    get_wallet_filter_from_file
+from ethereumetl.thread_local_proxy import ThreadLocalProxy
+from services.log_services import config_log
+from services.metrics_service import JOB_SECONDS, RPC_REQUESTS, RPC_SECONDS, STAGE_SECONDS
+
+batch_size = 100
+max_workers = 8
+block_batch_size = 16
+
+
+class CountingItemExporter:
+    def __init__(self):
+        self.counts = {}
+
+    def open(self):
+        pass
+
+    def export_items(self, items):
+        for item in items:
+            self.export_item(item)
+
+    def export_item(self, item):
+        item_type = item.get('type')
+        self.counts[item_type] = self.counts.get(item_type, 0) + 1
+
+    def close(self):
+        pass
+
+
+def run_replay_server(fixture_path, transport, latency_seconds, call_latency_seconds, connection):
+    """Sends the uri served once the fixture is loaded, then the stats of the fixture when asked"""
+    replay_server = ReplayServer(RpcFixture(fixture_path), latency_seconds, call_latency_seconds)
+    if transport == 'ipc':
+        uri = replay_server.serve_ipc(os.path.join(tempfile.mkdtemp(), 'replay.ipc'))
+    else:
+        uri = replay_server.serve_http()
+    connection.send(uri)
+    connection.recv()
+    connection.send(replay_server.fixture.get_stats())
+    replay_server.close()
+
+
+def create_stores(directory):
+    """The token metadata and the wallet filter of the run, in its directory instead of data/"""
+    TokenMetadataRegistry(path=os.path.join(directory, 'token_metadata.json'))
+    wallet_filter = WalletFilterMemoryStorage(path=os.path.join(directory, 'wallet_filter.bin'))
+    # from the holders file only, built before the adapter would add the wallets of the database
+    wallet_filter.build_if_missing(get_wallet_filter_from_file)
+
+
+def stream(provider_uri, start_block, end_block):
+    directory = tempfile.mkdtemp()
+    create_stores(directory)
+    exporter = CountingItemExporter()
+    streamer_adapter = EthKnowledgeGraphStreamerAdapter(
+        provider_uri=provider_uri,
+        batch_web3_provider=ThreadLocalProxy(lambda: get_provider_from_uri(provider_uri, batch=True)),
+        item_exporter=exporter,
+        batch_size=batch_size,
+        max_workers=max_workers,
+    )
+    streamer = Streamer(
+        blockchain_streamer_adapter=streamer_adapter,
+        last_synced_block_file=os.path.join(directory, 'last_synced_block.txt'),
+        start_block=start_block,
+        end_block=end_block,
+        period_seconds=0,
+        block_batch_size=block_batch_size,
+        retry_errors=False,
+    )
+    start = time.time()
+    streamer.stream()
+    return time.time() - start, exporter.counts
+
+
+def print_report(seconds, counts, number_of_blocks):
+    items = sum(counts.values())
+    print(f"{number_of_blocks} blocks in {round(seconds, 2)}s: {round(number_of_blocks / seconds, 1)} blocks/s, "
+          f"{items} items, {round(items / seconds, 1)} items/s")
+    for item_type, count in sorted(counts.items(), key=lambda item: -item[1]):
+        print(f"  {item_type}: {count}")
+    for title, metric in (('jobs', JOB_SECONDS), ('stages', STAGE_SECONDS), ('RPC methods', RPC_SECONDS)):
+        children = sorted(((label_values, child.get()) for label_values, child in metric.get_children()),
+                          key=lambda child: -child[1][1])
+        print(title)
+        for label_values, (_, total, count) in children:
+            if not count:
+                continue
+            line = f"  {','.join(label_values)}: {round(total, 3)}s in {count} calls"
+            if metric is RPC_SECONDS:
+                line += f", {int(RPC_REQUESTS.labels(*label_values).get())} requests"
+            print(line)
+
+
+if __name__ == '__main__':
+    config_log(level=logging.WARNING)
+    MetricsRegistry.getInstance().set_enabled(True)
+    mode = sys.argv[1]
+    if mode == 'record':
+        provider_uri, fixture_path = sys.argv[2], sys.argv[3]
+        start_block, end_block = int(sys.argv[4]), int(sys.argv[5])
+        # read by get_provider_from_uri when the providers are created
+        RpcRecordConfig.RPC_RECORD_PATH = fixture_path
+        seconds, counts = stream(provider_uri, start_block, end_block)
+        print_report(seconds, counts, end_block - start_block + 1)
+    elif mode == 'replay':
+        fixture_path = sys.argv[2]
+        start_block, end_block = int(sys.argv[3]), int(sys.argv[4])
+        transport = sys.argv[5] if len(sys.argv) > 5 else 'http'
+        latency_seconds = float(sys.argv[6]) / 1000 if len(sys.argv) > 6 else 0
+        call_latency_seconds = float(sys.argv[7]) / 1000 if len(sys.argv) > 7 else 0
+
+        connection, server_connection = Pipe()
+        server = Process(target=run_replay_server, daemon=True,
+                         args=(fixture_path, transport, latency_seconds, call_latency_seconds, server_connection))
+        server.start()
+        replay_uri = connection.recv()
+        try:
+            seconds, counts = stream(replay_uri, start_block, end_block)
+        finally:
+            connection.send('stats')
+            stats = connection.recv()
+            server.join()
+        print(f"replayed from {replay_uri}, latency {latency_seconds * 1000}ms + {call_latency_seconds * 1000}ms "
+              f"per request, {stats['answered']} answered, {stats['misses']} not recorded")
+        print_report(seconds, counts, end_block - start_block + 1)
+    else:
+        raise ValueError(f"Unknown mode {mode}, record or replay")
@@ -0,0 +1,90 @@
+"""
+Compares the wallet filter kept as a dict of wallet documents, as it was loaded from Mongo, with the memory mapped
+MappedAddressSet snapshot, with and without its Bloom filter: time and memory to get the filter ready at startup,
+and lookups per second for half members, half non members.
+
+    python test_code/benchmark_wallet_filter.py [number of wallets]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+TOP_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, os.path.join(TOP_DIR, './'))
+
+from data_storage.address_set import MappedAddressSet
+
+number_of_wallets = 100000
+number_of_lookups = 200000
+
+
+def generate_wallet(address):
+    """A wallet document shaped like the ones of the wallets collection"""
+    return {
+        'address': address,
+        'balance': {'0x' + os.urandom(20).hex(): str(10 ** 20) for _ in range(3)},
+        'supply': {'0x' + os.urandom(20).hex(): str(10 ** 19)},
+        'borrow': {'0x' + os.urandom(20).hex(): str(10 ** 18)},
+        'at_block_number': 15000000,
+    }
+
+
+def measure_startup(name, load):
+    tracemalloc.start()
+    start = time.time()
+    wallet_filter = load()
+    seconds = time.time() - start
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"  {name}: ready in {round(seconds * 1000, 1)}ms, {round(memory / 1024)}KiB of Python memory")
+    return wallet_filter
+
+
+def measure_lookups(name, contains, addresses):
+    start = time.time()
+    found = sum(1 for address in addresses if contains(address))
+    seconds = time.time() - start
+    print(f"  {name}: {round(len(addresses) / seconds)} lookups/s, {found} found")
+
+
+if __name__ == '__main__':
+    wallets = int(sys.argv[1]) if len(sys.argv) > 1 else number_of_wallets
+    addresses = ['0x' + os.urandom(20).hex() for _ in range(wallets)]
+    documents = [generate_wallet(address) for address in addresses]
+    lookups = [addresses[index % wallets] if index % 2 else '0x' + os.urandom(20).hex()
+               for index in range(number_of_lookups)]
+
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, 'wallet_filter.bin')
+        bloom_path = os.path.join(directory, 'wallet_filter_bloom.bin')
+        start = time.time()
+        MappedAddressSet(path).build(addresses)
+        print(f"{wallets} wallets, snapshot of {round(os.path.getsize(path) / 1024)}KiB built in "
+              f"{round((time.time() - start) * 1000)}ms")
+        MappedAddressSet(bloom_path, bits_per_address=10).build(addresses)
+
+        def load_documents():
+            # the documents as the cursor of Mongo returned them, copied into the dict of the previous filter
+            return {document['address']: dict(document) for document in documents}
+
+        def load_snapshot(snapshot_path):
+            address_set = MappedAddressSet(snapshot_path)
+            address_set.load()
+            return address_set
+
+        wallet_dict = measure_startup('dict of wallet documents', load_documents)
+        address_set = measure_startup('MappedAddressSet', lambda: load_snapshot(path))
+        bloom_address_set = load_snapshot(bloom_path)
+        measure_lookups('dict of wallet documents', lambda address: bool(wallet_dict.get(address)), lookups)
+        measure_lookups('MappedAddressSet', address_set.contains, lookups)
+        measure_lookups('MappedAddressSet with a Bloom filter of 10 bits per address', bloom_address_set.contains,
+                        lookups)
+        address_set.close()
+        bloom_address_set.close()
+    finally:
+        shutil.rmtree(directory)
@@ -0,0 +1,52 @@
+"""
+Serves a fixture recorded with RPC_RECORD_PATH like a node would, until interrupted.
+
+    python test_code/rpc_replay_server.py fixture.jsonl.gz [http://127.0.0.1:8545 | file:///tmp/replay.ipc]
+        [latency ms] [latency ms per request]
+
+The latency is added to every request or batch, the latency per request to every request of it.
+"""
+
+import os
+import sys
+import time
+from urllib.parse import urlparse
+
+TOP_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, os.path.join(TOP_DIR, './'))
+
+import logging
+
+from ethereumetl.providers.replay import ReplayServer, RpcFixture
+from services.log_services import config_log
+
+logger = logging.getLogger('rpc_replay_server')
+
+
+def serve(replay_server, uri_string):
+    uri = urlparse(uri_string)
+    if uri.scheme == 'file':
+        return replay_server.serve_ipc(uri.path)
+    if uri.scheme == 'http':
+        return replay_server.serve_http(uri.hostname or '127.0.0.1', uri.port or 0)
+    raise ValueError(f"Unknown uri scheme {uri_string}")
+
+
+if __name__ == '__main__':
+    config_log(level=logging.INFO)
+    fixture_path = sys.argv[1]
+    uri_string = sys.argv[2] if len(sys.argv) > 2 else 'http://127.0.0.1:8545'
+    latency_seconds = float(sys.argv[3]) / 1000 if len(sys.argv) > 3 else 0
+    call_latency_seconds = float(sys.argv[4]) / 1000 if len(sys.argv) > 4 else 0
+
+    replay_server = ReplayServer(RpcFixture(fixture_path), latency_seconds, call_latency_seconds)
+    logger.info(f"Serving {fixture_path} on {serve(replay_server, uri_string)}")
+    try:
+        while True:
+            time.sleep(60)
+            logger.info(f"Replay {replay_server.fixture.get_stats()}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        replay_server.close()
+        logger.info(f"Replay {replay_server.fixture.get_stats()}")
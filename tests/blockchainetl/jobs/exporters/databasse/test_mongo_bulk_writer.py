@@ -0,0 +1,89 @@
+import time
+
+import pytest
+from pymongo import InsertOne
+from pymongo.errors import AutoReconnect, BulkWriteError
+
+from blockchainetl.jobs.exporters.databasse.mongo_bulk_writer import DUPLICATE_KEY_ERROR, MongoBulkWriter
+
+
+class FakeCollection:
+    """Keeps the requests written, fails the writes as told by fail"""
+
+    def __init__(self, name, fail=None):
+        self.name = name
+        self.fail = fail
+        self.written = []
+
+    def bulk_write(self, requests, ordered=True):
+        fail, self.fail = self.fail, None
+        if isinstance(fail, Exception):
+            raise fail
+        write_errors = []
+        for index, request in enumerate(requests):
+            code = fail(index, request) if fail else None
+            if code is None:
+                self.written.append(request)
+            else:
+                write_errors.append({'index': index, 'code': code})
+        if write_errors:
+            raise BulkWriteError({'writeErrors': write_errors})
+
+
+def create_writer(**kwargs):
+    kwargs.setdefault('max_operations', 100)
+    kwargs.setdefault('flush_interval_seconds', 3600)
+    return MongoBulkWriter(**kwargs)
+
+
+def test_failed_requests_stay_queued():
+    writer = create_writer()
+    collection = FakeCollection('blocks')
+    for number in range(3):
+        writer.insert(collection, {'number': number})
+    writer.update(collection, {'address': 'a'}, {'balance': '1'})
+
+    collection.fail = lambda index, request: 1 if index in (1, 3) else None
+    with pytest.raises(BulkWriteError):
+        writer.flush()
+    assert len(collection.written) == 2
+
+    writer.flush()
+    assert len(collection.written) == 4
+    assert isinstance(collection.written[2], InsertOne) and collection.written[2]._doc == {'number': 1}
+    assert writer.get_pending(collection, {'address': 'a'}) is None
+
+
+def test_duplicate_inserts_are_not_queued_again():
+    writer = create_writer()
+    collection = FakeCollection('blocks')
+    writer.insert(collection, {'number': 1})
+    collection.fail = lambda index, request: DUPLICATE_KEY_ERROR
+    with pytest.raises(BulkWriteError):
+        writer.flush()
+    writer.flush()
+    assert collection.written == []
+
+
+def test_collections_left_by_an_error_stay_queued():
+    writer = create_writer()
+    blocks = FakeCollection('blocks', fail=AutoReconnect('down'))
+    wallets = FakeCollection('wallets')
+    writer.insert(blocks, {'number': 1})
+    writer.replace(wallets, {'address': 'a'}, {'address': 'a', 'balance': '1'})
+    with pytest.raises(AutoReconnect):
+        writer.flush()
+    assert writer.get_pending(wallets, {'address': 'a'}) == {'address': 'a', 'balance': '1'}
+
+    writer.flush()
+    assert len(blocks.written) == 1 and len(wallets.written) == 1
+
+
+def test_operations_are_flushed_on_time():
+    writer = create_writer(flush_interval_seconds=0.05)
+    collection = FakeCollection('blocks')
+    writer.insert(collection, {'number': 1})
+    deadline = time.time() + 2
+    while not collection.written and time.time() < deadline:
+        time.sleep(0.01)
+    assert len(collection.written) == 1
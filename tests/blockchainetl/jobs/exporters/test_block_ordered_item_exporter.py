@@ -0,0 +1,33 @@
+from blockchainetl.jobs.exporters.block_ordered_item_exporter import BlockOrderedItemExporter
+
+
+class ListItemExporter:
+    def __init__(self):
+        self.items = []
+
+    def export_item(self, item):
+        self.items.append(item)
+
+
+def test_items_are_exported_in_chain_order():
+    exporter = BlockOrderedItemExporter()
+    # as the concurrent jobs would export them
+    exporter.export_items([
+        {'type': 'token'},
+        {'type': 'event', 'block_number': 2, 'log_index': 1},
+        {'type': 'token_transfer', 'block_number': 2, 'log_index': 2},
+        {'type': 'token_transfer', 'block_number': 2, 'log_index': 0},
+        {'type': 'event', 'block_number': 1, 'log_index': 0},
+        {'type': 'transaction', 'block_number': 2, 'transaction_index': 0},
+        {'type': 'block', 'number': 2},
+        {'type': 'block', 'number': 1},
+    ])
+    item_exporter = ListItemExporter()
+
+    assert exporter.export_to(item_exporter) == 8
+    assert [(item['type'], item.get('log_index')) for item in item_exporter.items] == [
+        ('block', None), ('event', 0),
+        ('block', None), ('transaction', None), ('token_transfer', 0), ('event', 1), ('token_transfer', 2),
+        ('token', None),
+    ]
+    assert exporter.export_to(item_exporter) == 0
@@ -0,0 +1,48 @@
+import os
+
+import pytest
+
+pq = pytest.importorskip('pyarrow.parquet')
+
+from blockchainetl.jobs.exporters.parquet_item_exporter import ParquetItemExporter
+from config.constant import ExportItemConstant, ExportItemTypeConstant
+
+
+def block(number):
+    return {ExportItemConstant.type: ExportItemTypeConstant.block, 'number': number, 'hash': f'0x{number:064x}'}
+
+
+def get_files(output_dir):
+    return sorted(os.path.join(root, file) for root, _, files in os.walk(output_dir) for file in files)
+
+
+def export_ranges(exporter, ranges):
+    for start_block, end_block in ranges:
+        exporter.open()
+        exporter.export_items([block(number) for number in range(start_block, end_block + 1)])
+        exporter.close()
+
+
+def test_ranges_of_a_partition_share_a_file(tmp_path):
+    exporter = ParquetItemExporter(str(tmp_path), row_group_size=4)
+    exporter.set_partition_dir('/start_block=00000000/end_block=00000019')
+    export_ranges(exporter, [(0, 4), (5, 9), (10, 19)])
+    exporter.set_partition_dir('/start_block=00000020/end_block=00000029')
+    export_ranges(exporter, [(20, 29)])
+    exporter.finish()
+
+    files = get_files(tmp_path)
+    assert len(files) == 2
+    assert pq.read_table(files[0]).column('number').to_pylist() == list(range(20))
+    assert pq.read_table(files[1]).column('number').to_pylist() == list(range(20, 30))
+
+
+def test_files_roll_at_max_file_size(tmp_path):
+    exporter = ParquetItemExporter(str(tmp_path), row_group_size=10, max_file_size=1)
+    export_ranges(exporter, [(0, 9), (10, 19), (20, 24)])
+    exporter.finish()
+
+    files = get_files(tmp_path)
+    assert len(files) == 3
+    assert [number for file in files for number in pq.read_table(file).column('number').to_pylist()] == \
+        list(range(25))
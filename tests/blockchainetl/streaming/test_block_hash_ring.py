@@ -0,0 +1,54 @@
+import pytest
+
+from blockchainetl.streaming.block_hash_ring import BlockHashRing, find_fork_block
+
+
+def block(number, chain='a', parent_chain=None):
+    return number, f'{chain}{number}', f'{parent_chain or chain}{number - 1}'
+
+
+def create_ring(tmp_path, blocks, max_size=256):
+    ring = BlockHashRing(str(tmp_path / 'hashes.json'), max_size)
+    ring.extend(blocks)
+    return ring
+
+
+@pytest.mark.parametrize('kept, blocks, expected', [
+    ([], [block(1), block(2)], None),
+    ([block(1), block(2)], [block(3), block(4)], None),
+    # the first new block doesn't extend the last kept one
+    ([block(1), block(2)], [block(3, 'b', 'b'), block(4, 'b')], 3),
+    # the new blocks don't chain with each other
+    ([block(1), block(2)], [block(3), block(4, 'b', 'b')], 4),
+    # blocks in between weren't synced, there is nothing to compare to
+    ([block(1), block(2)], [block(5, 'b', 'b')], None),
+])
+def test_find_mismatch(tmp_path, kept, blocks, expected):
+    assert create_ring(tmp_path, kept).find_mismatch(blocks) == expected
+
+
+@pytest.mark.parametrize('canonical_chains, expected', [
+    # 4 and 5 were orphaned
+    ({1: 'a', 2: 'a', 3: 'a', 4: 'b', 5: 'b'}, 3),
+    # every candidate is canonical, the block of the mismatch was the first one orphaned
+    ({1: 'a', 2: 'a', 3: 'a', 4: 'a', 5: 'a'}, 5),
+    # deeper than the candidates
+    ({1: 'b', 2: 'b', 3: 'b', 4: 'b', 5: 'b'}, None),
+])
+def test_find_fork_block(canonical_chains, expected):
+    candidates = [block(number) for number in range(1, 6)]
+    canonical_hashes = {number: f'{chain}{number}' for number, chain in canonical_chains.items()}
+    assert find_fork_block(candidates, canonical_hashes, 6) == expected
+
+
+def test_ring_is_saved_and_loaded_at_the_last_synced_block(tmp_path):
+    ring = create_ring(tmp_path, [block(number) for number in range(1, 6)], max_size=3)
+    ring.save()
+
+    loaded = BlockHashRing(ring.path, 3)
+    loaded.load(5)
+    assert loaded.get_blocks() == [block(3), block(4), block(5)]
+
+    # written for another last synced block, it doesn't describe what was exported
+    loaded.load(7)
+    assert loaded.get_blocks() == []
@@ -0,0 +1,112 @@
+import pytest
+
+from blockchainetl.streaming.streamer import Streamer, read_last_synced_block
+
+
+def block(number, chain='a'):
+    # the chains split after block 3
+    def get_hash(hash_number):
+        return f"{chain if hash_number > 3 else 'a'}{hash_number}"
+
+    return number, get_hash(number), get_hash(number - 1)
+
+
+class FakeNodeAdapter:
+    """Exports the blocks of the chain of the node, which can be switched to another one"""
+
+    def __init__(self, head):
+        self.head = head
+        self.chain = 'a'
+        self.exported = []
+        self.rollbacks = []
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def get_current_block_number(self):
+        return self.head
+
+    def export_all(self, start_block, end_block):
+        self.exported = [block(number, self.chain) for number in range(start_block, end_block + 1)]
+
+    def get_exported_blocks(self):
+        exported, self.exported = self.exported, []
+        return exported
+
+    def get_block_hashes(self, block_numbers):
+        return {number: block(number, self.chain)[1] for number in block_numbers}
+
+    def rollback(self, start_block, end_block):
+        self.rollbacks.append((start_block, end_block))
+
+
+def create_streamer(tmp_path, adapter, reorg_depth=10):
+    return Streamer(blockchain_streamer_adapter=adapter,
+                    last_synced_block_file=str(tmp_path / 'last_synced_block.txt'),
+                    start_block=1, period_seconds=0, block_batch_size=5, reorg_depth=reorg_depth)
+
+
+def test_check_reorg_without_reorg(tmp_path):
+    adapter = FakeNodeAdapter(head=5)
+    streamer = create_streamer(tmp_path, adapter)
+    adapter.export_all(1, 5)
+
+    assert streamer._check_reorg(5) == 5
+    assert adapter.rollbacks == []
+    assert streamer.block_hash_ring.get_blocks() == [block(number) for number in range(1, 6)]
+
+
+def test_check_reorg_rolls_back_to_the_fork(tmp_path):
+    adapter = FakeNodeAdapter(head=5)
+    streamer = create_streamer(tmp_path, adapter)
+    adapter.export_all(1, 5)
+    streamer._check_reorg(5)
+
+    adapter.chain = 'b'
+    adapter.export_all(6, 8)
+
+    assert streamer._check_reorg(8) == 3
+    assert adapter.rollbacks == [(4, 8)]
+    assert streamer.block_hash_ring.get_blocks() == [block(number) for number in range(1, 4)]
+
+
+def test_check_reorg_deeper_than_the_ring(tmp_path):
+    adapter = FakeNodeAdapter(head=5)
+    streamer = create_streamer(tmp_path, adapter, reorg_depth=2)
+    adapter.export_all(1, 5)
+    streamer._check_reorg(5)
+
+    adapter.chain = 'b'
+    adapter.export_all(6, 8)
+
+    with pytest.raises(ValueError):
+        streamer._check_reorg(8)
+    assert adapter.rollbacks == []
+
+
+def test_sync_cycle_after_a_reorg_exports_the_canonical_blocks_again(tmp_path):
+    adapter = FakeNodeAdapter(head=5)
+    streamer = create_streamer(tmp_path, adapter)
+    streamer._sync_cycle()
+
+    adapter.chain = 'b'
+    adapter.head = 8
+    streamer._sync_cycle()
+    assert streamer.last_synced_block == 3
+    assert read_last_synced_block(streamer.last_synced_block_file) == 3
+
+    streamer._sync_cycle()
+    assert streamer.last_synced_block == 8
+    assert adapter.rollbacks == [(4, 8)]
+    assert streamer.block_hash_ring.get_blocks()[-1] == block(8, 'b')
+
+
+def test_adapter_without_rollback_isnt_checked(tmp_path):
+    class ExportOnlyAdapter:
+        pass
+
+    streamer = create_streamer(tmp_path, ExportOnlyAdapter())
+    assert streamer.block_hash_ring is None
@@ -0,0 +1,47 @@
+import multiprocessing
+import os
+
+from data_storage.address_set import MappedAddressSet
+
+
+def address(number):
+    return '0x' + f'{number:040x}'
+
+
+def add_addresses(path, numbers):
+    address_set = MappedAddressSet(path, max_journal=7)
+    address_set.load()
+    for number in numbers:
+        address_set.add(address(number))
+
+
+def test_build_if_missing_builds_once(tmp_path):
+    path = str(tmp_path / 'filter.bin')
+    built = []
+
+    def get_addresses():
+        built.append(True)
+        return [address(1), address(2)]
+
+    assert MappedAddressSet(path).build_if_missing(get_addresses)
+    address_set = MappedAddressSet(path)
+    assert not address_set.build_if_missing(get_addresses)
+    assert len(built) == 1
+    assert address_set.contains(address(2)) and not address_set.contains(address(3))
+
+
+def test_processes_sharing_the_journal_lose_no_address(tmp_path):
+    path = str(tmp_path / 'filter.bin')
+    MappedAddressSet(path).build([address(0)])
+    context = multiprocessing.get_context('spawn')
+    processes = [context.Process(target=add_addresses, args=(path, range(start, 200, 4))) for start in range(4)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+        assert process.exitcode == 0
+
+    address_set = MappedAddressSet(path)
+    address_set.load()
+    assert all(address_set.contains(address(number)) for number in range(200))
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.tmp')]
@@ -0,0 +1,135 @@
+import pytest
+
+from data_storage.balance_ledger import BalanceLedger
+
+TOKEN = '0x' + '11' * 20
+ALICE = '0x' + 'aa' * 20
+BOB = '0x' + 'bb' * 20
+
+
+class FakeNode:
+    """Answers balance lookups from a function of (address, block) and keeps the lookups asked"""
+
+    def __init__(self, get_balance):
+        self.get_balance = get_balance
+        self.lookups = []
+
+    def get_balances(self, lookups):
+        self.lookups.extend(lookups)
+        return {(token_address, address, block): self.get_balance(address, block)
+                for token_address, address, block in lookups}
+
+
+def create_ledger(**kwargs):
+    # a new singleton for every test
+    BalanceLedger._BalanceLedger__instance = None
+    return BalanceLedger(**kwargs)
+
+
+def transfer(value, block_number, needed=True):
+    return TOKEN, ALICE, BOB, value, block_number, needed
+
+
+@pytest.fixture(autouse=True)
+def reset_ledger():
+    yield
+    BalanceLedger._BalanceLedger__instance = None
+
+
+def test_pre_balances_are_derived_in_log_order():
+    ledger = create_ledger(check_sample_rate=0)
+    node = FakeNode(lambda address, block: 100 if address == ALICE else 0)
+
+    pre_balances = ledger.get_pre_balances([transfer(10, 15), transfer(5, 15), transfer(1, 17)], 10, 19,
+                                           node.get_balances)
+
+    assert pre_balances == [(100, 0), (90, 10), (85, 15)]
+    assert sorted(node.lookups) == [(TOKEN, ALICE, 14), (TOKEN, BOB, 14)]
+    assert ledger.get_balance(ALICE, TOKEN, 19) == 84
+    assert ledger.get_balance(BOB, TOKEN, 19) == 16
+
+
+def test_ranges_out_of_order():
+    ledger = create_ledger(check_sample_rate=0)
+    node = FakeNode(lambda address, block: 100 if address == ALICE else 50)
+
+    assert ledger.get_pre_balances([transfer(10, 25)], 20, 29, node.get_balances) == [(100, 50)]
+
+    # the balances known at 29 are no use before 10, they are read again and the later ones are kept
+    node.lookups = []
+    assert ledger.get_pre_balances([transfer(5, 15)], 10, 19, node.get_balances) == [(100, 50)]
+    assert sorted(node.lookups) == [(TOKEN, ALICE, 14), (TOKEN, BOB, 14)]
+    assert ledger.get_balance(ALICE, TOKEN, 29) == 90
+
+    node.lookups = []
+    assert ledger.get_pre_balances([transfer(1, 35)], 30, 39, node.get_balances) == [(90, 60)]
+    assert node.lookups == []
+
+
+def test_range_after_a_gap_is_read_from_the_node():
+    ledger = create_ledger(check_sample_rate=0)
+    node = FakeNode(lambda address, block: 100 if address == ALICE else 0)
+
+    ledger.get_pre_balances([transfer(10, 15)], 10, 19, node.get_balances)
+    node.lookups = []
+    # 20-29 wasn't applied, the balances known at 19 may be outdated
+    assert ledger.get_pre_balances([transfer(1, 35)], 30, 39, node.get_balances) == [(100, 0)]
+    assert sorted(node.lookups) == [(TOKEN, ALICE, 34), (TOKEN, BOB, 34)]
+
+    # once the gap is applied the ranges are merged and the next range is derived
+    ledger.get_pre_balances([], 20, 29, node.get_balances)
+    node.lookups = []
+    assert ledger.get_pre_balances([transfer(1, 45)], 40, 49, node.get_balances) == [(99, 1)]
+    assert node.lookups == []
+
+
+def test_balances_read_too_long_ago_are_reconciled():
+    ledger = create_ledger(reconcile_blocks=10, check_sample_rate=0)
+    # the balance of alice drops at block 30 without a transfer, like interest or a rebase would
+    node = FakeNode(lambda address, block: (100 if block < 30 else 70) if address == ALICE else 10 * (block > 15))
+
+    assert ledger.get_pre_balances([transfer(10, 15)], 10, 19, node.get_balances) == [(100, 0)]
+    node.lookups = []
+    assert ledger.get_pre_balances([transfer(10, 25)], 20, 29, node.get_balances) == [(90, 10)]
+    assert node.lookups == []
+
+    # read at 14, more than 10 blocks before 30
+    assert ledger.get_pre_balances([transfer(10, 35)], 30, 39, node.get_balances) == [(70, 10)]
+    assert sorted(node.lookups) == [(TOKEN, ALICE, 34), (TOKEN, BOB, 34)]
+    stats = ledger.get_stats()
+    assert stats['fetched'] == 4
+    assert stats['derived'] == 2
+    assert stats['checked'] == 2
+    assert stats['mismatches'] == 2
+    assert ledger.get_balance(ALICE, TOKEN, 39) == 60
+
+
+def test_sampled_balances_are_checked_against_the_node():
+    ledger = create_ledger(check_sample_rate=1)
+    balances = {ALICE: 100, BOB: 0}
+    node = FakeNode(lambda address, block: balances[address])
+
+    ledger.get_pre_balances([transfer(10, 15)], 10, 19, node.get_balances)
+    balances.update({ALICE: 90, BOB: 10})
+    node.lookups = []
+    assert ledger.get_pre_balances([transfer(10, 25)], 20, 29, node.get_balances) == [(90, 10)]
+    assert sorted(node.lookups) == [(TOKEN, ALICE, 24), (TOKEN, BOB, 24)]
+    assert ledger.get_stats()['checked'] == 2
+    assert ledger.get_stats()['mismatches'] == 0
+
+    # the node disagrees, the mismatch is counted and the ledger balance is still used
+    balances.update({ALICE: 1, BOB: 20})
+    assert ledger.get_pre_balances([transfer(10, 35)], 30, 39, node.get_balances) == [(80, 20)]
+    assert ledger.get_stats()['checked'] == 4
+    assert ledger.get_stats()['mismatches'] == 1
+
+
+def test_transfers_not_needed_are_applied_without_lookups():
+    ledger = create_ledger(check_sample_rate=0)
+    node = FakeNode(lambda address, block: 100 if address == ALICE else 0)
+
+    pre_balances = ledger.get_pre_balances([transfer(10, 15, needed=False)], 10, 19, node.get_balances)
+
+    assert pre_balances == [(None, None)]
+    assert node.lookups == []
+    assert ledger.get_balance(ALICE, TOKEN, 19) is None
@@ -0,0 +1,40 @@
+from data_storage.wallet_state_cache import WalletStateCache
+
+ALICE = '0x' + 'aa' * 20
+TOKEN = '0x' + '11' * 20
+
+
+class FakeDatabase:
+    def __init__(self):
+        self.wallets = {}
+
+    def find_wallet(self, address):
+        wallet = self.wallets.get(address)
+        return dict(wallet) if wallet else None
+
+    def replace_wallets(self, wallets):
+        for wallet in wallets:
+            self.wallets[wallet['address']] = dict(wallet)
+
+
+def test_wallet_at_a_new_block_is_written_back():
+    database = FakeDatabase()
+    cache = WalletStateCache(database)
+    cache.update(ALICE, TOKEN, '10', block_number=1)
+    cache.flush()
+
+    cache.update(ALICE, TOKEN, '10', block_number=2)
+    cache.flush()
+    assert database.wallets[ALICE]['at_block_number'] == 2
+
+
+def test_unchanged_wallet_is_not_written_back():
+    database = FakeDatabase()
+    cache = WalletStateCache(database)
+    cache.update(ALICE, TOKEN, '10', block_number=1)
+    cache.flush()
+    database.wallets = {}
+
+    cache.update(ALICE, TOKEN, '10', block_number=1)
+    cache.flush()
+    assert database.wallets == {}
@@ -0,0 +1,80 @@
+import pytest
+
+from data_storage.token_metadata_registry import TokenMetadataRegistry
+from ethereumetl.jobs import token_metadata_refresher
+from ethereumetl.jobs.token_metadata_refresher import TokenMetadataRefresher
+
+REFRESH_SECONDS = 86400
+
+
+class StopRefreshing(BaseException):
+    # not an Exception, which the refresher catches and retries
+    pass
+
+
+class NothingRefreshedJob:
+    """A tokens job whose tokens are all unknown to the node, the registry isn't refreshed"""
+
+    runs = 0
+
+    def __init__(self, item_exporter):
+        pass
+
+    def run(self):
+        NothingRefreshedJob.runs += 1
+
+
+@pytest.fixture
+def registry(tmp_path):
+    TokenMetadataRegistry._TokenMetadataRegistry__instance = None
+    yield TokenMetadataRegistry(path=str(tmp_path / 'token_metadata.json'), refresh_seconds=REFRESH_SECONDS)
+    TokenMetadataRegistry._TokenMetadataRegistry__instance = None
+
+
+def test_refresh_of_no_token_waits_refresh_seconds(registry, monkeypatch):
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        if len(sleeps) >= 4:
+            raise StopRefreshing()
+
+    monkeypatch.setattr(token_metadata_refresher.time, 'sleep', sleep)
+    NothingRefreshedJob.runs = 0
+    refresher = TokenMetadataRefresher(registry)
+    refresher._create_job = NothingRefreshedJob
+    with pytest.raises(StopRefreshing):
+        refresher._run()
+    assert NothingRefreshedJob.runs == 2
+    assert sleeps == [0, REFRESH_SECONDS, 0, REFRESH_SECONDS]
+
+
+def test_export_of_unknown_tokens_records_the_refresh(registry):
+    export_tokens_job = pytest.importorskip('ethereumetl.jobs.export_tokens_job', exc_type=ImportError)
+
+    class NoMetadataTokenService:
+        def get_tokens_metadata(self, token_addresses):
+            return {token_address: (None, None, None) for token_address in token_addresses}
+
+        def get_total_supplies(self, token_addresses):
+            raise AssertionError("no token is known")
+
+    for token_addresses in ([], ['0x' + '11' * 20]):
+        registry.refreshed_at = 0
+        job = export_tokens_job.ExportTokensJob(web3=None, item_exporter=_NoopItemExporter(),
+                                                token_addresses_iterable=token_addresses, max_workers=1,
+                                                ethTokenService=NoMetadataTokenService(),
+                                                token_metadata_registry=registry)
+        job.run()
+        assert registry.get_seconds_to_refresh() > 0
+
+
+class _NoopItemExporter:
+    def open(self):
+        pass
+
+    def export_item(self, item):
+        pass
+
+    def close(self):
+        pass
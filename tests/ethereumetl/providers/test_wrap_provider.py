@@ -0,0 +1,49 @@
+import pytest
+
+# web3 is needed by the providers
+auto = pytest.importorskip('ethereumetl.providers.auto', exc_type=ImportError)
+
+from ethereumetl.providers.limited import LimitedBatchProvider, LimitedProvider
+from ethereumetl.providers.metered import MeteredBatchProvider, MeteredProvider
+from ethereumetl.providers.recording import RecordingBatchProvider, RecordingProvider
+
+WRAPPERS = [(MeteredProvider, MeteredBatchProvider), (LimitedProvider, LimitedBatchProvider)]
+
+
+class SingleProvider:
+    def make_request(self, method, params):
+        return {'result': method}
+
+    def isConnected(self):
+        return True
+
+
+class BatchProvider(SingleProvider):
+    def make_batch_request(self, text):
+        return [{'result': text}]
+
+
+@pytest.mark.parametrize('provider_class, batch_provider_class', WRAPPERS)
+class Recorder:
+    def __init__(self):
+        self.records = []
+
+    def record(self, method, params, response):
+        self.records.append((method, params, response))
+
+
+def test_only_a_batch_provider_is_wrapped_for_batches(provider_class, batch_provider_class):
+    provider = auto.wrap_provider(SingleProvider(), provider_class, batch_provider_class)
+    assert not hasattr(provider, 'make_batch_request')
+    assert provider.make_request('eth_blockNumber', []) == {'result': 'eth_blockNumber'}
+
+    batch_provider = auto.wrap_provider(BatchProvider(), provider_class, batch_provider_class)
+    assert batch_provider.make_batch_request('[{"method": "eth_call"}]') == [{'result': '[{"method": "eth_call"}]'}]
+
+
+def test_recording_passes_the_recorder():
+    recorder = Recorder()
+    provider = auto.wrap_provider(SingleProvider(), RecordingProvider, RecordingBatchProvider, recorder)
+    assert not hasattr(provider, 'make_batch_request')
+    provider.make_request('eth_blockNumber', [])
+    assert recorder.records == [('eth_blockNumber', [], {'result': 'eth_blockNumber'})]
@@ -0,0 +1,72 @@
+import json
+import re
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+if orjson is not None:
+    JSON_BACKEND = 'orjson'
+elif ujson is not None:
+    JSON_BACKEND = 'ujson'
+else:
+    JSON_BACKEND = 'json'
+
+# everything up to the next bracket or unterminated string: runs of plain characters and complete strings
+_SKIP_PATTERN = re.compile(rb'(?:[^\[\]{}"]+|"[^"\\]*(?:\\.[^"\\]*)*")*', re.S)
+_OPENING_BRACKETS = (ord('{'), ord('['))
+_QUOTE = ord('"')
+
+
+def json_loads(raw):
+    """Parses bytes, bytearray or str with orjson or ujson when one of them is installed"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    if ujson is not None:
+        return ujson.loads(bytes(raw) if isinstance(raw, bytearray) else raw)
+    return json.loads(raw)
+
+
+class JsonFrameScanner(object):
+    """Finds where a JSON object or array streamed in chunks ends without parsing it.
+
+    Call scan with the buffer every time it grows; only the bytes that weren't scanned yet are looked at,
+    except for a string cut at the end of the buffer, which is scanned again from its opening quote.
+    """
+
+    def __init__(self):
+        self.position = 0
+        self.depth = 0
+
+    def reset(self):
+        self.position = 0
+        self.depth = 0
+
+    def scan(self, buffer, end=None):
+        """Returns the end offset of the first complete top level value, None if it wasn't received yet"""
+        if end is None:
+            end = len(buffer)
+        position = self.position
+        depth = self.depth
+        while True:
+            position = _SKIP_PATTERN.match(buffer, position, end).end()
+            if position >= end or buffer[position] == _QUOTE:
+                # end of the buffer or a string that isn't complete yet
+                self.position = position
+                self.depth = depth
+                return None
+            if buffer[position] in _OPENING_BRACKETS:
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    self.position = position + 1
+                    self.depth = depth
+                    return position + 1
+            position += 1
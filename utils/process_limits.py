@@ -0,0 +1,26 @@
+from contextlib import contextmanager
+
+RPC = 'rpc'
+MONGO = 'mongo'
+
+# semaphores shared by the processes of a pool, set in every process by the pool initializer
+_limits = {}
+
+
+def set_process_limits(limits):
+    """limits maps RPC or MONGO to a multiprocessing semaphore, nothing is limited before"""
+    _limits.update(limits)
+
+
+def has_process_limit(name):
+    return _limits.get(name) is not None
+
+
+@contextmanager
+def process_limit(name):
+    semaphore = _limits.get(name)
+    if semaphore is None:
+        yield
+        return
+    with semaphore:
+        yield
@@ -0,0 +1,37 @@
+import functools
+import os
+
+from utils.json_utils import json_loads
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+
+def get_root_path(path):
+    """A relative path is taken from the root of the project rather than from the working directory"""
+    return os.path.join(ROOT_DIR, path)
+
+
+@functools.lru_cache(maxsize=None)
+def load_json_resource(relative_path):
+    """Parses a JSON file of the project, relative to its root, the first time it's asked for.
+
+    Later calls return the same object, callers must not change it.
+    """
+    with open(os.path.join(ROOT_DIR, relative_path), 'rb') as resource_file:
+        return json_loads(resource_file.read())
+
+
+def lazy_attributes(module_name, loaders):
+    """A module __getattr__ resolving the names of loaders on first access, see PEP 562.
+
+    Keeps `from module import NAME` working for tables moved to resource files, only the modules importing the
+    name pay for loading it.
+    """
+
+    def __getattr__(name):
+        loader = loaders.get(name)
+        if loader is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        return loader()
+
+    return __getattr__